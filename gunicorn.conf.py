@@ -0,0 +1,28 @@
+"""
+Настройки gunicorn, которые он читает из текущего каталога.
+
+Хуки обслуживают каталог PROMETHEUS_MULTIPROC_DIR, через который воркеры
+передают метрики эндпоинту /metrics (см. task_manager.metrics).
+"""
+import os
+import shutil
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MULTIPROCESS_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+
+
+def on_starting(server) -> None:
+    """Очищает метрики прошлого запуска перед стартом воркеров."""
+    if MULTIPROCESS_DIR:
+        shutil.rmtree(MULTIPROCESS_DIR, ignore_errors=True)
+        os.makedirs(MULTIPROCESS_DIR, exist_ok=True)
+
+
+def child_exit(server, worker) -> None:
+    """Удаляет файлы завершившегося воркера, не относящиеся к счетчикам."""
+    if MULTIPROCESS_DIR:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
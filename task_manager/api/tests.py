@@ -0,0 +1,227 @@
+import base64
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+
+User = get_user_model()
+
+
+class BaseApiTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            first_name='Test',
+            last_name='User',
+            username='testuser',
+            password='password123'
+        )
+        self.client.force_login(self.user)
+        self.status = Status.objects.create(name='New')
+        self.label = Label.objects.create(name='bug')
+
+
+class ApiAuthTest(TestCase):
+    def test_anonymous_gets_401(self):
+        response = self.client.get(reverse('api_tasks'))
+        self.assertEqual(response.status_code, 401)
+
+    def test_write_methods_are_not_allowed(self):
+        user = User.objects.create_user(username='user', password='pass')
+        self.client.force_login(user)
+        response = self.client.post(reverse('api_tasks'))
+        self.assertEqual(response.status_code, 405)
+
+
+class TaskApiTest(BaseApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tasks = []
+        for index in range(3):
+            task = Task.objects.create(
+                name=f'Task {index}', description='', status=self.status,
+                author=self.user, executor=self.user if index else None,
+            )
+            self.tasks.append(task)
+        self.tasks[0].labels.add(self.label)
+
+    def test_list_returns_all_fields(self):
+        response = self.client.get(reverse('api_tasks'))
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([row['name'] for row in results],
+                         ['Task 0', 'Task 1', 'Task 2'])
+        self.assertEqual(results[0]['labels'], ['bug'])
+        self.assertEqual(results[0]['status'], 'New')
+        self.assertIsNone(results[0]['executor'])
+        self.assertEqual(results[1]['executor'], 'testuser')
+
+    def test_sparse_fields(self):
+        # Сессия, пользователь, валидаторы четырех моделей и задачи без
+        # соединений и запроса меток
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('api_tasks'),
+                                       {'fields': 'id,name'})
+        results = response.json()['results']
+        self.assertEqual(set(results[0]), {'id', 'name'})
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(reverse('api_tasks'),
+                                   {'fields': 'name,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('fields', response.json()['detail'])
+
+    def test_filters(self):
+        response = self.client.get(reverse('api_tasks'),
+                                   {'labels': self.label.pk})
+        names = [row['name'] for row in response.json()['results']]
+        self.assertEqual(names, ['Task 0'])
+
+    def test_invalid_filter_is_rejected(self):
+        response = self.client.get(reverse('api_tasks'), {'status': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pagination(self):
+        response = self.client.get(reverse('api_tasks'), {'limit': 2})
+        data = response.json()
+        self.assertEqual(len(data['results']), 2)
+        self.assertIsNone(data['previous'])
+        data = self.client.get(data['next']).json()
+        self.assertEqual([row['name'] for row in data['results']],
+                         ['Task 2'])
+        self.assertIsNone(data['next'])
+        data = self.client.get(data['previous']).json()
+        self.assertEqual([row['name'] for row in data['results']],
+                         ['Task 0', 'Task 1'])
+
+    def test_tampered_cursor_returns_first_page(self):
+        for raw in (b'["next",["x","abc"]]', b'[[1],[2]]'):
+            cursor = base64.urlsafe_b64encode(raw).decode()
+            response = self.client.get(reverse('api_tasks'),
+                                       {'limit': 2, 'cursor': cursor})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [row['name'] for row in response.json()['results']],
+                ['Task 0', 'Task 1']
+            )
+
+    def test_detail(self):
+        response = self.client.get(
+            reverse('api_task', args=[self.tasks[0].pk]), {'fields': 'labels'}
+        )
+        self.assertEqual(response.json(), {'labels': ['bug']})
+        response = self.client.get(reverse('api_task', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ConditionalApiTest(BaseApiTestCase):
+    def test_unchanged_data_returns_304_after_one_aggregate(self):
+        url = reverse('api_statuses')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+        self.assertIn('Last-Modified', response)
+        # Сессия, пользователь и число строк с Max(updated_at) статусов
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_change_invalidates_etag(self):
+        url = reverse('api_statuses')
+        etag = self.client.get(url)['ETag']
+        Status.objects.create(name='Done')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_write_without_local_invalidation_changes_etag(self):
+        # UPDATE без сигналов, как запись из другого процесса
+        url = reverse('api_statuses')
+        etag = self.client.get(url)['ETag']
+        Status.objects.filter(pk=self.status.pk).update(
+            name='Renamed', updated_at=timezone.now()
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['name'], 'Renamed')
+
+    def test_etag_depends_on_query(self):
+        url = reverse('api_statuses')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, {'fields': 'name'},
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class UserApiTest(BaseApiTestCase):
+    def test_credentials_are_not_exposed(self):
+        response = self.client.get(reverse('api_users'))
+        row = response.json()['results'][0]
+        self.assertEqual(row['username'], 'testuser')
+        self.assertNotIn('password', row)
+        response = self.client.get(reverse('api_users'),
+                                   {'fields': 'password'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ChoiceApiTest(BaseApiTestCase):
+    def test_pages_of_choices(self):
+        other = User.objects.create_user(username='other', password='pass')
+        url = reverse('api_choices', args=['users'])
+        data = self.client.get(url, {'limit': 1}).json()
+        self.assertEqual(data['results'],
+                         [{'id': self.user.pk, 'text': 'Test User'}])
+        data = self.client.get(data['next']).json()
+        self.assertEqual(data['results'],
+                         [{'id': other.pk, 'text': 'other'}])
+        self.assertIsNone(data['next'])
+
+    def test_unknown_choices_return_404(self):
+        response = self.client.get(reverse('api_choices', args=['tasks']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_unchanged_choices_return_304(self):
+        url = reverse('api_choices', args=['statuses'])
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        Status.objects.create(name='Done')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class AutocompleteApiTest(BaseApiTestCase):
+    def search(self, name, query, **params):
+        response = self.client.get(reverse('api_autocomplete', args=[name]),
+                                   {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [result['text'] for result in response.json()['results']]
+
+    def test_users_match_any_name_field_by_prefix(self):
+        User.objects.create_user(username='anna', password='pass')
+        User.objects.create_user(username='bob', first_name='Annette',
+                                 last_name='Smith', password='pass')
+        User.objects.create_user(username='carl', last_name='Annenkov',
+                                 password='pass')
+        User.objects.create_user(username='dan', first_name='Joanna',
+                                 password='pass')
+        self.assertEqual(self.search('users', 'ANN'),
+                         ['anna', 'Annenkov', 'Annette Smith'])
+        self.assertEqual(self.search('users', 'ann', limit=1), ['anna'])
+
+    def test_labels_and_special_characters(self):
+        Label.objects.create(name='bugfix')
+        Label.objects.create(name='b_g')
+        self.assertEqual(self.search('labels', 'bu'), ['bug', 'bugfix'])
+        self.assertEqual(self.search('labels', 'b_'), ['b_g'])
+        self.assertEqual(self.search('labels', ''), [])
+
+    def test_unknown_source_returns_404(self):
+        response = self.client.get(
+            reverse('api_autocomplete', args=['statuses']), {'q': 'n'}
+        )
+        self.assertEqual(response.status_code, 404)
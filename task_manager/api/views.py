@@ -0,0 +1,653 @@
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import condition
+from django.views.generic import View
+
+from task_manager.autocomplete import (AUTOCOMPLETE_LIMIT,
+                                       AUTOCOMPLETE_SOURCES,
+                                       MAX_AUTOCOMPLETE_LIMIT,
+                                       search_prefix)
+from task_manager.base_views import (Validator,
+                                     format_validators,
+                                     get_last_modified,
+                                     get_model_validators)
+from task_manager.choices import get_choice_model
+from task_manager.labels.models import Label
+from task_manager.pagination import CursorPaginator
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TaskFilterForm
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import get_search_ordering
+
+User = get_user_model()
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class ApiError(Exception):
+    """Ошибка в параметрах запроса к API, возвращается с кодом 400."""
+
+    def __init__(self, detail: Any) -> None:
+        """
+        Args:
+            detail: Описание ошибки для ответа клиенту.
+        """
+        super().__init__(detail)
+        self.detail = detail
+
+
+class BaseApiView(LoginRequiredMixin, View, ABC):
+    """
+    Базовое представление JSON API только для чтения.
+
+    Поля ответа описываются словарем api_fields: имя поля в ответе ->
+    путь для QuerySet.values(). Клиент может запросить часть полей
+    параметром ?fields=id,name, тогда из базы выбираются только нужные
+    столбцы и соединения.
+
+    Ответ снабжается сильным ETag и заголовком Last-Modified. Оба
+    вычисляются, как у страниц (ConditionalGetMixin), по числу строк и
+    Max(updated_at) моделей ответа: один агрегатный запрос на модель
+    вместо выборки данных. Значения берутся из базы, а не из локального
+    кэша процесса, поэтому запись, выполненная другим процессом,
+    сразу меняет ETag.
+    """
+
+    model: type = None
+    api_fields: Dict[str, str] = {}
+    # Модели, от данных которых зависит ответ
+    dependencies: Tuple[str, ...] = ()
+    _validators: Optional[List[Validator]] = None
+    fields_kwarg = 'fields'
+    http_method_names = ['get', 'head', 'options']
+
+    def handle_no_permission(self) -> JsonResponse:
+        """
+        Возвращает ошибку 401 вместо перенаправления на страницу входа.
+
+        Returns:
+            JsonResponse: Ответ с описанием ошибки.
+        """
+        return JsonResponse(
+            {'detail': str(_('Authentication required'))}, status=401
+        )
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+        """
+        Обрабатывает GET-запрос с поддержкой условных заголовков.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: JSON-ответ, 304 или ответ с ошибкой 400.
+        """
+        view = condition(
+            etag_func=self.get_etag,
+            last_modified_func=self.get_last_modified,
+        )(self.render_response)
+        return view(request, *args, **kwargs)
+
+    def render_response(self, request: HttpRequest, *args: Any,
+                        **kwargs: Any) -> HttpResponse:
+        """
+        Формирует тело ответа.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: JSON-ответ или ответ с ошибкой 400.
+        """
+        try:
+            data = self.get_data(**kwargs)
+        except ApiError as error:
+            return JsonResponse({'detail': error.detail}, status=400)
+        if data is None:
+            return JsonResponse({'detail': str(_('Not found'))}, status=404)
+        return JsonResponse(data)
+
+    @abstractmethod
+    def get_data(self, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает данные ответа.
+
+        Args:
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные или None, если объект не найден.
+        """
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Возвращает исходный QuerySet объектов API.
+
+        Returns:
+            QuerySet: QuerySet модели.
+        """
+        return self.model.objects.all()
+
+    def get_selected_fields(self) -> List[str]:
+        """
+        Возвращает поля, запрошенные параметром fields.
+
+        Returns:
+            List[str]: Имена полей ответа.
+
+        Raises:
+            ApiError: Если запрошено неизвестное поле.
+        """
+        raw = self.request.GET.get(self.fields_kwarg)
+        if not raw:
+            return list(self.api_fields)
+        names = list(dict.fromkeys(
+            name.strip() for name in raw.split(',') if name.strip()
+        ))
+        unknown = [name for name in names if name not in self.api_fields]
+        if unknown:
+            raise ApiError({self.fields_kwarg: [
+                str(_('Unknown field: %(field)s') % {'field': name})
+                for name in unknown
+            ]})
+        return names
+
+    def select_values(self, queryset: QuerySet, fields: Sequence[str],
+                      extra: Sequence[str] = ()) -> QuerySet:
+        """
+        Ограничивает выборку столбцами запрошенных полей.
+
+        Args:
+            queryset: Исходный QuerySet.
+            fields: Запрошенные поля ответа.
+            extra: Дополнительные столбцы (например, ключ пагинации).
+
+        Returns:
+            QuerySet: QuerySet словарей.
+        """
+        paths = {self.api_fields[name] for name in fields
+                 if self.api_fields[name]}
+        return queryset.values(*paths.union(extra))
+
+    def serialize(self, rows: List[Dict[str, Any]],
+                  fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Преобразует строки QuerySet.values() в объекты ответа.
+
+        Args:
+            rows: Строки из базы.
+            fields: Запрошенные поля ответа.
+
+        Returns:
+            List[Dict[str, Any]]: Объекты с запрошенными полями.
+        """
+        return [
+            {name: row[self.api_fields[name]] for name in fields}
+            for row in rows
+        ]
+
+    def get_validators(self) -> List[Validator]:
+        """
+        Возвращает число строк и время изменения моделей ответа.
+
+        Returns:
+            List[Validator]: Пары (count, updated_at) для dependencies или
+                модели представления.
+        """
+        if self._validators is None:
+            models = ([apps.get_model(label) for label in self.dependencies]
+                      or [self.model])
+            self._validators = get_model_validators(models)
+        return self._validators
+
+    def get_etag(self, request: HttpRequest, *args: Any,
+                 **kwargs: Any) -> str:
+        """
+        Вычисляет ETag ответа.
+
+        Учитывает данные моделей, путь, параметры запроса и пользователя
+        (фильтр self_tasks зависит от него).
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            str: Значение ETag без кавычек.
+        """
+        stamps = format_validators(self.get_validators())
+        query = request.GET.urlencode()
+        return hashlib.md5(
+            f'{stamps}|{request.path}|{query}|{request.user.pk}'.encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def get_last_modified(self, request: HttpRequest, *args: Any,
+                          **kwargs: Any) -> Optional[datetime]:
+        """
+        Возвращает время последнего изменения данных ответа.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Optional[datetime]: Наибольший updated_at или None, если
+                таблицы пусты.
+        """
+        return get_last_modified(self.get_validators())
+
+
+class BaseApiListView(BaseApiView):
+    """
+    Список объектов с курсорной пагинацией.
+
+    Ответ имеет вид {"results": [...], "next": url, "previous": url}.
+    Размер страницы задается параметром ?limit= (не больше MAX_PAGE_SIZE).
+    """
+
+    ordering: Tuple[str, ...] = ('created_at', 'id')
+    cursor_kwarg = 'cursor'
+    limit_kwarg = 'limit'
+
+    def get_limit(self) -> int:
+        """
+        Возвращает размер страницы из параметра limit.
+
+        Returns:
+            int: Размер страницы.
+
+        Raises:
+            ApiError: Если значение не является положительным числом.
+        """
+        raw = self.request.GET.get(self.limit_kwarg)
+        if raw is None:
+            return DEFAULT_PAGE_SIZE
+        if not raw.isdigit() or int(raw) < 1:
+            raise ApiError({self.limit_kwarg: [
+                str(_('Enter a positive integer.'))
+            ]})
+        return min(int(raw), MAX_PAGE_SIZE)
+
+    def get_ordering(self, queryset: QuerySet) -> Tuple[str, ...]:
+        """
+        Возвращает поля ключа сортировки страниц.
+
+        Args:
+            queryset: Отфильтрованный QuerySet.
+
+        Returns:
+            Tuple[str, ...]: Поля сортировки, последнее - уникальное.
+        """
+        return self.ordering
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Применяет фильтры из параметров запроса.
+
+        Args:
+            queryset: Исходный QuerySet.
+
+        Returns:
+            QuerySet: Отфильтрованный QuerySet.
+        """
+        return queryset
+
+    def get_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Возвращает страницу списка.
+
+        Args:
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Dict[str, Any]: Объекты страницы и ссылки на соседние страницы.
+        """
+        fields = self.get_selected_fields()
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = self.get_ordering(queryset)
+        paginator = CursorPaginator(
+            self.select_values(queryset, fields, extra=ordering),
+            self.get_limit(),
+            ordering=ordering,
+        )
+        page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        return {
+            'results': self.serialize(page.object_list, fields),
+            'next': self.get_page_url(page.next_cursor),
+            'previous': self.get_page_url(page.previous_cursor),
+        }
+
+    def get_page_url(self, cursor: Optional[str]) -> Optional[str]:
+        """
+        Строит ссылку на страницу с курсором.
+
+        Args:
+            cursor: Курсор страницы.
+
+        Returns:
+            Optional[str]: Абсолютный URL или None, если страницы нет.
+        """
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params[self.cursor_kwarg] = cursor
+        return self.request.build_absolute_uri(
+            f'{self.request.path}?{params.urlencode()}'
+        )
+
+
+class BaseApiDetailView(BaseApiView):
+    """Один объект по первичному ключу."""
+
+    def get_data(self, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает объект с идентификатором из URL.
+
+        Args:
+            **kwargs: Именованные аргументы URL (pk).
+
+        Returns:
+            Optional[Dict[str, Any]]: Объект или None, если он не найден.
+        """
+        fields = self.get_selected_fields()
+        queryset = self.get_queryset().filter(pk=kwargs['pk'])
+        rows = list(self.select_values(queryset, fields, extra=('id',)))
+        if not rows:
+            return None
+        return self.serialize(rows, fields)[0]
+
+
+class TaskApiMixin:
+    """Поля задач и загрузка их меток."""
+
+    model = Task
+    dependencies = (
+        'tasks.Task', 'statuses.Status', 'users.User', 'labels.Label'
+    )
+    # Метки выбираются отдельным запросом на страницу, поэтому путь пуст
+    api_fields = {
+        'id': 'id',
+        'name': 'name',
+        'description': 'description',
+        'status': 'status__name',
+        'status_id': 'status_id',
+        'author': 'author__username',
+        'author_id': 'author_id',
+        'executor': 'executor__username',
+        'executor_id': 'executor_id',
+        'labels': '',
+        'created_at': 'created_at',
+    }
+
+    def serialize(self, rows: List[Dict[str, Any]],
+                  fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Преобразует строки задач в объекты ответа вместе с метками.
+
+        Args:
+            rows: Строки из базы.
+            fields: Запрошенные поля ответа.
+
+        Returns:
+            List[Dict[str, Any]]: Объекты с запрошенными полями.
+        """
+        labels: Dict[int, List[str]] = {}
+        if 'labels' in fields and rows:
+            links = Task.labels.through.objects.filter(
+                task_id__in=[row['id'] for row in rows]
+            ).order_by('label__name').values_list('task_id', 'label__name')
+            for task_id, name in links:
+                labels.setdefault(task_id, []).append(name)
+        return [
+            {
+                name: (labels.get(row['id'], []) if name == 'labels'
+                       else row[self.api_fields[name]])
+                for name in fields
+            }
+            for row in rows
+        ]
+
+    def select_values(self, queryset: QuerySet, fields: Sequence[str],
+                      extra: Sequence[str] = ()) -> QuerySet:
+        """
+        Ограничивает выборку задач; id нужен для загрузки меток.
+
+        Args:
+            queryset: Исходный QuerySet.
+            fields: Запрошенные поля ответа.
+            extra: Дополнительные столбцы.
+
+        Returns:
+            QuerySet: QuerySet словарей.
+        """
+        return super().select_values(queryset, fields, (*extra, 'id'))
+
+
+class TaskListApiView(TaskApiMixin, BaseApiListView):
+    """Список задач с фильтрами TaskFilterForm."""
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Применяет фильтры задач (status, executor, labels, self_tasks).
+
+        Args:
+            queryset: Исходный QuerySet задач.
+
+        Returns:
+            QuerySet: Отфильтрованный QuerySet задач.
+
+        Raises:
+            ApiError: Если параметры фильтра неверны.
+        """
+        filterset = TaskFilterForm(
+            self.request.GET, queryset=queryset, request=self.request
+        )
+        if not filterset.is_valid():
+            raise ApiError(filterset.errors.get_json_data())
+        return filterset.qs
+
+    def get_ordering(self, queryset: QuerySet) -> Tuple[str, ...]:
+        """
+        Сортирует результаты поиска по релевантности.
+
+        Args:
+            queryset: Отфильтрованный QuerySet задач.
+
+        Returns:
+            Tuple[str, ...]: Поля ключа сортировки.
+        """
+        return get_search_ordering(queryset, self.ordering)
+
+
+class TaskDetailApiView(TaskApiMixin, BaseApiDetailView):
+    """Одна задача."""
+
+
+class StatusApiMixin:
+    """Поля статусов."""
+
+    model = Status
+    api_fields = {'id': 'id', 'name': 'name', 'created_at': 'created_at'}
+
+
+class StatusListApiView(StatusApiMixin, BaseApiListView):
+    """Список статусов."""
+
+
+class StatusDetailApiView(StatusApiMixin, BaseApiDetailView):
+    """Один статус."""
+
+
+class LabelApiMixin:
+    """Поля меток."""
+
+    model = Label
+    api_fields = {'id': 'id', 'name': 'name', 'created_at': 'created_at'}
+
+
+class LabelListApiView(LabelApiMixin, BaseApiListView):
+    """Список меток."""
+
+
+class LabelDetailApiView(LabelApiMixin, BaseApiDetailView):
+    """Одна метка."""
+
+
+class UserApiMixin:
+    """Поля пользователей (без учетных данных)."""
+
+    model = User
+    api_fields = {
+        'id': 'id',
+        'username': 'username',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'date_joined': 'date_joined',
+    }
+
+
+class UserListApiView(UserApiMixin, BaseApiListView):
+    """Список пользователей."""
+
+    ordering = ('date_joined', 'id')
+
+
+class UserDetailApiView(UserApiMixin, BaseApiDetailView):
+    """Один пользователь."""
+
+
+class ChoiceListApiView(BaseApiListView):
+    """
+    Варианты выбора статусов, пользователей или меток для форм.
+
+    Объекты отдаются страницами в порядке первичного ключа в виде
+    {"id": pk, "text": подпись}; так виджеты RemoteChoicesSelect
+    подгружают варианты, которые не выводятся в <select> сразу.
+    """
+
+    ordering = ('id',)
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+        """
+        Возвращает страницу вариантов или 404 для неизвестного имени.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL (name).
+
+        Returns:
+            HttpResponse: JSON-ответ, 304 или ответ с ошибкой.
+        """
+        self.model = get_choice_model(kwargs['name'])
+        if self.model is None:
+            return JsonResponse({'detail': str(_('Not found'))}, status=404)
+        return super().get(request, *args, **kwargs)
+
+    def get_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Возвращает страницу вариантов.
+
+        Подпись строится str(obj), как в полях форм.
+
+        Args:
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Dict[str, Any]: Варианты страницы и ссылки на соседние страницы.
+        """
+        paginator = CursorPaginator(self.get_queryset(), self.get_limit(),
+                                    ordering=self.ordering)
+        page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        return {
+            'results': [{'id': obj.pk, 'text': str(obj)} for obj in page],
+            'next': self.get_page_url(page.next_cursor),
+            'previous': self.get_page_url(page.previous_cursor),
+        }
+
+
+class AutocompleteApiView(BaseApiView):
+    """
+    Поиск пользователей или меток по началу подписи для виджетов форм.
+
+    Пользователи ищутся по username, полному имени и фамилии, метки - по
+    названию (см. task_manager.autocomplete). Ответ имеет вид
+    {"results": [{"id": pk, "text": подпись}, ...]}.
+    """
+
+    query_kwarg = 'q'
+    limit_kwarg = 'limit'
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+        """
+        Возвращает результаты поиска или 404 для неизвестного имени.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL (name).
+
+        Returns:
+            HttpResponse: JSON-ответ, 304 или ответ с ошибкой.
+        """
+        self.source = AUTOCOMPLETE_SOURCES.get(kwargs['name'])
+        if self.source is None:
+            return JsonResponse({'detail': str(_('Not found'))}, status=404)
+        self.model = self.source.model
+        return super().get(request, *args, **kwargs)
+
+    def get_limit(self) -> int:
+        """
+        Возвращает число результатов из параметра limit.
+
+        Returns:
+            int: Число результатов.
+
+        Raises:
+            ApiError: Если значение не является положительным числом.
+        """
+        raw = self.request.GET.get(self.limit_kwarg)
+        if raw is None:
+            return AUTOCOMPLETE_LIMIT
+        if not raw.isdigit() or int(raw) < 1:
+            raise ApiError({self.limit_kwarg: [
+                str(_('Enter a positive integer.'))
+            ]})
+        return min(int(raw), MAX_AUTOCOMPLETE_LIMIT)
+
+    def get_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Возвращает найденные объекты.
+
+        Args:
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Dict[str, Any]: Результаты поиска.
+        """
+        objects = search_prefix(self.source,
+                                self.request.GET.get(self.query_kwarg, ''),
+                                self.get_limit())
+        return {
+            'results': [{'id': obj.pk, 'text': str(obj)} for obj in objects],
+        }
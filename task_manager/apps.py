@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class TaskManagerConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager'
+
+    def ready(self) -> None:
+        """Подключает инвалидацию кэша списков к сигналам моделей."""
+        from task_manager.cache import connect_signals
+        connect_signals()
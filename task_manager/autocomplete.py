@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.apps import apps
+from django.db import connections, router
+from django.db.models import Model
+from django.db.models.expressions import BaseExpression
+from django.db.models.functions import Collate, Upper
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.choices import (RemoteChoicesMixin,
+                                  RemoteChoicesSelect,
+                                  RemoteChoicesSelectMultiple)
+
+AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 50
+
+
+@dataclass(frozen=True)
+class AutocompleteSource:
+    """Модель и поля, по началу которых ищутся объекты."""
+
+    model_label: str
+    fields: Tuple[str, ...]
+
+    @property
+    def model(self) -> type:
+        """Класс модели."""
+        return apps.get_model(self.model_label)
+
+
+# Источники /api/autocomplete/<name>/. Для каждого поля модель объявляет
+# индекс get_prefix_index_name() (task_manager.indexes.PrefixIndex): в
+# PostgreSQL по UPPER(column::text) с varchar_pattern_ops (LIKE по
+# префиксу при любой локали), в SQLite по column COLLATE NOCASE
+AUTOCOMPLETE_SOURCES = {
+    # full_name начинается с имени, а если его нет - с фамилии
+    'users': AutocompleteSource(
+        'users.User', ('username', 'full_name', 'last_name')
+    ),
+    'labels': AutocompleteSource('labels.Label', ('name',)),
+}
+
+
+def get_prefix_index_name(table: str, column: str) -> str:
+    """
+    Возвращает имя индекса для поиска по началу значения столбца.
+
+    Args:
+        table: Имя таблицы.
+        column: Имя столбца.
+
+    Returns:
+        str: Имя индекса.
+    """
+    return f'{table}_{column}_prefix'
+
+
+def get_prefix_ordering(field: str, vendor: str) -> BaseExpression:
+    """
+    Возвращает сортировку, совпадающую с порядком индекса префиксов.
+
+    В SQLite строки выбираются из индекса NOCASE уже упорядоченными, и
+    LIMIT не требует сортировки всех совпадений.
+
+    Args:
+        field: Имя поля.
+        vendor: СУБД соединения.
+
+    Returns:
+        BaseExpression: Выражение сортировки по возрастанию.
+    """
+    if vendor == 'sqlite':
+        return Collate(field, 'NOCASE').asc()
+    return Upper(field).asc()
+
+
+def search_prefix(source: AutocompleteSource, prefix: str,
+                  limit: int = AUTOCOMPLETE_LIMIT) -> List[Model]:
+    """
+    Ищет объекты, у которых одно из полей начинается с prefix.
+
+    Вместо одного запроса с OR по всем полям выполняется по запросу на
+    поле: каждый читает не больше limit строк из своего индекса в порядке
+    индекса, поэтому время не зависит от числа совпадений. Результаты
+    объединяются и сортируются по совпавшему значению без учета регистра.
+
+    Args:
+        source: Источник поиска.
+        prefix: Начало значения.
+        limit: Максимальное число результатов.
+
+    Returns:
+        List[Model]: Найденные объекты.
+    """
+    prefix = prefix.strip()
+    if not prefix:
+        return []
+    model = source.model
+    vendor = connections[router.db_for_read(model)].vendor
+    matches: Dict[Any, Tuple[str, Model]] = {}
+    for field in source.fields:
+        rows = (model._default_manager
+                .filter(**{f'{field}__istartswith': prefix})
+                .order_by(get_prefix_ordering(field, vendor), 'pk')
+                [:limit])
+        for obj in rows:
+            key = getattr(obj, field).lower()
+            if obj.pk not in matches or key < matches[obj.pk][0]:
+                matches[obj.pk] = (key, obj)
+    ordered = sorted(matches.values(), key=lambda item: (item[0], item[1].pk))
+    return [obj for _key, obj in ordered[:limit]]
+
+
+class AutocompleteMixin(RemoteChoicesMixin):
+    """
+    Виджет выбора с поиском по началу подписи для больших списков.
+
+    Вместо загрузки всех вариантов скрипт js/choices.js показывает поле
+    поиска и подставляет результаты /api/autocomplete/<name>/.
+    """
+
+    url_name = 'api_autocomplete'
+    url_attr = 'data-autocomplete-url'
+
+    def get_context(self, name: str, value: Any,
+                    attrs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Добавляет подсказку для поля поиска.
+
+        Args:
+            name: Имя поля.
+            value: Значение поля.
+            attrs: Атрибуты виджета.
+
+        Returns:
+            Dict[str, Any]: Контекст шаблона виджета.
+        """
+        context = super().get_context(name, value, attrs)
+        if self.is_remote():
+            context['widget']['attrs']['data-autocomplete-placeholder'] = (
+                _('Start typing to search')
+            )
+        return context
+
+
+class AutocompleteSelect(AutocompleteMixin, RemoteChoicesSelect):
+    """Выбор одного объекта с поиском."""
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin,
+                                 RemoteChoicesSelectMultiple):
+    """Выбор нескольких объектов с поиском."""
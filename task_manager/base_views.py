@@ -1,8 +1,18 @@
-from typing import Any, Dict
+import hashlib
+from datetime import datetime
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.messages import get_messages
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import Http404, HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import translation
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import condition
 from django.views.generic import (ListView,
                                   CreateView,
                                   UpdateView,
@@ -12,7 +22,349 @@ from django.views.generic import (ListView,
 from task_manager.mixins import ProtectedErrorHandlerMixin
 
 
-class BaseListView(LoginRequiredMixin, ListView):
+# Число строк и наибольший updated_at таблицы модели
+Validator = Tuple[int, Optional[datetime]]
+
+
+def get_model_validators(models: Iterable[type]) -> List[Validator]:
+    """
+    Возвращает число строк и время последнего изменения моделей.
+
+    Значения читаются из базы одним агрегатным запросом на модель,
+    поэтому совпадают во всех процессах, в отличие от версий в
+    локальном кэше процесса.
+
+    Args:
+        models: Модели с полем updated_at.
+
+    Returns:
+        List[Validator]: Пары (count, updated_at) в порядке моделей.
+    """
+    validators = []
+    for model in models:
+        stats = model._default_manager.aggregate(
+            count=Count('pk'), updated_at=Max('updated_at')
+        )
+        validators.append((stats['count'], stats['updated_at']))
+    return validators
+
+
+async def aget_model_validators(models: Iterable[type]) -> List[Validator]:
+    """
+    Асинхронный вариант get_model_validators().
+
+    Args:
+        models: Модели с полем updated_at.
+
+    Returns:
+        List[Validator]: Пары (count, updated_at) в порядке моделей.
+    """
+    validators = []
+    for model in models:
+        stats = await model._default_manager.aaggregate(
+            count=Count('pk'), updated_at=Max('updated_at')
+        )
+        validators.append((stats['count'], stats['updated_at']))
+    return validators
+
+
+def format_validators(validators: List[Validator]) -> str:
+    """
+    Записывает валидаторы строкой для ETag.
+
+    Args:
+        validators: Пары (count, updated_at).
+
+    Returns:
+        str: Строка вида count:updated_at;...
+    """
+    return ';'.join(
+        f'{count}:{updated_at.isoformat() if updated_at else ""}'
+        for count, updated_at in validators
+    )
+
+
+def get_last_modified(validators: List[Validator]) -> Optional[datetime]:
+    """
+    Возвращает наибольшее время изменения из валидаторов.
+
+    Args:
+        validators: Пары (count, updated_at).
+
+    Returns:
+        Optional[datetime]: Наибольший updated_at или None, если
+            таблицы пусты.
+    """
+    return max((updated_at for _count, updated_at in validators
+                if updated_at), default=None)
+
+
+class ConditionalGetMixin:
+    """
+    Условный GET: ETag и Last-Modified для страниц просмотра.
+
+    Валидатор строится по моделям conditional_models: для каждой одним
+    агрегатным запросом берутся число строк и Max(updated_at). Новые и
+    измененные записи сдвигают Max(updated_at), удаленные уменьшают число
+    строк. В ETag также входят путь, параметры запроса, пользователь,
+    язык и секрет CSRF: страницы содержат формы с токеном, и после смены
+    токена (вход, выход) или без cookie браузер получает новую страницу
+    вместо 304 со старым токеном. Совпавший запрос получает 304 до
+    загрузки объектов и рендеринга шаблона.
+
+    Пока у пользователя есть непоказанные сообщения, страница всегда
+    рендерится заново, иначе сообщения не будут выведены.
+
+    В асинхронных представлениях валидаторы загружаются через асинхронный
+    ORM, а проверка заголовков оборачивает асинхронный обработчик.
+    """
+
+    conditional_models: Tuple[type, ...] = ()
+    _validators: Optional[List[Validator]] = None
+
+    def dispatch(self, request: HttpRequest, *args: Any,
+                 **kwargs: Any) -> HttpResponse:
+        """
+        Проверяет условные заголовки GET-запроса.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Ответ представления или 304.
+        """
+        if (request.method not in ('GET', 'HEAD')
+                or not self.conditional_models
+                or len(get_messages(request))):
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self.adispatch_conditional(
+                super().dispatch, request, *args, **kwargs
+            )
+        response = self.conditional(super().dispatch)(request, *args,
+                                                      **kwargs)
+        # Браузер хранит страницу, но перепроверяет ее при каждом переходе
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    async def adispatch_conditional(
+        self, handler: Callable[..., Any], request: HttpRequest,
+        *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Проверяет условные заголовки для асинхронного представления.
+
+        Args:
+            handler: Метод dispatch родительского класса.
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Ответ представления или 304.
+        """
+        await self.aget_validators()
+
+        async def view(request: HttpRequest, *args: Any,
+                       **kwargs: Any) -> HttpResponse:
+            return await handler(request, *args, **kwargs)
+
+        response = await self.conditional(view)(request, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def conditional(self, view: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Оборачивает обработчик проверкой ETag и Last-Modified.
+
+        Args:
+            view: Синхронный или асинхронный обработчик запроса.
+
+        Returns:
+            Callable[..., Any]: Обработчик, отвечающий 304 на совпавший
+                запрос.
+        """
+        return condition(
+            etag_func=self.get_etag,
+            last_modified_func=self.get_last_modified,
+        )(view)
+
+    def get_validators(self) -> List[Validator]:
+        """
+        Возвращает число строк и время последнего изменения моделей.
+
+        Returns:
+            List[Validator]: Пары (count, updated_at) в порядке
+                conditional_models.
+        """
+        if self._validators is None:
+            self._validators = get_model_validators(self.conditional_models)
+        return self._validators
+
+    async def aget_validators(self) -> List[Validator]:
+        """
+        Асинхронный вариант get_validators().
+
+        Returns:
+            List[Validator]: Пары (count, updated_at) в порядке
+                conditional_models.
+        """
+        if self._validators is None:
+            self._validators = await aget_model_validators(
+                self.conditional_models
+            )
+        return self._validators
+
+    def get_etag(self, request: HttpRequest, *args: Any,
+                 **kwargs: Any) -> str:
+        """
+        Вычисляет ETag страницы.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            str: Значение ETag без кавычек.
+        """
+        stamps = format_validators(self.get_validators())
+        language = translation.get_language()
+        # get_token() создает секрет, если cookie нет, и тогда ответ (и 304)
+        # устанавливает ее; ETag считается по секрету, который попадет в
+        # формы страницы
+        get_token(request)
+        csrf_secret = request.META.get('CSRF_COOKIE', '')
+        return hashlib.md5(
+            f'{request.get_full_path()}|{request.user.pk}|{language}|'
+            f'{csrf_secret}|{stamps}'.encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def get_last_modified(self, request: HttpRequest, *args: Any,
+                          **kwargs: Any) -> Optional[datetime]:
+        """
+        Возвращает время последнего изменения данных страницы.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            Optional[datetime]: Наибольший updated_at или None, если
+                таблицы пусты.
+        """
+        return get_last_modified(self.get_validators())
+
+
+class AsyncUserMixin:
+    """
+    Основа асинхронных представлений: загружает пользователя заранее.
+
+    request.user в синхронном коде загружается лениво, а в цикле событий
+    такое обращение к базе данных запрещено. Пользователь загружается
+    через request.auser(), вместе с ним загружается сессия, поэтому
+    LoginRequiredMixin и проверка сообщений дальше не обращаются к базе
+    данных.
+    """
+
+    async def dispatch(self, request: HttpRequest, *args: Any,
+                       **kwargs: Any) -> HttpResponse:
+        """
+        Загружает пользователя и передает запрос дальше.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Ответ представления или редирект на вход.
+        """
+        request.user = await request.auser()
+        response = super().dispatch(request, *args, **kwargs)  # noqa
+        # LoginRequiredMixin возвращает редирект без корутины
+        if isawaitable(response):
+            response = await response
+        return response
+
+
+class AsyncListMixin(AsyncUserMixin):
+    """
+    Асинхронный GET для списков с ListFragmentCacheMixin.
+
+    Объекты загружаются через QuerySet.aiterator() и только если таблицы
+    нет в кэше. Шаблон страницы Django рендерит в потоке, как и
+    синхронный ответ.
+    """
+
+    async def get(self, request: HttpRequest, *args: Any,
+                  **kwargs: Any) -> HttpResponse:
+        """
+        Загружает объекты списка и возвращает страницу.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Страница списка.
+        """
+        self.object_list = self.get_queryset()  # noqa
+        if self.get_cached_fragment() is None:  # noqa
+            self.object_list = [
+                obj async for obj in self.object_list.aiterator()
+            ]
+        context = self.get_context_data()  # noqa
+        return self.render_to_response(context)  # noqa
+
+
+class AsyncDetailMixin(AsyncUserMixin):
+    """Асинхронный GET для детального просмотра объекта по pk."""
+
+    async def get(self, request: HttpRequest, *args: Any,
+                  **kwargs: Any) -> HttpResponse:
+        """
+        Загружает объект и возвращает страницу.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Страница объекта.
+        """
+        self.object = await self.aget_object()
+        context = self.get_context_data(object=self.object)  # noqa
+        return self.render_to_response(context)  # noqa
+
+    async def aget_object(self) -> Model:
+        """
+        Загружает объект через QuerySet.aget().
+
+        Returns:
+            Model: Объект с pk из URL.
+
+        Raises:
+            Http404: Если объект не найден.
+        """
+        queryset = self.get_queryset()  # noqa
+        pk = self.kwargs.get(self.pk_url_kwarg)  # noqa
+        try:
+            return await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                _('No %(verbose_name)s found matching the query')
+                % {'verbose_name': queryset.model._meta.verbose_name}
+            )
+
+
+class BaseListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """Базовый класс для отображения списков объектов."""
 
     pass
@@ -88,9 +440,33 @@ class BaseDeleteView(LoginRequiredMixin,
                      SuccessMessageMixin,
                      ProtectedErrorHandlerMixin,
                      DeleteView):
-    """Базовый класс для удаления объектов."""
+    """
+    Базовый класс для удаления объектов.
+
+    Удаляемый объект загружается один раз за запрос: повторные вызовы
+    get_object() из dispatch, get/post и get_context_data возвращают
+    уже загруженный экземпляр.
+    """
 
     template_name = 'delete.html'
+    _object: Optional[Model] = None
+
+    def get_object(self, queryset: Optional[QuerySet] = None) -> Model:
+        """
+        Возвращает удаляемый объект, загружая его только при первом вызове.
+
+        Args:
+            queryset: QuerySet для поиска объекта. Если передан, объект
+                загружается заново без кэширования.
+
+        Returns:
+            Model: Удаляемый объект.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+        if self._object is None:
+            self._object = super().get_object()
+        return self._object
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -111,7 +487,7 @@ class BaseDeleteView(LoginRequiredMixin,
             context['title'] = self.delete_title
 
         # Определяем имя объекта для отображения
-        obj = self.get_object()
+        obj = self.object
         if hasattr(obj, 'name'):
             context['object_name'] = obj.name
         elif hasattr(obj, 'username'):
@@ -123,7 +499,10 @@ class BaseDeleteView(LoginRequiredMixin,
         return context
 
 
-class BaseDetailView(LoginRequiredMixin, SuccessMessageMixin, DetailView):
+class BaseDetailView(LoginRequiredMixin,
+                     ConditionalGetMixin,
+                     SuccessMessageMixin,
+                     DetailView):
     """Базовый класс для детального просмотра объектов."""
 
     pass
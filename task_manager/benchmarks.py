@@ -0,0 +1,601 @@
+import copy
+import json
+import math
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import islice
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple)
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.auth.hashers import make_password
+from django.db import connections, transaction
+from django.db.models import Model
+from django.test import AsyncClient, Client
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.performance import RequestTimings
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import rebuild_counters
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import rebuild_search_index
+from task_manager.users.models import User
+
+# Число задач для размеров набора данных
+SEED_SIZES = {'1k': 1000, '100k': 100000, '1m': 1000000}
+SEED_BATCH_SIZE = 5000
+SEED_STATUSES = ('New', 'In progress', 'Review', 'Testing', 'Done',
+                 'Blocked', 'Archived')
+SEED_WORDS = (
+    'fix', 'update', 'release', 'review', 'client', 'report', 'deploy',
+    'invoice', 'design', 'meeting', 'database', 'migration', 'backup',
+    'server', 'page', 'form', 'search', 'export', 'import', 'label',
+    'status', 'test', 'bug', 'feature', 'docs', 'mobile', 'api', 'login',
+)
+BENCHMARK_PASSWORD = 'benchmark-password'
+BENCHMARK_USERNAME = 'bench_user_0'
+
+CLIENT_WSGI = 'wsgi'
+CLIENT_ASGI = 'asgi'
+CLIENTS = (CLIENT_WSGI, CLIENT_ASGI)
+PERCENTILES = (50, 90, 95, 99)
+# Пространства имен URL, которые не замеряются
+SKIPPED_NAMESPACES = ('admin',)
+# Значения аргументов URL, кроме pk
+URL_KWARGS = {'export_format': 'csv', 'name': 'users'}
+# Аргументы URL, ссылающиеся на объекты моделей, кроме pk
+URL_MODEL_KWARGS = {'status_id': Status}
+
+
+def bulk_insert(model: type, objects: Iterable[Model],
+                batch_size: int = SEED_BATCH_SIZE) -> None:
+    """
+    Вставляет объекты пакетами, не собирая их все в памяти.
+
+    Args:
+        model: Модель объектов.
+        objects: Объекты для вставки.
+        batch_size: Число объектов в пакете.
+    """
+    iterator = iter(objects)
+    while batch := list(islice(iterator, batch_size)):
+        model.objects.bulk_create(batch)
+
+
+def seed_data(tasks: int, seed: int = 0,
+              batch_size: int = SEED_BATCH_SIZE) -> None:
+    """
+    Заполняет базу данных набором для замеров.
+
+    На сотню задач создается один пользователь (не меньше десяти), на
+    тысячу - одна метка (не меньше двадцати). У задачи от нуля до четырех
+    меток, у пятой части задач нет исполнителя. Все пользователи имеют
+    пароль BENCHMARK_PASSWORD.
+
+    Args:
+        tasks: Число задач.
+        seed: Начальное значение генератора случайных чисел.
+        batch_size: Число строк в одном INSERT.
+    """
+    rng = random.Random(seed)
+    password = make_password(BENCHMARK_PASSWORD)
+    bulk_insert(User, (
+        User(username=f'bench_user_{number}', first_name='Bench',
+             last_name=f'User {number}', full_name=f'Bench User {number}',
+             password=password)
+        for number in range(max(10, tasks // 100))
+    ), batch_size)
+    bulk_insert(Status, (Status(name=name) for name in SEED_STATUSES))
+    bulk_insert(Label, (
+        Label(name=f'{rng.choice(SEED_WORDS)} {number}')
+        for number in range(max(20, tasks // 1000))
+    ), batch_size)
+    user_ids = list(User.objects.values_list('pk', flat=True))
+    status_ids = list(Status.objects.values_list('pk', flat=True))
+    label_ids = list(Label.objects.values_list('pk', flat=True))
+    bulk_insert(Task, (
+        Task(
+            name=f'Task {number} {rng.choice(SEED_WORDS)}',
+            description=' '.join(rng.choices(SEED_WORDS,
+                                             k=rng.randint(5, 40))),
+            status_id=rng.choice(status_ids),
+            author_id=rng.choice(user_ids),
+            executor_id=(rng.choice(user_ids) if rng.random() < 0.8
+                         else None),
+        )
+        for number in range(tasks)
+    ), batch_size)
+    through = Task.labels.through
+    bulk_insert(through, (
+        through(task_id=task_id, label_id=label_id)
+        for task_id in Task.objects.values_list('pk', flat=True).iterator()
+        for label_id in rng.sample(label_ids, rng.randint(0, 4))
+    ), batch_size)
+    # bulk_create не отправляет сигналы, которые обновляют индекс поиска
+    # и счетчики задач
+    rebuild_search_index()
+    rebuild_counters()
+
+
+@dataclass
+class BenchmarkFixtures:
+    """Объекты, к которым обращаются замеряемые страницы."""
+
+    user: User
+    status: Status
+    label: Label
+    task: Task
+
+    @classmethod
+    def create(cls) -> 'BenchmarkFixtures':
+        """
+        Находит или создает объекты в заполненной базе.
+
+        Статус и метка создаются отдельно, чтобы их удаление не отклонялось
+        из-за связанных задач. Задача берется из задач пользователя, иначе
+        ее удаление запрещено.
+
+        Returns:
+            BenchmarkFixtures: Объекты для аргументов URL и форм.
+        """
+        user = User.objects.get(username=BENCHMARK_USERNAME)
+        return cls(
+            user=user,
+            status=Status.objects.get_or_create(name='Benchmark status')[0],
+            label=Label.objects.get_or_create(name='Benchmark label')[0],
+            task=(Task.objects.filter(author=user).order_by('pk').first()
+                  or Task.objects.order_by('pk').first()),
+        )
+
+    def get_object(self, model: type) -> Model:
+        """
+        Возвращает объект модели для аргумента pk.
+
+        Args:
+            model: Модель представления.
+
+        Returns:
+            Model: Объект модели.
+        """
+        return {
+            User: self.user,
+            Status: self.status,
+            Label: self.label,
+            Task: self.task,
+        }[model]
+
+
+def get_user_data(username: str) -> Dict[str, Any]:
+    """Данные формы пользователя."""
+    return {
+        'first_name': 'Bench', 'last_name': 'User', 'username': username,
+        'password1': BENCHMARK_PASSWORD, 'password2': BENCHMARK_PASSWORD,
+    }
+
+
+def get_task_data(name: str, fixtures: BenchmarkFixtures) -> Dict[str, Any]:
+    """Данные формы задачи."""
+    return {
+        'name': name, 'description': 'Benchmark task',
+        'status': fixtures.status.pk, 'executor': fixtures.user.pk,
+        'labels': [fixtures.label.pk],
+    }
+
+
+def get_import_file(fixtures: BenchmarkFixtures) -> SimpleUploadedFile:
+    """Файл JSON Lines с десятью новыми задачами для импорта."""
+    lines = [json.dumps({
+        'name': f'Imported task {number}', 'description': 'Benchmark',
+        'status': fixtures.status.name, 'author': fixtures.user.username,
+        'labels': [fixtures.label.name],
+    }) for number in range(10)]
+    return SimpleUploadedFile('tasks.jsonl', '\n'.join(lines).encode())
+
+
+# Данные POST-запросов по имени URL; страницы без данных замеряются
+# только запросом GET
+POST_DATA: Dict[str, Callable[[BenchmarkFixtures], Dict[str, Any]]] = {
+    'login': lambda fixtures: {'username': fixtures.user.username,
+                               'password': BENCHMARK_PASSWORD},
+    'logout': lambda fixtures: {},
+    'users_create': lambda fixtures: get_user_data('bench_new_user'),
+    'users_update': lambda fixtures: get_user_data(fixtures.user.username),
+    'users_delete': lambda fixtures: {},
+    'statuses_create': lambda fixtures: {'name': 'Benchmark new status'},
+    'statuses_update': lambda fixtures: {'name': 'Benchmark status 2'},
+    'statuses_delete': lambda fixtures: {},
+    'labels_create': lambda fixtures: {'name': 'Benchmark new label'},
+    'labels_update': lambda fixtures: {'name': 'Benchmark label 2'},
+    'labels_delete': lambda fixtures: {},
+    'tasks_create': lambda fixtures: get_task_data('Benchmark new task',
+                                                   fixtures),
+    'tasks_update': lambda fixtures: get_task_data('Benchmark task 2',
+                                                   fixtures),
+    'tasks_delete': lambda fixtures: {},
+    'tasks_bulk': lambda fixtures: {'action': 'set_status',
+                                    'tasks': [fixtures.task.pk],
+                                    'status': fixtures.status.pk},
+    'tasks_import': lambda fixtures: {'file': get_import_file(fixtures)},
+}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Замеряемый запрос к маршруту."""
+
+    name: str
+    method: str
+    pattern: URLPattern
+
+    @property
+    def model(self) -> Optional[type]:
+        """Модель представления маршрута, если она задана."""
+        view_class = getattr(self.pattern.callback, 'view_class', None)
+        return getattr(view_class, 'model', None)
+
+    def get_path(self, fixtures: BenchmarkFixtures) -> str:
+        """
+        Строит путь запроса.
+
+        Args:
+            fixtures: Объекты для аргументов pk и URL_MODEL_KWARGS.
+
+        Returns:
+            str: Путь маршрута с подставленными аргументами.
+
+        Raises:
+            ValueError: Если для аргумента URL нет значения.
+        """
+        kwargs: Dict[str, Any] = {}
+        for name in self.pattern.pattern.converters:
+            if name == 'pk' and self.model is not None:
+                kwargs[name] = fixtures.get_object(self.model).pk
+            elif name in URL_MODEL_KWARGS:
+                kwargs[name] = fixtures.get_object(URL_MODEL_KWARGS[name]).pk
+            elif name in URL_KWARGS:
+                kwargs[name] = URL_KWARGS[name]
+            else:
+                raise ValueError(
+                    f'No benchmark value for argument {name!r} of {self.name}'
+                )
+        return reverse(self.name, kwargs=kwargs)
+
+
+def iter_url_patterns(patterns: List[Any]) -> Iterator[URLPattern]:
+    """
+    Обходит именованные маршруты URLconf.
+
+    Args:
+        patterns: Маршруты URLconf.
+
+    Yields:
+        URLPattern: Маршрут с именем вне SKIPPED_NAMESPACES.
+    """
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            if entry.namespace not in SKIPPED_NAMESPACES:
+                yield from iter_url_patterns(entry.url_patterns)
+        elif entry.name:
+            yield entry
+
+
+def get_endpoints(names: Optional[Iterable[str]] = None) -> List[Endpoint]:
+    """
+    Собирает запросы ко всем маршрутам task_manager/urls.py.
+
+    GET замеряется, если представление его принимает, POST - если для
+    маршрута есть данные в POST_DATA.
+
+    Args:
+        names: Имена маршрутов для отбора или None для всех.
+
+    Returns:
+        List[Endpoint]: Замеряемые запросы.
+    """
+    selected = set(names or ())
+    endpoints = []
+    for pattern in iter_url_patterns(get_resolver().url_patterns):
+        if selected and pattern.name not in selected:
+            continue
+        view_class = getattr(pattern.callback, 'view_class', None)
+        if view_class is None or 'get' in view_class.http_method_names:
+            endpoints.append(Endpoint(pattern.name, 'GET', pattern))
+        if pattern.name in POST_DATA:
+            endpoints.append(Endpoint(pattern.name, 'POST', pattern))
+    return endpoints
+
+
+@dataclass
+class Sample:
+    """Результат одного запроса."""
+
+    status: int
+    seconds: float
+    queries: int
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Возвращает перцентиль методом ближайшего ранга.
+
+    Args:
+        values: Отсортированные значения.
+        percent: Перцентиль от 0 до 100.
+
+    Returns:
+        float: Значение перцентиля.
+    """
+    rank = math.ceil(percent / 100 * len(values))
+    return values[max(rank - 1, 0)]
+
+
+def summarize(samples: List[Sample]) -> Dict[str, Any]:
+    """
+    Сводит замеры запроса в перцентили времени и число SQL-запросов.
+
+    Args:
+        samples: Замеры.
+
+    Returns:
+        Dict[str, Any]: Время в миллисекундах, медиана числа SQL-запросов
+            и встреченные коды ответа.
+    """
+    latencies = sorted(sample.seconds * 1000 for sample in samples)
+    latency = {f'p{value}': round(percentile(latencies, value), 3)
+               for value in PERCENTILES}
+    latency.update(mean=round(statistics.fmean(latencies), 3),
+                   max=round(latencies[-1], 3))
+    return {
+        'latency_ms': latency,
+        'queries': statistics.median_low(
+            [sample.queries for sample in samples]
+        ),
+        'statuses': sorted({sample.status for sample in samples}),
+    }
+
+
+def get_client_headers() -> Dict[str, str]:
+    """Заголовки запросов: токен эндпоинта /metrics, если он задан."""
+    if settings.METRICS_TOKEN:
+        return {'Authorization': f'Bearer {settings.METRICS_TOKEN}'}
+    return {}
+
+
+class EndpointBenchmark:
+    """
+    Замеряет запросы к маршрутам через тестовые клиенты WSGI и ASGI.
+
+    Каждый запрос выполняется внутри точки сохранения, которая затем
+    откатывается, поэтому изменяющие запросы повторяются на одних и тех
+    же данных, а база не меняется. Асинхронный клиент запускается через
+    async_to_sync: синхронный код представлений (thread_sensitive) при
+    этом выполняется в текущем потоке и в той же транзакции.
+
+    Число SQL-запросов считает обертка connection.execute_wrapper,
+    память - пик выделений tracemalloc в отдельном запросе, чтобы
+    трассировка не влияла на время.
+    """
+
+    def __init__(self, fixtures: BenchmarkFixtures, repeat: int) -> None:
+        """
+        Args:
+            fixtures: Объекты для аргументов URL и форм.
+            repeat: Число замеряемых запросов к каждому маршруту.
+        """
+        self.fixtures = fixtures
+        self.repeat = max(repeat, 1)
+        self.timings = RequestTimings()
+        self.headers = get_client_headers()
+        self.clients = {CLIENT_WSGI: Client(), CLIENT_ASGI: AsyncClient()}
+        for client in self.clients.values():
+            client.force_login(fixtures.user)
+
+    def run(self, endpoints: List[Endpoint],
+            clients: Iterable[str] = CLIENTS) -> List[Dict[str, Any]]:
+        """
+        Замеряет запросы каждым клиентом.
+
+        Args:
+            endpoints: Замеряемые запросы.
+            clients: Имена клиентов (CLIENT_WSGI, CLIENT_ASGI).
+
+        Returns:
+            List[Dict[str, Any]]: Результаты по запросам и клиентам.
+        """
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(self.timings.execute)
+                )
+            stack.enter_context(transaction.atomic())
+            results = [self.measure(endpoint, client)
+                       for client in clients for endpoint in endpoints]
+            transaction.set_rollback(True)
+        return results
+
+    def measure(self, endpoint: Endpoint, client: str) -> Dict[str, Any]:
+        """
+        Замеряет запрос после одного прогревочного.
+
+        Args:
+            endpoint: Замеряемый запрос.
+            client: Имя клиента.
+
+        Returns:
+            Dict[str, Any]: Результат запроса.
+        """
+        path = endpoint.get_path(self.fixtures)
+        send = (self.send_wsgi if client == CLIENT_WSGI
+                else async_to_sync(self.send_asgi))
+        send(endpoint, path)
+        samples = [send(endpoint, path) for _number in range(self.repeat)]
+        tracemalloc.start()
+        try:
+            send(endpoint, path)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return {
+            'endpoint': endpoint.name,
+            'method': endpoint.method,
+            'client': client,
+            'path': path,
+            **summarize(samples),
+            'memory_kib': round(peak / 1024, 1),
+        }
+
+    def get_data(self, endpoint: Endpoint) -> Dict[str, Any]:
+        """Данные запроса (новые для каждого запроса из-за файлов)."""
+        if endpoint.method == 'POST':
+            return POST_DATA[endpoint.name](self.fixtures)
+        return {}
+
+    def send_wsgi(self, endpoint: Endpoint, path: str) -> Sample:
+        """
+        Выполняет запрос синхронным клиентом.
+
+        Args:
+            endpoint: Замеряемый запрос.
+            path: Путь запроса.
+
+        Returns:
+            Sample: Замер запроса.
+        """
+        client = self.clients[CLIENT_WSGI]
+        cookies = copy.deepcopy(client.cookies)
+        data = self.get_data(endpoint)
+        savepoint = transaction.savepoint()
+        queries = self.timings.queries
+        started = time.perf_counter()
+        response = getattr(client, endpoint.method.lower())(
+            path, data, headers=self.headers
+        )
+        if response.streaming:
+            b''.join(response.streaming_content)
+        seconds = time.perf_counter() - started
+        sample = Sample(response.status_code, seconds,
+                        self.timings.queries - queries)
+        transaction.savepoint_rollback(savepoint)
+        client.cookies = cookies
+        return sample
+
+    async def send_asgi(self, endpoint: Endpoint, path: str) -> Sample:
+        """
+        Выполняет запрос асинхронным клиентом.
+
+        Args:
+            endpoint: Замеряемый запрос.
+            path: Путь запроса.
+
+        Returns:
+            Sample: Замер запроса.
+        """
+        client = self.clients[CLIENT_ASGI]
+        cookies = copy.deepcopy(client.cookies)
+        data = self.get_data(endpoint)
+        savepoint = await sync_to_async(transaction.savepoint)()
+        queries = self.timings.queries
+        started = time.perf_counter()
+        response = await getattr(client, endpoint.method.lower())(
+            path, data, headers=self.headers
+        )
+        if response.streaming:
+            await self.aconsume(response)
+        seconds = time.perf_counter() - started
+        sample = Sample(response.status_code, seconds,
+                        self.timings.queries - queries)
+        await sync_to_async(transaction.savepoint_rollback)(savepoint)
+        client.cookies = cookies
+        return sample
+
+    @staticmethod
+    async def aconsume(response: Any) -> None:
+        """Читает потоковый ответ; синхронный итератор - в потоке БД."""
+        if response.is_async:
+            async for _chunk in response.streaming_content:
+                pass
+        else:
+            await sync_to_async(list)(response.streaming_content)
+
+
+def get_commit() -> Optional[str]:
+    """
+    Возвращает текущий коммит git.
+
+    Returns:
+        Optional[str]: Хэш коммита или None вне репозитория git.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: List[Dict[str, Any]],
+                 options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Собирает отчет для сохранения в JSON.
+
+    Args:
+        results: Результаты EndpointBenchmark.run().
+        options: Параметры запуска.
+
+    Returns:
+        Dict[str, Any]: Отчет с коммитом, СУБД и объемом данных.
+    """
+    return {
+        'commit': get_commit(),
+        'created_at': timezone.now().isoformat(),
+        'database': connections['default'].vendor,
+        'tasks': Task.objects.count(),
+        'users': User.objects.count(),
+        'labels': Label.objects.count(),
+        'options': options,
+        'results': results,
+    }
+
+
+def compare_reports(
+    previous: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Tuple[str, float, float, int, int, bool]]:
+    """
+    Сравнивает p95 и число SQL-запросов двух отчетов.
+
+    Args:
+        previous: Прежний отчет.
+        current: Новый отчет.
+        threshold: Допустимый относительный рост p95 (0.2 - на 20%).
+
+    Returns:
+        List[Tuple[str, float, float, int, int, bool]]: Для запросов из
+            обоих отчетов: название, прежний и новый p95, прежнее и новое
+            число SQL-запросов и признак регрессии.
+    """
+    def key(result: Dict[str, Any]) -> str:
+        return f'{result["client"]} {result["method"]} {result["endpoint"]}'
+
+    old = {key(result): result for result in previous['results']}
+    rows = []
+    for result in current['results']:
+        before = old.get(key(result))
+        if before is None:
+            continue
+        old_p95 = before['latency_ms']['p95']
+        new_p95 = result['latency_ms']['p95']
+        regressed = (new_p95 > old_p95 * (1 + threshold)
+                     or result['queries'] > before['queries'])
+        rows.append((key(result), old_p95, new_p95, before['queries'],
+                     result['queries'], regressed))
+    return rows
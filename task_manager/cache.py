@@ -0,0 +1,168 @@
+import hashlib
+import time
+from typing import Any, Iterable, List, Optional
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import QueryDict
+
+VERSION_KEY_PREFIX = 'list-version'
+# Версии подписей вариантов выбора (см. task_manager.choices). Меняются
+# только при изменении строк модели, но не ее счетчиков
+CHOICES_VERSION_KEY_PREFIX = 'choices-version'
+FRAGMENT_KEY_PREFIX = 'list-fragment'
+
+# Модели, изменение которых делает устаревшими закэшированные списки
+CACHED_MODELS = (
+    'statuses.Status',
+    'labels.Label',
+    'users.User',
+    'tasks.Task',
+)
+
+# Сохранения, которые не меняют отображаемые в списках данные
+IGNORED_UPDATE_FIELDS = frozenset({'last_login'})
+
+
+def get_version_key(model_label: str,
+                    prefix: str = VERSION_KEY_PREFIX) -> str:
+    """
+    Возвращает ключ кэша с версией данных модели.
+
+    Args:
+        model_label: Метка модели в формате 'app_label.ModelName'.
+        prefix: Пространство версий (списки или варианты выбора).
+
+    Returns:
+        str: Ключ кэша.
+    """
+    return f'{prefix}:{model_label.lower()}'
+
+
+def get_versions(model_labels: Iterable[str],
+                 prefix: str = VERSION_KEY_PREFIX) -> List[int]:
+    """
+    Возвращает текущие версии данных моделей.
+
+    Отсутствующая версия (например, вытесненная из кэша) создается заново
+    из текущего времени, поэтому никогда не совпадает с прежней и не может
+    вернуть к жизни устаревший фрагмент.
+
+    Args:
+        model_labels: Метки моделей.
+        prefix: Пространство версий (списки или варианты выбора).
+
+    Returns:
+        List[int]: Версии в порядке меток.
+    """
+    keys = [get_version_key(label, prefix) for label in model_labels]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = time.time_ns()
+            cache.add(key, version, None)
+            # Кэш без хранения (DummyCache) всегда возвращает новую версию
+            versions[key] = cache.get(key, version)
+    return [versions[key] for key in keys]
+
+
+def invalidate_model(model_label: str, choices: bool = True) -> None:
+    """
+    Делает устаревшими все закэшированные списки, зависящие от модели.
+
+    Используется обработчиками сигналов, а также массовыми операциями,
+    которые сигналы не отправляют (QuerySet.update, bulk_create).
+
+    Args:
+        model_label: Метка модели в формате 'app_label.ModelName'.
+        choices: Сбросить и варианты выбора модели. False передают
+            операции, которые не меняют подписи объектов (счетчики).
+    """
+    version = time.time_ns()
+    cache.set(get_version_key(model_label), version, None)
+    if choices:
+        cache.set(get_version_key(model_label, CHOICES_VERSION_KEY_PREFIX),
+                  version, None)
+
+
+def make_fragment_key(
+    name: str,
+    dependencies: Iterable[str],
+    params: QueryDict,
+    language: Optional[str],
+    user_id: Optional[int] = None,
+) -> str:
+    """
+    Строит ключ кэша фрагмента списка.
+
+    Args:
+        name: Имя фрагмента (обычно имя шаблона).
+        dependencies: Метки моделей, от которых зависит фрагмент.
+        params: GET-параметры запроса (фильтры, курсор).
+        language: Код языка.
+        user_id: Идентификатор пользователя, если содержимое от него зависит.
+
+    Returns:
+        str: Ключ кэша.
+    """
+    versions = '.'.join(str(version) for version in get_versions(dependencies))
+    # Значения экранируются, иначе '&' и '=' внутри значения дают ключ
+    # другого набора параметров
+    query = urlencode(sorted(params.lists()), doseq=True)
+    digest = hashlib.md5(
+        f'{name}|{language}|{user_id}|{query}'.encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'{FRAGMENT_KEY_PREFIX}:{versions}:{digest}'
+
+
+def get_fragment_timeout() -> int:
+    """
+    Возвращает время жизни фрагментов списков в секундах.
+
+    Returns:
+        int: Значение настройки LIST_CACHE_TIMEOUT.
+    """
+    return getattr(settings, 'LIST_CACHE_TIMEOUT', 300)
+
+
+def invalidate_on_change(
+    sender: type, update_fields: Optional[Iterable[str]] = None,
+    **kwargs: Any
+) -> None:
+    """
+    Обработчик сигналов post_save, post_delete и m2m_changed.
+
+    Args:
+        sender: Класс модели, отправившей сигнал. Для m2m_changed это
+            промежуточная модель связи.
+        update_fields: Поля, переданные в save(update_fields=...).
+        **kwargs: Остальные аргументы сигнала.
+    """
+    if update_fields and set(update_fields) <= IGNORED_UPDATE_FIELDS:
+        return
+    action = kwargs.get('action')
+    if action is None:
+        invalidate_model(sender._meta.label)
+    elif action.startswith('post_'):
+        # Изменение связи затрагивает списки обеих связанных моделей, но
+        # не подписи их объектов
+        invalidate_model(kwargs['instance']._meta.label, choices=False)
+        invalidate_model(kwargs['model']._meta.label, choices=False)
+
+
+def connect_signals() -> None:
+    """Подключает инвалидацию кэша к сигналам кэшируемых моделей."""
+    for label in CACHED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(invalidate_on_change, sender=model,
+                          dispatch_uid=f'list-cache-save-{label}')
+        post_delete.connect(invalidate_on_change, sender=model,
+                            dispatch_uid=f'list-cache-delete-{label}')
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(invalidate_on_change,
+                                sender=field.remote_field.through,
+                                dispatch_uid=f'list-cache-m2m-{label}-{field.name}')
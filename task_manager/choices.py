@@ -0,0 +1,325 @@
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from django import forms
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse_lazy
+from django_filters import fields as filter_fields
+from django_filters import filters
+
+from task_manager.cache import (CHOICES_VERSION_KEY_PREFIX,
+                                get_fragment_timeout,
+                                get_versions)
+
+CHOICES_KEY_PREFIX = 'choices'
+
+# Модели, варианты выбора которых отдает /api/choices/<name>/
+CHOICE_MODELS = {
+    'statuses': 'statuses.Status',
+    'users': 'users.User',
+    'labels': 'labels.Label',
+}
+# Столбцы с подписью объекта (str(obj)): варианты выбираются без
+# загрузки остальных столбцов
+CHOICE_LABEL_FIELDS = {
+    'statuses.Status': 'name',
+    'users.User': 'full_name',
+    'labels.Label': 'name',
+}
+
+Choice = Tuple[Any, str]
+
+
+def get_choice_model(name: str) -> Optional[type]:
+    """
+    Возвращает модель вариантов выбора по имени из URL.
+
+    Args:
+        name: Ключ CHOICE_MODELS.
+
+    Returns:
+        Optional[type]: Модель или None, если имя неизвестно.
+    """
+    label = CHOICE_MODELS.get(name)
+    return apps.get_model(label) if label else None
+
+
+def get_choices_name(model: type) -> Optional[str]:
+    """
+    Возвращает имя вариантов выбора модели для URL.
+
+    Args:
+        model: Модель.
+
+    Returns:
+        Optional[str]: Ключ CHOICE_MODELS или None.
+    """
+    for name, label in CHOICE_MODELS.items():
+        if label == model._meta.label:
+            return name
+    return None
+
+
+def get_inline_limit() -> int:
+    """
+    Возвращает число вариантов, которые выводятся в <select> целиком.
+
+    Returns:
+        int: Значение настройки CHOICES_INLINE_LIMIT.
+    """
+    return getattr(settings, 'CHOICES_INLINE_LIMIT', 500)
+
+
+def get_choices_key(model: type) -> str:
+    """
+    Возвращает ключ кэша вариантов выбора с текущей версией модели.
+
+    Args:
+        model: Модель.
+
+    Returns:
+        str: Ключ кэша.
+    """
+    label = model._meta.label
+    version = get_versions([label], CHOICES_VERSION_KEY_PREFIX)[0]
+    return f'{CHOICES_KEY_PREFIX}:{label.lower()}:{version}'
+
+
+def load_choices(model: type, key: str) -> List[Choice]:
+    """
+    Возвращает пары (pk, подпись) всех объектов модели из кэша.
+
+    При промахе подписи (столбец CHOICE_LABEL_FIELDS или str(obj))
+    выбираются одним запросом и сохраняются на LIST_CACHE_TIMEOUT.
+    Сохранение или удаление объекта меняет версию в ключе (см.
+    task_manager.cache), поэтому устаревший список не возвращается.
+
+    Args:
+        model: Модель.
+        key: Ключ из get_choices_key().
+
+    Returns:
+        List[Choice]: Варианты в порядке первичного ключа.
+    """
+    choices = cache.get(key)
+    if choices is None:
+        queryset = model._default_manager.order_by('pk')
+        label_field = CHOICE_LABEL_FIELDS.get(model._meta.label)
+        if label_field:
+            choices = list(queryset.values_list('pk', label_field))
+        else:
+            choices = [(obj.pk, str(obj)) for obj in queryset.iterator()]
+        cache.set_many({key: choices, f'{key}:count': len(choices)},
+                       get_fragment_timeout())
+    return choices
+
+
+def count_choices(model: type, key: str) -> int:
+    """
+    Возвращает число вариантов выбора, не читая из кэша сами варианты.
+
+    Число сохраняется вместе с вариантами, поэтому при промахе варианты
+    загружаются тем же единственным запросом, что и в load_choices().
+
+    Args:
+        model: Модель.
+        key: Ключ из get_choices_key().
+
+    Returns:
+        int: Число объектов модели.
+    """
+    count = cache.get(f'{key}:count')
+    if count is None:
+        count = len(load_choices(model, key))
+    return count
+
+
+class CachedModelChoiceIterator(forms.models.ModelChoiceIterator):
+    """Итератор вариантов поля, читающий подписи из кэша, а не из базы."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        yield from self.field.get_cached_choices()
+
+    def __len__(self) -> int:
+        return (self.field.count_cached_choices()
+                + (self.field.empty_label is not None))
+
+    def __bool__(self) -> bool:
+        return (self.field.empty_label is not None
+                or bool(self.field.count_cached_choices()))
+
+
+class RemoteChoicesMixin:
+    """
+    Виджет выбора, не выводящий большие списки вариантов.
+
+    Если вариантов больше get_inline_limit(), выводятся только выбранные,
+    а в атрибуте url_attr передается адрес маршрута url_name, по которому
+    скрипт js/choices.js загружает остальные. Виджет работает с полями
+    CachedChoicesMixin.
+    """
+
+    url_name = 'api_choices'
+    url_attr = 'data-choices-url'
+    choices_url: Optional[str] = None
+
+    def is_remote(self) -> bool:
+        """Загружаются ли варианты отдельно от страницы."""
+        return (self.choices_url is not None
+                and len(self.choices) > get_inline_limit())
+
+    def optgroups(self, name: str, value: List[str],
+                  attrs: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Возвращает группы вариантов; для больших списков - только выбранные.
+
+        Args:
+            name: Имя поля.
+            value: Выбранные значения.
+            attrs: Атрибуты виджета.
+
+        Returns:
+            List[Any]: Группы вариантов для шаблона.
+        """
+        if not self.is_remote():
+            return super().optgroups(name, value, attrs)
+        field = self.choices.field
+        widget = copy.copy(self)
+        widget.choices = field.get_selected_choices(value)
+        if field.empty_label is not None:
+            widget.choices.insert(0, ('', field.empty_label))
+        return super(RemoteChoicesMixin, widget).optgroups(name, value, attrs)
+
+    def get_context(self, name: str, value: Any,
+                    attrs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Добавляет адрес загрузки вариантов для больших списков.
+
+        Args:
+            name: Имя поля.
+            value: Значение поля.
+            attrs: Атрибуты виджета.
+
+        Returns:
+            Dict[str, Any]: Контекст шаблона виджета.
+        """
+        context = super().get_context(name, value, attrs)
+        if self.is_remote():
+            context['widget']['attrs'][self.url_attr] = self.choices_url
+        return context
+
+
+class RemoteChoicesSelect(RemoteChoicesMixin, forms.Select):
+    """Выбор одного объекта с загрузкой больших списков по API."""
+
+
+class RemoteChoicesSelectMultiple(RemoteChoicesMixin, forms.SelectMultiple):
+    """Выбор нескольких объектов с загрузкой больших списков по API."""
+
+
+class CachedChoicesMixin:
+    """
+    Поле выбора объектов модели с вариантами из кэша.
+
+    Подписи всех объектов модели (см. load_choices) общие для всех форм и
+    запросов, поэтому вывод формы не обращается к базе. Queryset поля
+    по-прежнему проверяет отправленные значения, поэтому он должен
+    совпадать со всеми объектами модели.
+    """
+
+    iterator = CachedModelChoiceIterator
+    _cached_choices: Tuple[str, List[Choice]] = ('', [])
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        choices_name = get_choices_name(self.queryset.model)
+        if choices_name and isinstance(self.widget, RemoteChoicesMixin):
+            self.widget.choices_url = reverse_lazy(self.widget.url_name,
+                                                   args=[choices_name])
+
+    def get_cached_choices(self) -> List[Choice]:
+        """
+        Возвращает варианты из кэша, один раз на версию данных модели.
+
+        Returns:
+            List[Choice]: Пары (pk, подпись).
+        """
+        key = get_choices_key(self.queryset.model)
+        if self._cached_choices[0] != key:
+            self._cached_choices = (
+                key, load_choices(self.queryset.model, key)
+            )
+        return self._cached_choices[1]
+
+    def count_cached_choices(self) -> int:
+        """
+        Возвращает число вариантов из кэша.
+
+        Returns:
+            int: Число объектов модели.
+        """
+        return count_choices(self.queryset.model,
+                             get_choices_key(self.queryset.model))
+
+    def get_selected_choices(self, values: List[str]) -> List[Choice]:
+        """
+        Загружает подписи выбранных объектов одним запросом по pk.
+
+        Используется виджетами больших списков, чтобы не читать из кэша
+        все варианты ради нескольких выбранных.
+
+        Args:
+            values: Выбранные значения из формы.
+
+        Returns:
+            List[Choice]: Пары (pk, подпись) существующих объектов.
+        """
+        pks = [value for value in values if str(value).isdigit()]
+        if not pks:
+            return []
+        return [(obj.pk, str(obj))
+                for obj in self.queryset.filter(pk__in=pks).order_by('pk')]
+
+
+class CachedModelChoiceField(CachedChoicesMixin, forms.ModelChoiceField):
+    """ModelChoiceField с вариантами из кэша."""
+
+    widget = RemoteChoicesSelect
+
+
+class CachedModelMultipleChoiceField(CachedChoicesMixin,
+                                     forms.ModelMultipleChoiceField):
+    """ModelMultipleChoiceField с вариантами из кэша."""
+
+    widget = RemoteChoicesSelectMultiple
+
+
+class CachedFilterChoiceField(CachedChoicesMixin,
+                              filter_fields.ModelChoiceField):
+    """Поле ModelChoiceFilter с вариантами из кэша."""
+
+    widget = RemoteChoicesSelect
+
+
+class CachedFilterMultipleChoiceField(
+    CachedChoicesMixin, filter_fields.ModelMultipleChoiceField
+):
+    """Поле ModelMultipleChoiceFilter с вариантами из кэша."""
+
+    widget = RemoteChoicesSelectMultiple
+
+
+class CachedModelChoiceFilter(filters.ModelChoiceFilter):
+    """ModelChoiceFilter с вариантами из кэша."""
+
+    field_class = CachedFilterChoiceField
+
+
+class CachedModelMultipleChoiceFilter(filters.ModelMultipleChoiceFilter):
+    """ModelMultipleChoiceFilter с вариантами из кэша."""
+
+    field_class = CachedFilterMultipleChoiceField
@@ -0,0 +1,14 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Очищает кэш перед каждым тестом.
+
+    Откат транзакции TestCase не отправляет сигналы моделей, поэтому без
+    очистки закэшированные списки одного теста были бы видны в другом.
+    """
+    cache.clear()
+    yield
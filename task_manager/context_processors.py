@@ -1,76 +1,101 @@
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from django.http import HttpRequest
-from django.utils.translation import gettext_lazy as _
+from django.utils import translation
+from django.utils.translation import gettext as _
 
+# Версия навигационной панели. Входит в ключ кэша отрендеренного фрагмента
+# в base.html, поэтому при изменении пунктов меню ее нужно увеличить.
+NAVBAR_VERSION = 1
 
-def navbar(request: HttpRequest) -> Dict[str, List[Dict[str, Any]]]:
+
+@dataclass(frozen=True)
+class NavbarItem:
+    """Ссылка навигационной панели."""
+
+    label: str
+    url: str
+    css_class: str = 'nav-link'
+    align: str = ''
+
+
+@lru_cache(maxsize=None)
+def get_navbar_items(
+    language: Optional[str], is_authenticated: bool
+) -> Tuple[NavbarItem, ...]:
+    """
+    Строит ссылки навигационной панели для языка и состояния входа.
+
+    Результат зависит только от аргументов, поэтому вычисляется один раз
+    для каждой пары и переиспользуется всеми запросами. Элементы
+    неизменяемые, так что общий результат нельзя испортить из запроса.
+
+    Args:
+        language: Код языка, на котором выводятся подписи.
+        is_authenticated: Авторизован ли пользователь.
+
+    Returns:
+        Tuple[NavbarItem, ...]: Элементы навигационной панели.
+    """
+    with translation.override(language):
+        navbar_items = [NavbarItem(_('Users'), '/users/')]
+        if is_authenticated:
+            navbar_items += [
+                NavbarItem(_('Statuses'), '/statuses/'),
+                NavbarItem(_('Labels'), '/labels/'),
+                NavbarItem(_('Tasks'), '/tasks/'),
+            ]
+        else:
+            navbar_items += [
+                NavbarItem(_('Login'), '/login/', 'nav-link ms-auto',
+                           'ms-auto'),
+                NavbarItem(_('Registration'), '/users/create/',
+                           'nav-link ms-auto'),
+            ]
+    return tuple(navbar_items)
+
+
+@lru_cache(maxsize=None)
+def get_welcome_label(language: Optional[str]) -> str:
+    """
+    Возвращает переведенное приветствие для языка.
+
+    Args:
+        language: Код языка.
+
+    Returns:
+        str: Приветствие без имени пользователя.
+    """
+    with translation.override(language):
+        return _('Welcome')
+
+
+def navbar(request: HttpRequest) -> Dict[str, Any]:
     """
     Предоставляет элементы навигационной панели.
 
-    Проверяет, авторизован ли пользователь, и возвращает соответствующие
-    элементы навигационной панели. Если пользователь авторизован, возвращает
-    ссылки на страницы пользователей, статусов, меток и задач. Если пользователь
-    не авторизован, возвращает ссылки на страницы входа и регистрации.
+    Ссылки для текущего языка и состояния входа берутся из кэша
+    get_navbar_items. Для авторизованного пользователя отдельно добавляется
+    приветствие: оно и форма выхода с CSRF-токеном рендерятся вне
+    кэшируемого фрагмента шаблона.
 
     Args:
         request: HTTP запрос от клиента.
 
     Returns:
-        Dict[str, List[Dict[str, Any]]]: Словарь, содержащий элементы
-            навигационной панели. Ключ 'navbar_items' содержит список словарей
-            с элементами навигации.
+        Dict[str, Any]: Словарь с ключами 'navbar_items' (ссылки),
+            'navbar_greeting' (приветствие или None) и 'navbar_version'
+            (версия для ключа кэша фрагмента).
     """
-    user = request.user
-    navbar_items = [{
-        'label': _('Users'),
-        'url': '/users/',
-        'class': 'nav-link',
-        'align': ''
-    }]
-    if request.user.is_authenticated:
-        navbar_items.append({
-            'label': _('Statuses'),
-            'url': '/statuses/',
-            'class': 'nav-link',
-            'align': ''
-        })
-        navbar_items.append({
-            'label': _('Labels'),
-            'url': '/labels/',
-            'class': 'nav-link',
-            'align': ''
-        })
-        navbar_items.append({
-            'label': _('Tasks'),
-            'url': '/tasks/',
-            'class': 'nav-link',
-            'align': ''
-        })
-        navbar_items.append({
-            'label': _('Welcome') + ', ' + user.username,
-            'class': 'nav-link',
-            'align': 'ms-auto'
-        })
-        navbar_items.append({
-            'label': _('Logout'),
-            'url': '/logout/',
-            'form': True,
-            'class': 'btn nav-link',
-            'align': ''
-        })
-    else:
-        navbar_items.append({
-            'label': _('Login'),
-            'url': '/login/',
-            'class': 'nav-link ms-auto',
-            'align': 'ms-auto'
-        })
-        navbar_items.append({
-            'label': _('Registration'),
-            'url': '/users/create/',
-            'class': 'nav-link ms-auto',
-            'align': ''
-        })
-
-    return {'navbar_items': navbar_items}
+    language = translation.get_language()
+    is_authenticated = request.user.is_authenticated
+    greeting = None
+    if is_authenticated:
+        greeting = f'{get_welcome_label(language)}, {request.user.username}'
+    return {
+        'navbar_items': get_navbar_items(language, is_authenticated),
+        'navbar_greeting': greeting,
+        'navbar_version': NAVBAR_VERSION,
+    }
@@ -0,0 +1,86 @@
+from importlib.util import find_spec
+from typing import Any, Dict, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+
+POSTGRESQL_ENGINE = 'django.db.backends.postgresql'
+POOL_MIN_SIZE = 2
+
+
+def is_pool_available() -> bool:
+    """
+    Проверяет, установлен ли драйвер, поддерживающий пул Django.
+
+    Встроенный пул соединений Django 5.1 работает только с psycopg 3 и
+    пакетом psycopg_pool (psycopg[pool]), с psycopg2 он недоступен.
+
+    Returns:
+        bool: True, если psycopg 3 и psycopg_pool установлены.
+    """
+    return find_spec('psycopg') is not None and (
+        find_spec('psycopg_pool') is not None
+    )
+
+
+def get_pool_options(
+    workers: int, max_connections: int, timeout: float
+) -> Dict[str, Any]:
+    """
+    Вычисляет параметры пула соединений одного процесса.
+
+    Каждый воркер gunicorn держит собственный пул, поэтому общий лимит
+    соединений делится на число воркеров.
+
+    Args:
+        workers: Число воркеров gunicorn (WEB_CONCURRENCY).
+        max_connections: Сколько соединений с базой данных может занять
+            приложение целиком.
+        timeout: Сколько секунд запрос ждет свободное соединение.
+
+    Returns:
+        Dict[str, Any]: Аргументы psycopg_pool.ConnectionPool.
+    """
+    max_size = max(max_connections // max(workers, 1), 1)
+    options: Dict[str, Any] = {
+        'min_size': min(POOL_MIN_SIZE, max_size),
+        'max_size': max_size,
+        'timeout': timeout,
+    }
+    if is_pool_available():
+        from psycopg_pool import ConnectionPool
+        # Проверка соединения перед выдачей из пула (аналог
+        # CONN_HEALTH_CHECKS для пула)
+        options['check'] = ConnectionPool.check_connection
+    return options
+
+
+def configure_pool(
+    database: Dict[str, Any], pool_options: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Включает пул соединений в настройках базы данных PostgreSQL.
+
+    Пул не совместим с постоянными соединениями, поэтому CONN_MAX_AGE
+    сбрасывается в 0: соединение возвращается в пул в конце запроса.
+    Для других СУБД настройки не меняются.
+
+    Args:
+        database: Настройки базы данных из dj_database_url.
+        pool_options: Параметры пула или None, если пул выключен.
+
+    Returns:
+        Dict[str, Any]: Настройки базы данных.
+
+    Raises:
+        ImproperlyConfigured: Если пул включен, а psycopg 3 с
+            psycopg_pool не установлены.
+    """
+    if pool_options is None or database.get('ENGINE') != POSTGRESQL_ENGINE:
+        return database
+    if not is_pool_available():
+        raise ImproperlyConfigured(
+            'DB_POOL requires psycopg[pool]; install it or set DB_POOL=False'
+        )
+    database['CONN_MAX_AGE'] = 0
+    database.setdefault('OPTIONS', {})['pool'] = pool_options
+    return database
@@ -0,0 +1,78 @@
+from typing import Any, Dict, Tuple
+
+from django.db import models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.backends.ddl_references import Statement, Table
+from django.db.models.functions import Collate
+
+
+class PrefixIndex(models.Index):
+    """
+    Индекс для поиска по началу значения без учета регистра.
+
+    Выражение зависит от СУБД: в PostgreSQL индекс строится по
+    UPPER(column::text) с varchar_pattern_ops (LIKE по префиксу при любой
+    локали), в SQLite - по column COLLATE NOCASE, в остальных СУБД - по
+    столбцу. Индекс объявляется в Meta.indexes, поэтому состояние
+    миграций знает о нем, и SQLite создает его заново при пересоздании
+    таблицы.
+    """
+
+    def __init__(self, *, field: str, name: str) -> None:
+        """
+        Args:
+            field: Имя поля модели.
+            name: Имя индекса.
+        """
+        self.field = field
+        super().__init__(fields=[field], name=name)
+
+    def deconstruct(self) -> Tuple[str, Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Описывает индекс для файлов миграций.
+
+        Returns:
+            Tuple[str, Tuple[Any, ...], Dict[str, Any]]: Путь к классу,
+                позиционные и именованные аргументы.
+        """
+        return (f'{self.__module__}.{self.__class__.__name__}', (),
+                {'field': self.field, 'name': self.name})
+
+    def create_sql(self, model: type, schema_editor: BaseDatabaseSchemaEditor,
+                   using: str = '', **kwargs: Any) -> Statement:
+        """
+        Строит CREATE INDEX с выражением для СУБД соединения.
+
+        В PostgreSQL класс операторов указывается после выражения, а не
+        через OpClass: без приложения django.contrib.postgres Django
+        заключил бы его в скобки вместе с выражением.
+
+        Args:
+            model: Модель индекса.
+            schema_editor: Редактор схемы.
+            using: Метод индекса.
+            **kwargs: Дополнительные аргументы Index.create_sql().
+
+        Returns:
+            Statement: Запрос создания индекса.
+        """
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            quote = schema_editor.quote_name
+            column = quote(model._meta.get_field(self.field).column)
+            return Statement(
+                schema_editor.sql_create_index,
+                table=Table(model._meta.db_table, quote),
+                name=quote(self.name),
+                using=using,
+                columns=f'UPPER({column}::text) varchar_pattern_ops',
+                extra='',
+                condition='',
+                include='',
+            )
+        if vendor == 'sqlite':
+            index = models.Index(Collate(self.field, 'NOCASE'),
+                                 name=self.name)
+            return index.create_sql(model, schema_editor, using=using,
+                                    **kwargs)
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:12
+
+import task_manager.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_label_updated_at'),
+    ]
+
+    operations = [
+        # Поиск по началу названия для /api/autocomplete/labels/:
+        # PostgreSQL - varchar_pattern_ops, SQLite - COLLATE NOCASE
+        migrations.AddIndex(
+            model_name='label',
+            index=task_manager.indexes.PrefixIndex(field='name', name='labels_label_name_prefix'),
+        ),
+    ]
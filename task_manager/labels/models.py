@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.indexes import PrefixIndex
+
 
 class Label(models.Model):
     """Модель метки задачи."""
@@ -9,6 +11,15 @@ class Label(models.Model):
         max_length=50, verbose_name=_('Name'), unique=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Метаданные модели."""
+
+        indexes = [
+            # Поиск по началу названия для /api/autocomplete/labels/
+            PrefixIndex(field='name', name='labels_label_name_prefix'),
+        ]
 
     def __str__(self) -> str:
         """
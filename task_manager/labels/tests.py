@@ -1,9 +1,13 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
 
 User = get_user_model()
 
@@ -167,3 +171,42 @@ class LabelsDeleteViewTest(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse('labels_index'))
         self.assertEqual(Label.objects.count(), 0)
+
+
+class LabelsDeleteQueryCountTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.label = Label.objects.create(name='Test label')
+        self.url = reverse('labels_delete', kwargs={'pk': self.label.pk})
+
+    def capture(self, method, url):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url)
+        return response, [query['sql'] for query in context]
+
+    def count_selects(self, queries, table):
+        return sum(
+            1 for sql in queries
+            if sql.startswith('SELECT') and f'FROM "{table}"' in sql
+        )
+
+    def test_get_loads_label_once(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_in_use_is_rejected_by_single_query(self):
+        status = Status.objects.create(name='Test status')
+        task = Task.objects.create(name='Task', description='', status=status,
+                                   author=self.user)
+        task.labels.add(self.label)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
+        self.assertRedirects(response, reverse('labels_index'))
+        self.assertTrue(Label.objects.filter(pk=self.label.pk).exists())
+
+    def test_post_loads_label_once(self):
+        response, queries = self.capture('post', self.url)
+        self.assertRedirects(response, reverse('labels_index'))
+        self.assertEqual(self.count_selects(queries, 'labels_label'), 1)
+        self.assertEqual(self.count_selects(queries, 'tasks_task'), 0)
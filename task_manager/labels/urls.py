@@ -3,7 +3,7 @@ from django.urls import path
 from task_manager.labels import views
 
 urlpatterns = [
-    path('', views.LabelListView.as_view(), name='labels_index'),
+    path('', views.AsyncLabelListView.as_view(), name='labels_index'),
     path('create/', views.LabelCreateView.as_view(), name='labels_create'),
     path(
         '<int:pk>/update/',
@@ -1,26 +1,34 @@
-from typing import Any
-
-from django.contrib import messages
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect
+from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
-from task_manager.base_views import (BaseListView,
+from task_manager.base_views import (AsyncListMixin,
+                                     BaseListView,
                                      BaseCreateView,
                                      BaseUpdateView,
                                      BaseDeleteView)
+from task_manager.mixins import ListFragmentCacheMixin
 from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
-from task_manager.tasks.models import Task
+
+User = get_user_model()
 
 
-class LabelListView(BaseListView):
+class LabelListView(ListFragmentCacheMixin, BaseListView):
     """Представление для отображения списка меток."""
 
     template_name = 'labels/list.html'
+    fragment_template_name = 'labels/table.html'
     model = Label
     context_object_name = 'labels'
+    # Пользователь входит в страницу через приветствие в навигации
+    conditional_models = (Label, User)
+
+
+class AsyncLabelListView(AsyncListMixin, LabelListView):
+    """Список меток, загружаемый асинхронным ORM."""
+
+    pass
 
 
 class LabelCreateView(BaseCreateView):
@@ -54,29 +62,5 @@ class LabelDeleteView(BaseDeleteView):
     success_url = reverse_lazy('labels_index')
     success_message = _('Label successfully deleted')
     protected_error_message = _('Cannot delete label because it is in use')
+    protected_relations = ('task',)
     delete_title = _('Deleting a label')
-
-    def post(
-        self, request: HttpRequest, *args: Any, **kwargs: Any
-    ) -> HttpResponse:
-        """
-        Обрабатывает запрос POST на удаление метки.
-
-        Проверяет, используется ли метка в задачах, и если да,
-        показывает сообщение об ошибке вместо удаления.
-
-        Args:
-            request: HTTP запрос от клиента.
-            *args: Дополнительные позиционные аргументы.
-            **kwargs: Дополнительные именованные аргументы.
-
-        Returns:
-            HttpResponse: Ответ от родительского метода или редирект
-                при использовании метки в задачах.
-        """
-        label = self.get_object()
-        # Проверяем, используется ли метка в задачах
-        if Task.objects.filter(labels=label).exists():
-            messages.error(request, self.protected_error_message)
-            return redirect(self.success_url)
-        return super().post(request, *args, **kwargs)
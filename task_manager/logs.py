@@ -0,0 +1,216 @@
+import copy
+import itertools
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Sequence
+
+# Атрибуты LogRecord, которые не считаются пользовательскими (extra)
+RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord(
+    '', logging.INFO, '', 0, '', None, None
+))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Форматирует запись лога в одну строку JSON.
+
+    Кроме стандартных полей в запись попадают значения, переданные через
+    extra; объекты, которые не сериализуются в JSON, выводятся через str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Преобразует запись в JSON.
+
+        Args:
+            record: Запись лога.
+
+        Returns:
+            str: Строка JSON без перевода строки.
+        """
+        data: Dict[str, Any] = {
+            'time': datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            'process': record.process,
+            'thread': record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        for name, value in vars(record).items():
+            if name not in RECORD_ATTRIBUTES and name not in data:
+                data[name] = value
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускает только долю записей шумных логгеров.
+
+    rates задает долю для логгера и всех его потомков, например
+    {'django.db.backends': 0.01} оставляет каждую сотую запись о
+    SQL-запросах. Записи WARNING и выше пропускаются всегда. Оставленной
+    записи добавляется атрибут sample_rate, чтобы при анализе логов можно
+    было восстановить исходное число записей.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        """
+        Args:
+            rates: Доля пропускаемых записей (от 0 до 1) по имени логгера.
+        """
+        super().__init__()
+        # Длинные префиксы проверяются первыми: побеждает самый точный
+        self.rates = sorted(dict(rates).items(), key=lambda item: -len(item[0]))
+        self.counters = {name: itertools.count() for name, _rate in self.rates}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Решает, оставить ли запись.
+
+        Args:
+            record: Запись лога.
+
+        Returns:
+            bool: True, если запись нужно записать.
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        for name, rate in self.rates:
+            if record.name == name or record.name.startswith(name + '.'):
+                return self.sample(record, name, rate)
+        return True
+
+    def sample(self, record: logging.LogRecord, name: str,
+               rate: float) -> bool:
+        """
+        Оставляет каждую round(1 / rate)-ю запись логгера.
+
+        Args:
+            record: Запись лога.
+            name: Логгер из rates, к которому относится запись.
+            rate: Доля пропускаемых записей.
+
+        Returns:
+            bool: True, если запись нужно записать.
+        """
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        if next(self.counters[name]) % round(1 / rate):
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener, который при остановке ждет места в полной очереди."""
+
+    def enqueue_sentinel(self) -> None:
+        """Ставит в очередь признак остановки, дожидаясь места."""
+        self.queue.put(self._sentinel)
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    Передает записи лога в фоновый поток, который пишет их в handlers.
+
+    Вызов логгера в запросе только кладет запись в ограниченную очередь,
+    форматирование и запись на диск выполняет QueueListener. Если очередь
+    заполнена, запись теряется, а не задерживает запрос; число потерь
+    хранится в dropped.
+
+    В dictConfig обработчики передаются ссылками 'cfg://handlers.<имя>'.
+    dictConfig создает обработчики в алфавитном порядке имен, поэтому имя
+    этого обработчика должно быть больше имен целевых.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler],
+                 queue_size: int = 10000) -> None:
+        """
+        Args:
+            handlers: Обработчики, в которые пишет фоновый поток.
+            queue_size: Наибольшее число записей в очереди.
+
+        Raises:
+            TypeError: Если обработчик еще не создан dictConfig.
+        """
+        super().__init__(queue.Queue(queue_size))
+        # Элементы ConvertingList dictConfig разрешаются при обращении
+        # по индексу, а не при итерации
+        targets: List[logging.Handler] = [
+            handlers[index] for index in range(len(handlers))
+        ]
+        for target in targets:
+            if not isinstance(target, logging.Handler):
+                raise TypeError(
+                    f'Expected a configured handler, got {target!r}'
+                )
+        self.dropped = 0
+        self.listener = DrainingQueueListener(self.queue, *targets,
+                                              respect_handler_level=True)
+        self.listener.start()
+        self.listening = True
+
+    def close(self) -> None:
+        """
+        Дожидается записи очереди и останавливает фоновый поток.
+
+        logging.shutdown() при выходе из процесса закрывает обработчики в
+        порядке, обратном созданию, поэтому очередь успевает записаться до
+        закрытия целевых обработчиков.
+        """
+        if self.listening:
+            self.listening = False
+            self.listener.stop()
+        super().close()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Готовит копию записи к передаче в другой поток.
+
+        В отличие от QueueHandler.prepare() сообщение не форматируется
+        целиком: подставляются только аргументы, а трассировка исключения
+        сохраняется отдельно в exc_text, чтобы форматтеры фонового потока
+        получили структурированную запись.
+
+        Args:
+            record: Запись лога.
+
+        Returns:
+            logging.LogRecord: Копия записи без ссылок на аргументы и
+                объект исключения.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Кладет запись в очередь, не блокируя вызывающий поток.
+
+        Args:
+            record: Подготовленная запись.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
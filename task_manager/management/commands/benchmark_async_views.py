@@ -0,0 +1,132 @@
+import asyncio
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import AsyncClient, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+
+
+def sync_urlpatterns(patterns: List[Any]) -> List[Any]:
+    """
+    Заменяет асинхронные представления их синхронными родителями.
+
+    Асинхронные варианты объявлены как Async<View>(AsyncMixin, <View>),
+    поэтому синхронное представление - последний базовый класс.
+
+    Args:
+        patterns: Маршруты URLconf.
+
+    Returns:
+        List[Any]: Маршруты с синхронными представлениями.
+    """
+    result = []
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            entry = URLResolver(
+                entry.pattern, sync_urlpatterns(entry.url_patterns),
+                entry.default_kwargs, entry.app_name, entry.namespace,
+            )
+        elif getattr(getattr(entry.callback, 'view_class', None),
+                     'view_is_async', False):
+            view_class = entry.callback.view_class.__bases__[-1]
+            entry = URLPattern(
+                entry.pattern,
+                view_class.as_view(**entry.callback.view_initkwargs),
+                entry.default_args, entry.name,
+            )
+        result.append(entry)
+    return result
+
+
+class Command(BaseCommand):
+    """Сравнивает синхронные и асинхронные страницы просмотра под ASGI."""
+
+    help = (
+        'Runs concurrent requests through the ASGI handler against the read '
+        'views and their sync variants, reports requests per second and '
+        'the 95th percentile latency'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--url', default='/tasks/',
+            help='Page to request',
+        )
+        parser.add_argument(
+            '--requests', type=int, default=200,
+            help='Requests per variant',
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=20,
+            help='Requests in flight at once, like clients of one worker',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Замеряет страницу с синхронными и асинхронными представлениями.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        user = get_user_model().objects.order_by('pk').first()
+        self.stdout.write(
+            f'URL: {options["url"]}, requests: {options["requests"]}, '
+            f'concurrency: {options["concurrency"]}'
+        )
+        urlconf = ModuleType('sync_read_urls')
+        urlconf.urlpatterns = sync_urlpatterns(
+            get_resolver(settings.ROOT_URLCONF).url_patterns
+        )
+        for label, root_urlconf in (('sync views', urlconf),
+                                    ('async views', settings.ROOT_URLCONF)):
+            with override_settings(ROOT_URLCONF=root_urlconf):
+                stats = asyncio.run(self.measure(user, options))
+            self.stdout.write(
+                f'{label:<12} {stats["rate"]:>10.1f} req/s '
+                f'p95 {stats["p95"]:>8.1f}ms'
+            )
+
+    async def measure(
+        self, user: Optional[Any], options: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """
+        Выполняет запросы конкурентными клиентами.
+
+        Args:
+            user: Пользователь, от имени которого выполняются запросы.
+            options: Опции команды.
+
+        Returns:
+            Dict[str, float]: Запросов в секунду ('rate') и 95-й
+                перцентиль времени ответа в миллисекундах ('p95').
+        """
+        concurrency = max(options['concurrency'], 1)
+        per_client = max(options['requests'] // concurrency, 1)
+        client = AsyncClient()
+        if user is not None:
+            await client.aforce_login(user)
+        latencies: List[float] = []
+
+        async def run_client() -> None:
+            for _request in range(per_client):
+                started = time.perf_counter()
+                await client.get(options['url'])
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run_client() for _client in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+        return {'rate': len(latencies) / elapsed, 'p95': p95 * 1000}
@@ -0,0 +1,169 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections, connection, connections
+from django.test import Client
+
+from task_manager.database import (POSTGRESQL_ENGINE,
+                                   get_pool_options,
+                                   is_pool_available)
+
+PERSISTENT_MAX_AGE = 600
+
+
+class Command(BaseCommand):
+    """Сравнивает пропускную способность с пулом соединений и без него."""
+
+    help = (
+        'Measures requests per second for a page with a new connection per '
+        'request, persistent connections and the connection pool '
+        '(PostgreSQL with psycopg[pool] only)'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--url', default='/statuses/',
+            help='Page to request',
+        )
+        parser.add_argument(
+            '--requests', type=int, default=200,
+            help='Requests per variant',
+        )
+        parser.add_argument(
+            '--threads', type=int, default=1,
+            help='Concurrent clients, like threads of an ASGI worker',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Выполняет запросы к странице для каждого варианта соединений.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        user = get_user_model().objects.order_by('pk').first()
+        self.stdout.write(
+            f'Database: {connection.vendor}, URL: {options["url"]}, '
+            f'requests: {options["requests"]}, threads: {options["threads"]}'
+        )
+        original = dict(connection.settings_dict)
+        try:
+            for label, overrides in self.variants():
+                if overrides is None:
+                    self.stdout.write(f'{label:<28} skipped')
+                    continue
+                self.configure(original, overrides)
+                rate = self.measure(user, options)
+                self.stdout.write(f'{label:<28} {rate:>10.1f} req/s')
+        finally:
+            self.configure(original, {})
+
+    def variants(self) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Перебирает варианты настроек соединения.
+
+        Yields:
+            Tuple[str, Optional[Dict[str, Any]]]: Название варианта и
+                изменения настроек базы данных (None - вариант недоступен).
+        """
+        no_pool = {'OPTIONS': self.options_without_pool()}
+        yield 'new connection per request', {**no_pool, 'CONN_MAX_AGE': 0}
+        yield 'persistent connections', {
+            **no_pool, 'CONN_MAX_AGE': PERSISTENT_MAX_AGE,
+        }
+        if (connection.settings_dict['ENGINE'] != POSTGRESQL_ENGINE
+                or not is_pool_available()):
+            yield 'connection pool', None
+            return
+        pool = get_pool_options(settings.WEB_CONCURRENCY,
+                                settings.DB_MAX_CONNECTIONS,
+                                settings.DB_POOL_TIMEOUT)
+        yield f'connection pool ({pool["max_size"]})', {
+            'OPTIONS': {**no_pool['OPTIONS'], 'pool': pool},
+            'CONN_MAX_AGE': 0,
+        }
+
+    @staticmethod
+    def options_without_pool() -> Dict[str, Any]:
+        """Возвращает OPTIONS базы данных без параметров пула."""
+        options = dict(connection.settings_dict.get('OPTIONS', {}))
+        options.pop('pool', None)
+        return options
+
+    @staticmethod
+    def configure(original: Dict[str, Any], overrides: Dict[str, Any]) -> None:
+        """
+        Применяет настройки соединения для всех потоков.
+
+        Словарь настроек общий для соединений всех потоков, поэтому он
+        меняется на месте, а открытые соединения и пул закрываются.
+
+        Args:
+            original: Исходные настройки базы данных.
+            overrides: Изменения для варианта.
+        """
+        connections.close_all()
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+        connection.settings_dict.clear()
+        connection.settings_dict.update({**original, **overrides})
+
+    def measure(self, user: Any, options: Dict[str, Any]) -> float:
+        """
+        Замеряет число запросов в секунду.
+
+        Args:
+            user: Пользователь, от имени которого выполняются запросы.
+            options: Опции команды.
+
+        Returns:
+            float: Запросов в секунду.
+        """
+        threads = max(options['threads'], 1)
+        per_thread = max(options['requests'] // threads, 1)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [
+                executor.submit(self.run_client, user, options['url'],
+                                per_thread)
+                for _thread in range(threads)
+            ]
+            for future in futures:
+                future.result()
+        return per_thread * threads / (time.perf_counter() - started)
+
+    @staticmethod
+    def run_client(user: Any, url: str, count: int) -> None:
+        """
+        Выполняет запросы одним клиентом.
+
+        Тестовый клиент не закрывает соединения по сигналам запроса, поэтому
+        close_old_connections вызывается явно, как это делает обработчик
+        запросов Django.
+
+        Args:
+            user: Пользователь для входа или None.
+            url: Адрес страницы.
+            count: Количество запросов.
+        """
+        client = Client()
+        if user is not None:
+            client.force_login(user)
+        try:
+            for _request in range(count):
+                close_old_connections()
+                client.get(url)
+                close_old_connections()
+        finally:
+            connections.close_all()
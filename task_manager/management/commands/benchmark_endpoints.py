@@ -0,0 +1,190 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from task_manager.benchmarks import (CLIENTS,
+                                     SEED_SIZES,
+                                     BenchmarkFixtures,
+                                     EndpointBenchmark,
+                                     build_report,
+                                     compare_reports,
+                                     get_endpoints,
+                                     seed_data)
+from task_manager.tasks.models import Task
+
+
+class Command(BaseCommand):
+    """Замеряет время, SQL-запросы и память всех страниц приложения."""
+
+    help = (
+        'Seeds a throwaway test database and measures latency percentiles, '
+        'queries per request and peak memory of every URL through the WSGI '
+        'and ASGI test clients; writes the results as JSON'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--size', choices=SEED_SIZES, default='1k',
+            help='Number of seeded tasks',
+        )
+        parser.add_argument(
+            '--keepdb', action='store_true',
+            help='Keep the seeded test database for the next run',
+        )
+        parser.add_argument(
+            '--current-db', action='store_true',
+            help='Measure the configured database as is, without seeding',
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Measured requests per URL and client',
+        )
+        parser.add_argument(
+            '--client', action='append', choices=CLIENTS, dest='clients',
+            help='Client to measure with (both by default)',
+        )
+        parser.add_argument(
+            '--endpoint', action='append', dest='endpoints',
+            help='URL name to measure (all by default)',
+        )
+        parser.add_argument(
+            '--output',
+            help='JSON file for the results '
+                 '(benchmark-<size>-<commit>.json by default)',
+        )
+        parser.add_argument(
+            '--compare',
+            help='JSON file of an earlier run to compare with',
+        )
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Relative p95 growth reported as a regression',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Замеряет страницы и сохраняет отчет.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        if options['current_db']:
+            report = self.measure(options)
+        else:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, keepdb=options['keepdb'],
+                serialize=False,
+            )
+            try:
+                self.seed(SEED_SIZES[options['size']])
+                report = self.measure(options)
+            finally:
+                connection.creation.destroy_test_db(
+                    old_name, verbosity=0, keepdb=options['keepdb']
+                )
+        output = Path(options['output'] or (
+            f'benchmark-{options["size"]}-'
+            f'{(report["commit"] or "worktree")[:12]}.json'
+        ))
+        output.write_text(json.dumps(report, indent=2))
+        self.write_results(report['results'])
+        self.stdout.write(f'Results written to {output}')
+        if options['compare']:
+            self.write_comparison(options['compare'], report,
+                                  options['threshold'])
+
+    def seed(self, tasks: int) -> None:
+        """
+        Заполняет пустую тестовую базу.
+
+        Args:
+            tasks: Число задач.
+
+        Raises:
+            CommandError: Если сохраненная база другого размера.
+        """
+        existing = Task.objects.count()
+        if existing == tasks:
+            return
+        if existing:
+            raise CommandError(
+                f'The kept test database holds {existing} tasks, '
+                'run without --keepdb to reseed it'
+            )
+        self.stdout.write(f'Seeding {tasks} tasks...')
+        seed_data(tasks)
+
+    def measure(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Замеряет выбранные страницы.
+
+        Args:
+            options: Опции команды.
+
+        Returns:
+            Dict[str, Any]: Отчет build_report().
+
+        Raises:
+            CommandError: Если не найден ни один маршрут.
+        """
+        endpoints = get_endpoints(options['endpoints'])
+        if not endpoints:
+            raise CommandError('No matching URLs')
+        benchmark = EndpointBenchmark(BenchmarkFixtures.create(),
+                                      options['repeat'])
+        results = benchmark.run(endpoints, options['clients'] or CLIENTS)
+        return build_report(results, {
+            name: options[name]
+            for name in ('size', 'current_db', 'repeat', 'clients',
+                         'endpoints')
+        })
+
+    def write_results(self, results: List[Dict[str, Any]]) -> None:
+        """Печатает таблицу результатов."""
+        self.stdout.write(
+            f'{"client":<6} {"method":<6} {"endpoint":<18} {"status":<8} '
+            f'{"p50":>8} {"p95":>8} {"p99":>8} {"queries":>7} {"KiB":>8}'
+        )
+        for result in results:
+            latency = result['latency_ms']
+            statuses = ','.join(map(str, result['statuses']))
+            self.stdout.write(
+                f'{result["client"]:<6} {result["method"]:<6} '
+                f'{result["endpoint"]:<18} {statuses:<8} '
+                f'{latency["p50"]:>8.2f} {latency["p95"]:>8.2f} '
+                f'{latency["p99"]:>8.2f} {result["queries"]:>7} '
+                f'{result["memory_kib"]:>8.1f}'
+            )
+
+    def write_comparison(self, path: str, report: Dict[str, Any],
+                         threshold: float) -> None:
+        """
+        Печатает изменения p95 и числа SQL-запросов с прежним отчетом.
+
+        Args:
+            path: Файл прежнего отчета.
+            report: Новый отчет.
+            threshold: Допустимый относительный рост p95.
+        """
+        previous = json.loads(Path(path).read_text())
+        self.stdout.write(
+            f'Compared with {(previous["commit"] or "unknown")[:12]}:'
+        )
+        rows = compare_reports(previous, report, threshold)
+        for name, old_p95, new_p95, old_queries, new_queries, bad in rows:
+            line = (f'{name:<32} p95 {old_p95:>8.2f} -> {new_p95:>8.2f}ms '
+                    f'queries {old_queries} -> {new_queries}')
+            self.stdout.write(self.style.ERROR(line) if bad else line)
+        regressions = sum(row[-1] for row in rows)
+        self.stdout.write(f'Regressions: {regressions}')
@@ -0,0 +1,122 @@
+import logging
+import tempfile
+import time
+from logging.handlers import WatchedFileHandler
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from task_manager.logs import (JsonFormatter,
+                               QueueListenerHandler,
+                               SamplingFilter)
+
+PLAIN_FORMAT = '%(asctime)s %(name)-12s %(levelname)-8s %(message)s'
+
+
+class Command(BaseCommand):
+    """Замеряет время, которое логирование отнимает у запроса."""
+
+    help = (
+        'Compares the per-request cost of logging through a blocking '
+        'FileHandler and through the queue with JSON records, rotation '
+        'and sampling'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--requests', type=int, default=2000,
+            help='Simulated requests per variant',
+        )
+        parser.add_argument(
+            '--queries', type=int, default=20,
+            help='SQL query records (django.db.backends) per request',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Печатает время логирования одного запроса для каждого варианта.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        self.stdout.write(
+            f'Requests: {options["requests"]}, '
+            f'query records per request: {options["queries"]}'
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            for label, handler in (
+                ('file handler', self.file_handler(directory)),
+                ('queue + json + sampling', self.queue_handler(directory)),
+            ):
+                per_request, drained = self.measure(label, handler, options)
+                self.stdout.write(
+                    f'{label:<24} {per_request:>8.1f}us/request '
+                    f'(written in {drained:.2f}s)'
+                )
+
+    @staticmethod
+    def file_handler(directory: str) -> logging.Handler:
+        """Прежняя схема: запись в файл в потоке запроса."""
+        handler = logging.FileHandler(Path(directory) / 'file.log')
+        handler.setFormatter(logging.Formatter(PLAIN_FORMAT))
+        return handler
+
+    @staticmethod
+    def queue_handler(directory: str) -> logging.Handler:
+        """Схема из settings.LOGGING с файлом во временном каталоге."""
+        target = WatchedFileHandler(Path(directory) / 'queue.log',
+                                    encoding='utf-8')
+        target.setFormatter(JsonFormatter())
+        handler = QueueListenerHandler([target], settings.LOG_QUEUE_SIZE)
+        handler.addFilter(SamplingFilter({
+            f'{__name__}.queue + json + sampling.db':
+                settings.LOG_SAMPLE_RATES['django.db.backends'],
+        }))
+        return handler
+
+    def measure(
+        self, label: str, handler: logging.Handler, options: Dict[str, Any]
+    ) -> Tuple[float, float]:
+        """
+        Логирует запросы и замеряет время вызовов логгера.
+
+        Args:
+            label: Название варианта, часть имени логгера.
+            handler: Обработчик варианта.
+            options: Опции команды.
+
+        Returns:
+            Tuple[float, float]: Микросекунд логирования на запрос и
+                секунд до окончания записи на диск.
+        """
+        logger = logging.getLogger(f'{__name__}.{label}')
+        db_logger = logging.getLogger(f'{__name__}.{label}.db')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        try:
+            started = time.perf_counter()
+            for number in range(options['requests']):
+                logger.info('GET /tasks/ %d', number)
+                for query in range(options['queries']):
+                    db_logger.debug(
+                        '(0.001) SELECT * FROM tasks_task WHERE id = %s',
+                        query, extra={'duration': 0.001},
+                    )
+            elapsed = time.perf_counter() - started
+            # Закрытие обработчика очереди ждет записи всех записей
+            handler.close()
+            drained = time.perf_counter() - started
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        return elapsed / max(options['requests'], 1) * 1e6, drained
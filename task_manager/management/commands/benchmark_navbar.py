@@ -0,0 +1,164 @@
+import time
+from typing import Any, Callable, Dict, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandParser
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.test import RequestFactory
+from django.utils import translation
+from django.utils.translation import gettext_lazy
+
+from task_manager.context_processors import navbar
+
+# Разметка панели до кэширования: все пункты, включая приветствие и форму
+# выхода, строились и рендерились в каждом запросе
+PER_REQUEST_TEMPLATE = Template('''{% load i18n %}
+<nav class="navbar navbar-expand-lg navbar-light bg-light mx-md-3">
+ <a class="navbar-brand" href="/">{% trans "Task manager" %}</a>
+ {% for item in navbar_items %}
+   <div class="navbar-nav {{ item.align }}">
+     {% if item.form %}
+       <form action="{{ item.url }}" method="post">
+         {% csrf_token %}
+         <input class="btn nav-link" type="submit" value="{{ item.label }}">
+       </form>
+     {% else %}
+       <div class="nav-item">
+         {% if item.url %}
+           <a class="{{ item.class }}" href="{{ item.url }}">{{ item.label }}</a>
+         {% else %}
+           <span class="{{ item.class }}">{{ item.label }}</span>
+         {% endif %}
+       </div>
+     {% endif %}
+   </div>
+ {% endfor %}
+</nav>''')
+
+
+def per_request_navbar(request: HttpRequest) -> Dict[str, Any]:
+    """
+    Контекстный процессор панели до кэширования (для сравнения).
+
+    Args:
+        request: HTTP запрос.
+
+    Returns:
+        Dict[str, Any]: Словарь с ключом 'navbar_items'.
+    """
+    links = [('Users', '/users/')]
+    if request.user.is_authenticated:
+        links += [('Statuses', '/statuses/'), ('Labels', '/labels/'),
+                  ('Tasks', '/tasks/')]
+    navbar_items: List[Dict[str, Any]] = [
+        {'label': gettext_lazy(label), 'url': url, 'class': 'nav-link',
+         'align': ''}
+        for label, url in links
+    ]
+    if request.user.is_authenticated:
+        navbar_items += [
+            {'label': gettext_lazy('Welcome') + ', ' + request.user.username,
+             'class': 'nav-link', 'align': 'ms-auto'},
+            {'label': gettext_lazy('Logout'), 'url': '/logout/',
+             'form': True, 'class': 'btn nav-link', 'align': ''},
+        ]
+    else:
+        navbar_items += [
+            {'label': gettext_lazy('Login'), 'url': '/login/',
+             'class': 'nav-link ms-auto', 'align': 'ms-auto'},
+            {'label': gettext_lazy('Registration'), 'url': '/users/create/',
+             'class': 'nav-link ms-auto', 'align': ''},
+        ]
+    return {'navbar_items': navbar_items}
+
+
+class Command(BaseCommand):
+    """Замеряет рендеринг навигационной панели до и после кэширования."""
+
+    help = (
+        'Compares the time to build and render the navigation bar per '
+        'request with the cached items and HTML fragment of navbar.html'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--renders', type=int, default=5000,
+            help='Renders per variant',
+        )
+        parser.add_argument(
+            '--language', default='ru',
+            help='Language of the labels',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Печатает время одного рендеринга для пользователя и гостя.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        user = get_user_model().objects.order_by('pk').first()
+        cached_template = get_template('navbar.html').template
+        variants = (
+            ('per request', PER_REQUEST_TEMPLATE, per_request_navbar),
+            ('cached', cached_template, navbar),
+        )
+        self.stdout.write(f'Renders: {options["renders"]}, '
+                          f'language: {options["language"]}')
+        for visitor in (user, AnonymousUser()):
+            if visitor is None:
+                continue
+            request = RequestFactory().get('/')
+            request.user = visitor
+            for label, template, processor in variants:
+                per_render = self.measure(template, processor, request,
+                                          options)
+                self.stdout.write(
+                    f'{label:<12} {self.visitor_label(visitor):<10} '
+                    f'{per_render:>8.1f}us/render'
+                )
+
+    @staticmethod
+    def visitor_label(user: Any) -> str:
+        """Подпись состояния входа."""
+        return 'user' if user.is_authenticated else 'anonymous'
+
+    @staticmethod
+    def measure(template: Template,
+                processor: Callable[[HttpRequest], Dict[str, Any]],
+                request: HttpRequest, options: Dict[str, Any]) -> float:
+        """
+        Рендерит панель после одного прогревочного рендеринга.
+
+        Args:
+            template: Шаблон панели.
+            processor: Контекстный процессор панели.
+            request: Запрос с пользователем.
+            options: Опции команды.
+
+        Returns:
+            float: Микросекунд на рендеринг.
+        """
+        renders = max(options['renders'], 1)
+        # Контекст собирается явно: процессоры из настроек одинаковы для
+        # обоих вариантов и не замеряются
+        base = {'request': request, 'user': request.user,
+                'csrf_token': get_token(request)}
+        with translation.override(options['language']):
+            template.render(Context({**base, **processor(request)}))
+            started = time.perf_counter()
+            for _render in range(renders):
+                template.render(Context({**base, **processor(request)}))
+            elapsed = time.perf_counter() - started
+        return elapsed / renders * 1e6
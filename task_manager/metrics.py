@@ -0,0 +1,104 @@
+import os
+from typing import Optional, Tuple
+
+# Каталог файлов метрик, общий для воркеров gunicorn. Должен быть задан
+# в окружении до импорта prometheus_client
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+if os.environ.get(MULTIPROCESS_DIR_ENV):
+    os.makedirs(os.environ[MULTIPROCESS_DIR_ENV], exist_ok=True)
+
+from prometheus_client import (CONTENT_TYPE_LATEST,  # noqa: E402
+                               REGISTRY,
+                               CollectorRegistry,
+                               Counter,
+                               Histogram,
+                               generate_latest,
+                               multiprocess)
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request processing time by URL name',
+    ['view', 'method'],
+)
+REQUESTS = Counter(
+    'http_requests_total',
+    'Requests by URL name and response status',
+    ['view', 'method', 'status'],
+)
+DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Database queries per sampled request by URL name',
+    ['view'],
+    buckets=QUERY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    'list_fragment_cache_requests_total',
+    'List fragment cache lookups by fragment and result',
+    ['fragment', 'result'],
+)
+PROTECTED_DELETES = Counter(
+    'protected_delete_rejections_total',
+    'Deletions rejected because the object is in use',
+    ['model'],
+)
+
+
+def observe_request(view: Optional[str], method: str, status: int,
+                    duration: float, queries: Optional[int]) -> None:
+    """
+    Учитывает обработанный запрос.
+
+    Args:
+        view: Имя URL или None, если маршрут не найден.
+        method: HTTP метод.
+        status: Код ответа.
+        duration: Время обработки в секундах.
+        queries: Число SQL-запросов или None, если запрос не попал в
+            выборку PerformanceMiddleware.
+    """
+    view = view or 'unresolved'
+    REQUEST_LATENCY.labels(view, method).observe(duration)
+    REQUESTS.labels(view, method, str(status)).inc()
+    if queries is not None:
+        DB_QUERIES.labels(view).observe(queries)
+
+
+def observe_cache_lookup(fragment: str, hit: bool) -> None:
+    """
+    Учитывает обращение к кэшу фрагментов списков.
+
+    Args:
+        fragment: Имя шаблона фрагмента.
+        hit: True, если фрагмент найден в кэше.
+    """
+    CACHE_REQUESTS.labels(fragment, 'hit' if hit else 'miss').inc()
+
+
+def observe_protected_delete(model_label: str) -> None:
+    """
+    Учитывает отклоненное удаление используемого объекта.
+
+    Args:
+        model_label: Метка модели в формате 'app_label.ModelName'.
+    """
+    PROTECTED_DELETES.labels(model_label).inc()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Формирует ответ в текстовом формате Prometheus.
+
+    Если задан PROMETHEUS_MULTIPROC_DIR, значения всех воркеров
+    читаются из файлов каталога и суммируются, иначе выводятся значения
+    текущего процесса.
+
+    Returns:
+        Tuple[bytes, str]: Тело ответа и Content-Type.
+    """
+    registry = REGISTRY
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,12 +1,19 @@
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import ProtectedError
+from django.db.models import Exists, OuterRef, ProtectedError, QuerySet
 from django.http import HttpRequest, HttpResponse
+from django.core.cache import cache
 from django.shortcuts import redirect
+from django.template.loader import render_to_string
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
+from task_manager import metrics
+from task_manager.cache import get_fragment_timeout, make_fragment_key
+from task_manager.pagination import CursorPage, CursorPaginator
+
 
 class AuthAndProfileOwnershipMixin(UserPassesTestMixin):
     """Миксин для проверки прав доступа к профилю пользователя."""
@@ -42,12 +49,62 @@ class ProtectedErrorHandlerMixin:
     """
     Миксин для обработки ошибок ProtectedError при удалении объектов.
 
+    Если задан protected_relations, признак использования объекта
+    вычисляется подзапросами EXISTS в том же запросе, которым загружается
+    объект, и удаление используемого объекта отклоняется без обращения
+    к коллектору удаления. ProtectedError по-прежнему обрабатывается для
+    связей, не перечисленных в protected_relations.
+
     Требует обязательного определения success_url в дочерних классах.
     """
 
     protected_error_message = _(
         'Cannot delete this object because it is in use'
     )
+    # Имена обратных связей модели, наличие которых запрещает удаление
+    protected_relations: Tuple[str, ...] = ()
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Добавляет к QuerySet аннотацию in_use по protected_relations.
+
+        Returns:
+            QuerySet: QuerySet объектов с признаком использования.
+        """
+        queryset = super().get_queryset()  # noqa
+        if not self.protected_relations:
+            return queryset
+        usage = [self.get_usage_subquery(queryset.model, name)
+                 for name in self.protected_relations]
+        condition = usage[0]
+        for subquery in usage[1:]:
+            condition |= subquery
+        return queryset.annotate(in_use=condition)
+
+    @staticmethod
+    def get_usage_subquery(model: type, relation_name: str) -> Exists:
+        """
+        Строит подзапрос EXISTS для обратной связи модели.
+
+        Для связи многие-ко-многим подзапрос обращается только
+        к промежуточной таблице.
+
+        Args:
+            model: Модель удаляемого объекта.
+            relation_name: Имя обратной связи.
+
+        Returns:
+            Exists: Подзапрос, истинный при наличии связанных строк.
+        """
+        relation = model._meta.get_field(relation_name)
+        field = relation.field
+        if field.many_to_many:
+            through = field.remote_field.through
+            lookup = field.m2m_reverse_field_name()
+            return Exists(through.objects.filter(**{lookup: OuterRef('pk')}))
+        return Exists(
+            field.model.objects.filter(**{field.name: OuterRef('pk')})
+        )
 
     def post(
         self, request: HttpRequest, *args: Any, **kwargs: Any
@@ -55,8 +112,8 @@ class ProtectedErrorHandlerMixin:
         """
         Обрабатывает запрос POST с обработкой ProtectedError.
 
-        При возникновении ProtectedError показывает сообщение об ошибке
-        и перенаправляет на success_url.
+        Если объект используется или при удалении возникает ProtectedError,
+        показывает сообщение об ошибке и перенаправляет на success_url.
 
         Args:
             request: HTTP запрос от клиента.
@@ -65,19 +122,197 @@ class ProtectedErrorHandlerMixin:
 
         Returns:
             HttpResponse: Ответ от родительского метода или редирект
-                при возникновении ProtectedError.
+                при попытке удалить используемый объект.
 
         Raises:
             AttributeError: Если success_url не определен в классе.
         """
+        if getattr(self.get_object(), 'in_use', False):  # noqa
+            return self.handle_protected_error(request)
         try:
             return super().post(request, *args, **kwargs)  # noqa
         except ProtectedError:
-            messages.error(request, self.protected_error_message)
-            # success_url должен быть определен в дочернем классе
-            if not hasattr(self, 'success_url') or self.success_url is None:
-                raise AttributeError(
-                    'success_url должен быть определен в классе, '
-                    'использующем ProtectedErrorHandlerMixin'
-                )
-            return redirect(self.success_url)
+            return self.handle_protected_error(request)
+
+    def handle_protected_error(self, request: HttpRequest) -> HttpResponse:
+        """
+        Показывает сообщение о запрете удаления и перенаправляет на список.
+
+        Args:
+            request: HTTP запрос от клиента.
+
+        Returns:
+            HttpResponse: Редирект на success_url.
+
+        Raises:
+            AttributeError: Если success_url не определен в классе.
+        """
+        messages.error(request, self.protected_error_message)
+        metrics.observe_protected_delete(self.model._meta.label)
+        # success_url должен быть определен в дочернем классе
+        if not hasattr(self, 'success_url') or self.success_url is None:
+            raise AttributeError(
+                'success_url должен быть определен в классе, '
+                'использующем ProtectedErrorHandlerMixin'
+            )
+        return redirect(self.success_url)
+
+
+class CursorPaginationMixin:
+    """
+    Миксин для списков с курсорной пагинацией вместо OFFSET/COUNT.
+
+    Заменяет стандартную пагинацию ListView на CursorPaginator. Курсор
+    передается в GET-параметре cursor_kwarg, остальные параметры запроса
+    (например, фильтры) шаблон сохраняет через тег querystring.
+    """
+
+    cursor_kwarg = 'cursor'
+    cursor_ordering: Tuple[str, ...] = ('created_at', 'id')
+    # Страница, заранее загруженная apaginate_queryset()
+    cursor_page: Optional[CursorPage] = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, page_size: int
+    ) -> Tuple[CursorPaginator, CursorPage, list, bool]:
+        """
+        Разбивает QuerySet на страницы по курсору из запроса.
+
+        Args:
+            queryset: QuerySet для разбиения на страницы.
+            page_size: Количество объектов на странице.
+
+        Returns:
+            Tuple[CursorPaginator, CursorPage, list, bool]: Пагинатор,
+                текущая страница, объекты страницы и признак того, что
+                страниц больше одной.
+        """
+        paginator = self.get_cursor_paginator(queryset, page_size)
+        page = self.cursor_page
+        if page is None:
+            page = paginator.page(self.get_cursor())
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, page_size: int
+    ) -> None:
+        """
+        Загружает текущую страницу через асинхронный ORM.
+
+        Асинхронные представления вызывают метод до get_context_data():
+        paginate_queryset() затем использует загруженную страницу и не
+        обращается к базе данных.
+
+        Args:
+            queryset: QuerySet для разбиения на страницы.
+            page_size: Количество объектов на странице.
+        """
+        paginator = self.get_cursor_paginator(queryset, page_size)
+        self.cursor_page = await paginator.apage(self.get_cursor())
+
+    def get_cursor_paginator(
+        self, queryset: QuerySet, page_size: int
+    ) -> CursorPaginator:
+        """
+        Создает пагинатор для QuerySet.
+
+        Args:
+            queryset: QuerySet для разбиения на страницы.
+            page_size: Количество объектов на странице.
+
+        Returns:
+            CursorPaginator: Пагинатор с ключом get_cursor_ordering().
+        """
+        return CursorPaginator(
+            queryset, page_size, ordering=self.get_cursor_ordering(queryset)
+        )
+
+    def get_cursor_ordering(self, queryset: QuerySet) -> Tuple[str, ...]:
+        """
+        Возвращает поля ключа сортировки страниц.
+
+        Args:
+            queryset: QuerySet для разбиения на страницы.
+
+        Returns:
+            Tuple[str, ...]: Поля сортировки, последнее - уникальное.
+        """
+        return self.cursor_ordering
+
+    def get_cursor(self) -> Optional[str]:
+        """
+        Возвращает курсор текущей страницы из GET-параметров.
+
+        Returns:
+            Optional[str]: Курсор или None для первой страницы.
+        """
+        return self.request.GET.get(self.cursor_kwarg)  # noqa
+
+
+class ListFragmentCacheMixin:
+    """
+    Миксин для кэширования отрендеренной таблицы списка.
+
+    Таблица рендерится из fragment_template_name и сохраняется в кэше по
+    ключу из GET-параметров, языка и версий моделей cache_dependencies.
+    Версии обновляются сигналами моделей (см. task_manager.cache), поэтому
+    изменение данных сразу делает фрагмент устаревшим. При попадании в кэш
+    запрос к списку объектов не выполняется.
+    """
+
+    fragment_template_name: Optional[str] = None
+    cache_dependencies: Tuple[str, ...] = ()
+    cache_per_user = False
+
+    def get_fragment_cache_key(self) -> str:
+        """
+        Возвращает ключ кэша таблицы для текущего запроса.
+
+        Returns:
+            str: Ключ кэша фрагмента.
+        """
+        dependencies = self.cache_dependencies or (self.model._meta.label,)
+        user_id = self.request.user.pk if self.cache_per_user else None
+        return make_fragment_key(
+            self.fragment_template_name,
+            dependencies,
+            self.request.GET,
+            get_language(),
+            user_id,
+        )
+
+    def get_cached_fragment(self) -> Optional[str]:
+        """
+        Возвращает таблицу из кэша, обращаясь к кэшу один раз за запрос.
+
+        Returns:
+            Optional[str]: HTML таблицы или None, если ее нет в кэше.
+        """
+        if not hasattr(self, '_cached_fragment'):
+            self._cached_fragment = cache.get(self.get_fragment_cache_key())
+            metrics.observe_cache_lookup(self.fragment_template_name,
+                                         self._cached_fragment is not None)
+        return self._cached_fragment
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Добавляет в контекст отрендеренную таблицу 'list_fragment'.
+
+        Args:
+            **kwargs: Дополнительные аргументы контекста.
+
+        Returns:
+            Dict[str, Any]: Словарь контекста с данными для шаблона.
+        """
+        fragment = self.get_cached_fragment()
+        if fragment is not None:
+            kwargs['object_list'] = self.object_list.none()
+            context = super().get_context_data(**kwargs)
+        else:
+            context = super().get_context_data(**kwargs)
+            fragment = render_to_string(self.fragment_template_name,
+                                        context, self.request)
+            cache.set(self.get_fragment_cache_key(), fragment,
+                      get_fragment_timeout())
+        context['list_fragment'] = fragment
+        return context
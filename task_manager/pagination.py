@@ -0,0 +1,241 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Q, QuerySet
+
+FORWARD = 'next'
+BACKWARD = 'previous'
+
+
+@dataclass
+class CursorPage:
+    """Страница результатов курсорной пагинации."""
+
+    object_list: List[Any]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        """Есть ли страница после текущей."""
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        """Есть ли страница перед текущей."""
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        """Есть ли другие страницы, кроме текущей."""
+        return self.has_next or self.has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+
+class CursorPaginator:
+    """
+    Курсорная (keyset) пагинация по упорядоченному набору полей.
+
+    Вместо OFFSET следующая страница выбирается условием "строго после
+    последней строки текущей страницы", а вместо COUNT(*) запрашивается
+    одна лишняя строка. Поэтому стоимость любой страницы совпадает со
+    стоимостью первой.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        ordering: Sequence[str] = ('created_at', 'id'),
+    ) -> None:
+        """
+        Args:
+            queryset: QuerySet для разбиения на страницы.
+            per_page: Количество объектов на странице.
+            ordering: Поля ключа сортировки. Последнее поле должно быть
+                уникальным, чтобы порядок был строгим.
+        """
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+
+    def encode_cursor(self, obj: Any, direction: str) -> str:
+        """
+        Кодирует позицию объекта в непрозрачную строку курсора.
+
+        Args:
+            obj: Граничный объект страницы (модель или словарь из
+                QuerySet.values()).
+            direction: Направление перехода (FORWARD или BACKWARD).
+
+        Returns:
+            str: Курсор, пригодный для передачи в URL.
+        """
+        values = [self._dump(self._get_value(obj, name))
+                  for name in self.ordering]
+        raw = json.dumps([direction, values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(
+        self, cursor: Optional[str]
+    ) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Разбирает курсор, полученный от клиента.
+
+        Некорректный курсор трактуется как отсутствующий, то есть
+        приводит к первой странице. Значения ключа приводятся к типам
+        полей сортировки, поэтому подмененный курсор не попадает в запрос.
+
+        Args:
+            cursor: Строка курсора из запроса.
+
+        Returns:
+            Optional[Tuple[str, List[Any]]]: Направление и значения ключа
+                или None.
+        """
+        if not cursor:
+            return None
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            direction, values = json.loads(base64.urlsafe_b64decode(padded))
+            if (direction not in (FORWARD, BACKWARD)
+                    or not isinstance(values, list)
+                    or len(values) != len(self.ordering)):
+                return None
+            values = [
+                self._get_field(name).to_python(self._load(value))
+                for name, value in zip(self.ordering, values)
+            ]
+        except (binascii.Error, FieldDoesNotExist, KeyError, TypeError,
+                ValidationError, ValueError):
+            return None
+        if any(value is None for value in values):
+            return None
+        return direction, values
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Возвращает страницу, на которую указывает курсор.
+
+        Args:
+            cursor: Курсор из запроса или None для первой страницы.
+
+        Returns:
+            CursorPage: Объекты страницы и курсоры соседних страниц.
+        """
+        queryset, direction = self._slice(cursor)
+        return self._paginate(list(queryset), direction)
+
+    async def apage(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Асинхронный вариант page() для асинхронных представлений.
+
+        Args:
+            cursor: Курсор из запроса или None для первой страницы.
+
+        Returns:
+            CursorPage: Объекты страницы и курсоры соседних страниц.
+        """
+        queryset, direction = self._slice(cursor)
+        return self._paginate([row async for row in queryset.aiterator()],
+                              direction)
+
+    def first_page(self, rows: List[Any]) -> CursorPage:
+        """
+        Строит первую страницу из строк, загруженных другим запросом.
+
+        Используется, когда первые страницы нескольких наборов загружаются
+        одним запросом (например, оконной функцией), а следующие - через
+        page().
+
+        Args:
+            rows: До per_page + 1 первых строк в порядке ordering.
+
+        Returns:
+            CursorPage: Первая страница с курсором следующей.
+        """
+        return self._build_page(list(rows), has_before=False)
+
+    def _slice(self, cursor: Optional[str]) -> Tuple[QuerySet, Optional[str]]:
+        """Запрос строк страницы и направление (None - первая страница)."""
+        position = self.decode_cursor(cursor)
+        if position is None:
+            return self._ordered(self.queryset, FORWARD), None
+        direction, values = position
+        queryset = self.queryset.filter(self._after(values, direction))
+        return self._ordered(queryset, direction), direction
+
+    def _ordered(self, queryset: QuerySet, direction: str) -> QuerySet:
+        prefix = '-' if direction == BACKWARD else ''
+        order = [prefix + name for name in self.ordering]
+        return queryset.order_by(*order)[:self.per_page + 1]
+
+    def _paginate(
+        self, rows: List[Any], direction: Optional[str]
+    ) -> CursorPage:
+        if direction is None:
+            return self._build_page(rows, has_before=False)
+        if direction == BACKWARD:
+            has_before = len(rows) > self.per_page
+            rows = list(reversed(rows[:self.per_page]))
+            return self._build_page(rows, has_before=has_before,
+                                    has_after=True)
+        return self._build_page(rows, has_before=True)
+
+    def _build_page(
+        self, rows: List[Any], has_before: bool, has_after: bool = False
+    ) -> CursorPage:
+        if not has_after:
+            has_after = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+        page = CursorPage(object_list=rows)
+        if rows and has_after:
+            page.next_cursor = self.encode_cursor(rows[-1], FORWARD)
+        if rows and has_before:
+            page.previous_cursor = self.encode_cursor(rows[0], BACKWARD)
+        return page
+
+    def _after(self, values: List[Any], direction: str) -> Q:
+        """Условие "после позиции" для составного ключа сортировки."""
+        lookup = 'lt' if direction == BACKWARD else 'gt'
+        condition = Q()
+        for index, name in enumerate(self.ordering):
+            step = Q(**{f'{name}__{lookup}': values[index]})
+            for prev_name, prev_value in zip(self.ordering[:index], values):
+                step &= Q(**{prev_name: prev_value})
+            condition |= step
+        return condition
+
+    def _get_field(self, name: str) -> Field:
+        """Поле модели или аннотации QuerySet с ключом сортировки."""
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(name)
+
+    @staticmethod
+    def _get_value(obj: Any, name: str) -> Any:
+        if isinstance(obj, dict):
+            return obj[name]
+        return getattr(obj, name)
+
+    @staticmethod
+    def _dump(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return {'dt': value.isoformat()}
+        return value
+
+    @staticmethod
+    def _load(value: Any) -> Any:
+        if isinstance(value, dict):
+            return datetime.fromisoformat(value['dt'])
+        return value
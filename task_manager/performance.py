@@ -0,0 +1,323 @@
+import logging
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.template.backends.django import DjangoTemplates, Template
+
+from task_manager import metrics
+
+logger = logging.getLogger('task_manager.performance')
+
+
+@dataclass
+class RequestTimings:
+    """Счетчики времени одного запроса (время в секундах)."""
+
+    queries: int = 0
+    db: float = 0.0
+    template: float = 0.0
+    # Вложенный рендеринг (render_to_string внутри шаблона) не
+    # учитывается повторно
+    render_depth: int = 0
+
+    def execute(self, execute: Callable[..., Any], sql: str, params: Any,
+                many: bool, context: Dict[str, Any]) -> Any:
+        """
+        Обертка выполнения SQL (connection.execute_wrapper).
+
+        Args:
+            execute: Следующий обработчик цепочки.
+            sql: Текст запроса.
+            params: Параметры запроса.
+            many: True для executemany.
+            context: Контекст выполнения.
+
+        Returns:
+            Any: Результат выполнения запроса.
+        """
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+
+# Счетчики текущего запроса; None - запрос не попал в выборку
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    'current_timings', default=None
+)
+
+
+class TimedTemplate(Template):
+    """Шаблон, который учитывает время рендеринга в текущем запросе."""
+
+    def render(self, context: Optional[Dict[str, Any]] = None,
+               request: Optional[HttpRequest] = None) -> str:
+        """
+        Рендерит шаблон и добавляет время к RequestTimings.template.
+
+        Args:
+            context: Контекст шаблона.
+            request: HTTP запрос.
+
+        Returns:
+            str: Результат рендеринга.
+        """
+        timings = current_timings.get()
+        if timings is None:
+            return super().render(context, request)
+        timings.render_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.render_depth -= 1
+            if not timings.render_depth:
+                timings.template += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Бэкенд шаблонов Django, возвращающий TimedTemplate."""
+
+    def from_string(self, template_code: str) -> TimedTemplate:
+        """
+        Создает шаблон из строки.
+
+        Args:
+            template_code: Исходный код шаблона.
+
+        Returns:
+            TimedTemplate: Шаблон с учетом времени рендеринга.
+        """
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name: str) -> TimedTemplate:
+        """
+        Загружает шаблон по имени.
+
+        Args:
+            template_name: Имя шаблона.
+
+        Returns:
+            TimedTemplate: Шаблон с учетом времени рендеринга.
+        """
+        return TimedTemplate(super().get_template(template_name).template,
+                             self)
+
+
+class PerformanceMiddleware:
+    """
+    Измеряет время обработки запроса и сообщает его.
+
+    Время всего запроса измеряется всегда, а доля PERF_SAMPLE_RATE
+    запросов дополнительно получает число и время SQL-запросов (через
+    connection.execute_wrapper) и время рендеринга шаблонов. Результат
+    выводится в заголовок Server-Timing (если PERF_TIMING_HEADER) и в
+    лог 'task_manager.performance': запросы из выборки - на уровне INFO,
+    запросы дольше PERF_SLOW_REQUEST_MS - на уровне WARNING. Время и
+    число SQL-запросов также передаются в метрики (task_manager.metrics).
+
+    Middleware должен стоять первым, чтобы учитывать остальные. Он
+    работает и в синхронной, и в асинхронной цепочке, поэтому под ASGI
+    не добавляет переключения между потоком и циклом событий.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        """
+        Args:
+            get_response: Следующий обработчик цепочки middleware.
+        """
+        self.get_response = get_response
+        self.sample_rate = settings.PERF_SAMPLE_RATE
+        self.slow_request = settings.PERF_SLOW_REQUEST_MS / 1000
+        self.timing_header = settings.PERF_TIMING_HEADER
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Обрабатывает запрос и добавляет сведения о времени.
+
+        Args:
+            request: HTTP запрос.
+
+        Returns:
+            HttpResponse: Ответ с заголовком Server-Timing.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = self.start_timings()
+        started = time.perf_counter()
+        with self.instrument(timings):
+            response = self.get_response(request)
+        return self.finish(request, response, started, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Асинхронный вариант __call__ для асинхронной цепочки middleware.
+
+        Args:
+            request: HTTP запрос.
+
+        Returns:
+            HttpResponse: Ответ с заголовком Server-Timing.
+        """
+        timings = self.start_timings()
+        started = time.perf_counter()
+        with self.instrument(timings):
+            response = await self.get_response(request)
+        return self.finish(request, response, started, timings)
+
+    def start_timings(self) -> Optional[RequestTimings]:
+        """
+        Решает, попадает ли запрос в выборку.
+
+        Returns:
+            Optional[RequestTimings]: Счетчики запроса или None вне
+                выборки.
+        """
+        if random.random() < self.sample_rate:
+            return RequestTimings()
+        return None
+
+    def finish(self, request: HttpRequest, response: HttpResponse,
+               started: float,
+               timings: Optional[RequestTimings]) -> HttpResponse:
+        """
+        Добавляет заголовок, пишет лог и метрики обработанного запроса.
+
+        Args:
+            request: HTTP запрос.
+            response: Ответ.
+            started: Время начала обработки (time.perf_counter()).
+            timings: Счетчики запроса или None вне выборки.
+
+        Returns:
+            HttpResponse: Ответ.
+        """
+        total = time.perf_counter() - started
+        view = self.get_view_name(request)
+        if self.timing_header:
+            response['Server-Timing'] = self.get_server_timing(
+                total, timings, view
+            )
+        self.log(request, response, view, total, timings)
+        metrics.observe_request(
+            view, request.method, response.status_code, total,
+            timings.queries if timings is not None else None,
+        )
+        return response
+
+    @staticmethod
+    def get_view_name(request: HttpRequest) -> Optional[str]:
+        """
+        Возвращает имя маршрута запроса.
+
+        Args:
+            request: HTTP запрос.
+
+        Returns:
+            Optional[str]: Имя URL (с пространством имен) или None, если
+                маршрут не найден.
+        """
+        match = request.resolver_match
+        return match.view_name if match else None
+
+    @staticmethod
+    @contextmanager
+    def instrument(timings: Optional[RequestTimings]) -> Iterator[None]:
+        """
+        Учитывает SQL-запросы и шаблоны запроса из выборки.
+
+        Обертки выполнения ставятся на соединения текущего контекста.
+        Соединения и current_timings привязаны к контексту, а не к потоку,
+        поэтому запросы из sync_to_async тоже учитываются.
+
+        Args:
+            timings: Счетчики запроса или None вне выборки.
+        """
+        if timings is None:
+            yield
+            return
+        token = current_timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(
+                        connections[alias].execute_wrapper(timings.execute)
+                    )
+                yield
+        finally:
+            current_timings.reset(token)
+
+    @staticmethod
+    def get_server_timing(
+        total: float, timings: Optional[RequestTimings],
+        view: Optional[str]
+    ) -> str:
+        """
+        Формирует значение заголовка Server-Timing.
+
+        Args:
+            total: Время всего запроса.
+            timings: Счетчики запроса или None вне выборки.
+            view: Имя маршрута.
+
+        Returns:
+            str: Метрики total, db и tpl в миллисекундах и имя маршрута.
+        """
+        metrics = [f'total;dur={total * 1000:.1f}']
+        if timings is not None:
+            metrics.append(f'db;dur={timings.db * 1000:.1f};'
+                           f'desc="{timings.queries} queries"')
+            metrics.append(f'tpl;dur={timings.template * 1000:.1f}')
+        if view:
+            metrics.append(f'view;desc="{view}"')
+        return ', '.join(metrics)
+
+    def log(self, request: HttpRequest, response: HttpResponse,
+            view: Optional[str], total: float,
+            timings: Optional[RequestTimings]) -> None:
+        """
+        Пишет структурированную запись о запросе.
+
+        Args:
+            request: HTTP запрос.
+            response: Ответ.
+            view: Имя маршрута.
+            total: Время всего запроса.
+            timings: Счетчики запроса или None вне выборки.
+        """
+        slow = total >= self.slow_request
+        if timings is None and not slow:
+            return
+        extra: Dict[str, Any] = {
+            'view': view,
+            'method': request.method,
+            'status': response.status_code,
+            'duration_ms': round(total * 1000, 1),
+        }
+        if timings is not None:
+            extra.update(
+                queries=timings.queries,
+                db_ms=round(timings.db * 1000, 1),
+                template_ms=round(timings.template * 1000, 1),
+                sample_rate=self.sample_rate,
+            )
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            '%s %s %s %.1fms', request.method, request.path,
+            response.status_code, total * 1000, extra=extra,
+        )
@@ -1,22 +1,280 @@
-from typing import Dict, Any, Optional
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import urljoin
 
+import requests
+import rollbar
+from django.conf import settings
 from django.http import HttpRequest
 from rollbar.contrib.django.middleware import RollbarNotifierMiddleware
+from rollbar.lib import events
+
+logger = logging.getLogger(__name__)
+
+# Что делать с отчетом, если очередь заполнена
+DROP_NEWEST = 'newest'
+DROP_OLDEST = 'oldest'
+DROP_POLICIES = (DROP_NEWEST, DROP_OLDEST)
+# О потерянных отчетах пишется в лог первый раз и затем каждый N-й
+DROP_LOG_EVERY = 100
+DEFAULT_SEND_TIMEOUT = 3
+
+
+class RollbarQueue:
+    """
+    Ограниченная очередь отчетов Rollbar с фоновой отправкой.
+
+    Запрос только кладет готовый отчет в очередь и не ждет Rollbar.
+    Фоновый поток забирает до batch_size отчетов за раз и отправляет их
+    через одно keep-alive соединение (API Rollbar принимает по одному
+    отчету в запросе). Если очередь заполнена, запрос ждет не дольше
+    put_timeout секунд (противодавление), а затем отчет теряется: новый
+    (DROP_NEWEST) или самый старый в очереди (DROP_OLDEST).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        batch_size: int = 50,
+        put_timeout: float = 0.0,
+        drop_policy: str = DROP_NEWEST,
+    ) -> None:
+        """
+        Args:
+            maxsize: Наибольшее число отчетов в очереди.
+            batch_size: Сколько отчетов отправляется за один проход.
+            put_timeout: Сколько секунд запрос ждет места в очереди.
+            drop_policy: Какой отчет теряется при переполнении.
+
+        Raises:
+            ValueError: Если drop_policy неизвестна.
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f'Unknown drop policy: {drop_policy}')
+        self.maxsize = maxsize
+        self.batch_size = max(batch_size, 1)
+        self.put_timeout = put_timeout
+        self.drop_policy = drop_policy
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def handle_payload(self, payload: Dict[str, Any],
+                       **kwargs: Any) -> bool:
+        """
+        Обработчик события payload библиотеки rollbar.
+
+        Args:
+            payload: Готовый отчет.
+            **kwargs: Остальные аргументы события.
+
+        Returns:
+            bool: Всегда False: отчет не отправляется в запросе.
+        """
+        self.put(payload)
+        return False
+
+    def put(self, payload: Dict[str, Any]) -> bool:
+        """
+        Ставит отчет в очередь.
+
+        Args:
+            payload: Отчет Rollbar.
+
+        Returns:
+            bool: True, если отчет поставлен в очередь, False, если он
+                потерян.
+        """
+        self.ensure_worker()
+        try:
+            self.queue.put(payload, timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            pass
+        if self.drop_policy == DROP_OLDEST:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.queue.put_nowait(payload)
+                self.record_drop()
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+        self.record_drop()
+        return False
+
+    def record_drop(self) -> None:
+        """Учитывает потерянный отчет и изредка пишет о потерях в лог."""
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        if dropped % DROP_LOG_EVERY == 1:
+            logger.warning('Rollbar queue is full, reports dropped: %d',
+                           dropped)
+
+    def ensure_worker(self) -> None:
+        """
+        Запускает фоновый поток, если он еще не запущен в этом процессе.
+
+        После fork (воркеры gunicorn) поток родителя в дочернем процессе
+        не существует, поэтому очередь и поток создаются заново.
+        """
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                self.queue = queue.Queue(self.maxsize)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self.run, name='rollbar-reporter', daemon=True
+            )
+            self._thread.start()
+
+    def run(self) -> None:
+        """Цикл фонового потока: отправляет отчеты пачками."""
+        session = requests.Session()
+        while True:
+            batch = self.take_batch()
+            for payload in batch:
+                self.send(session, payload)
+                self.queue.task_done()
+
+    def take_batch(self) -> List[Dict[str, Any]]:
+        """
+        Ждет первый отчет и забирает вместе с ним уже ожидающие.
+
+        Returns:
+            List[Dict[str, Any]]: От 1 до batch_size отчетов.
+        """
+        batch = [self.queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def send(self, session: requests.Session,
+             payload: Dict[str, Any]) -> None:
+        """
+        Отправляет один отчет в API Rollbar.
+
+        Args:
+            session: HTTP-сессия фонового потока.
+            payload: Отчет Rollbar.
+        """
+        access_token = (payload.get('access_token')
+                        or rollbar.SETTINGS.get('access_token'))
+        try:
+            response = session.post(
+                urljoin(rollbar.SETTINGS['endpoint'], 'item/'),
+                data=json.dumps(payload, default=str),
+                headers={'Content-Type': 'application/json',
+                         'X-Rollbar-Access-Token': access_token},
+                timeout=rollbar.SETTINGS.get('timeout', DEFAULT_SEND_TIMEOUT),
+            )
+            response.raise_for_status()
+            self.sent += 1
+        except requests.RequestException as exc:
+            self.failed += 1
+            logger.warning('Rollbar report was not sent: %s', exc)
+
+    def flush(self, timeout: float) -> bool:
+        """
+        Ждет отправки отчетов из очереди.
+
+        Args:
+            timeout: Наибольшее время ожидания в секундах.
+
+        Returns:
+            bool: True, если очередь опустела.
+        """
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+
+reporter: Optional[RollbarQueue] = None
+_install_lock = threading.Lock()
+
+
+def install_reporter() -> RollbarQueue:
+    """
+    Подключает фоновую очередь к библиотеке rollbar один раз на процесс.
+
+    Обработчик события payload ставит отчет в очередь и отменяет
+    отправку самой библиотекой. Middleware создается заново для каждого
+    обработчика запросов (и тестового клиента), поэтому повторные вызовы
+    возвращают уже созданную очередь, а не создают новые очереди с
+    потоками и обработчики atexit. При выходе из процесса очередь
+    отправляется в пределах ROLLBAR_FLUSH_TIMEOUT секунд.
+
+    Returns:
+        RollbarQueue: Очередь, собранная по настройкам проекта.
+    """
+    global reporter
+    with _install_lock:
+        if reporter is None:
+            reporter = RollbarQueue(
+                maxsize=settings.ROLLBAR_QUEUE_SIZE,
+                batch_size=settings.ROLLBAR_BATCH_SIZE,
+                put_timeout=settings.ROLLBAR_QUEUE_TIMEOUT,
+                drop_policy=settings.ROLLBAR_DROP_POLICY,
+            )
+            atexit.register(reporter.flush, settings.ROLLBAR_FLUSH_TIMEOUT)
+        # Первый rollbar.init() сбрасывает обработчики событий, поэтому
+        # обработчик очереди подключается заново, но только один раз
+        events.remove_payload_handler(reporter.handle_payload)
+        events.add_payload_handler(reporter.handle_payload)
+    return reporter
 
 
 class CustomRollbarNotifierMiddleware(RollbarNotifierMiddleware):
     """
     Кастомный middleware для Rollbar с добавлением информации о пользователе.
+
+    Отчеты отправляются фоновой очередью RollbarQueue, поэтому медленный
+    API Rollbar не задерживает ответ.
     """
 
+    def __init__(self, get_response: Any = None) -> None:
+        """
+        Инициализирует rollbar и подключает фоновую очередь отчетов.
+
+        Args:
+            get_response: Следующий обработчик цепочки middleware.
+
+        Raises:
+            MiddlewareNotUsed: Если ROLLBAR_ACCESS_TOKEN не задан.
+        """
+        super().__init__(get_response)
+        install_reporter()
+
     def get_payload_data(
         self, request: HttpRequest, exc: Optional[Exception]
     ) -> Dict[str, Any]:
         """
         Получает дополнительные данные для отправки в Rollbar.
 
-        Добавляет информацию о пользователе в payload, если пользователь
-        авторизован.
+        Вызывается только из process_exception, то есть данные о
+        пользователе собираются лишь при возникновении исключения.
 
         Args:
             request: HTTP запрос от клиента.
@@ -26,16 +284,24 @@ class CustomRollbarNotifierMiddleware(RollbarNotifierMiddleware):
             Dict[str, Any]: Словарь с данными для Rollbar. Содержит информацию
                 о пользователе, если он авторизован.
         """
-        payload_data: Dict[str, Any] = {}
+        if request.user.is_anonymous:
+            return {}
+        return {'person': self.get_person_data(request.user)}
+
+    @staticmethod
+    def get_person_data(user: Any) -> Dict[str, Any]:
+        """
+        Собирает данные пользователя для отчета.
 
-        if not request.user.is_anonymous:
-            payload_data = {
-                'person': {
-                    'id': request.user.id,
-                    'username': request.user.username,
-                    'email': request.user.email,
-                    'full_name': request.user.get_full_name(),
-                },
-            }
+        Args:
+            user: Авторизованный пользователь.
 
-        return payload_data
+        Returns:
+            Dict[str, Any]: Поля person отчета Rollbar.
+        """
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'full_name': user.get_full_name(),
+        }
@@ -4,6 +4,8 @@ from pathlib import Path
 import dj_database_url
 from dotenv import load_dotenv
 
+from task_manager.database import configure_pool, get_pool_options
+
 load_dotenv()
 
 # Построение путей внутри проекта: BASE_DIR / 'subdir'.
@@ -40,7 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django_bootstrap5',
-    'task_manager',
+    'task_manager.apps.TaskManagerConfig',
     'task_manager.users.apps.UsersConfig',
     'task_manager.statuses.apps.StatusesConfig',
     'task_manager.tasks.apps.TasksConfig',
@@ -49,6 +51,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Первым: время запроса включает остальные middleware
+    'task_manager.performance.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -66,7 +70,9 @@ ROOT_URLCONF = 'task_manager.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates, учитывающий время рендеринга для
+        # PerformanceMiddleware
+        'BACKEND': 'task_manager.performance.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'task_manager' / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -95,12 +101,55 @@ DATABASES = {
         },
     },
 }
+
+# Соединения с PostgreSQL
+# Без пула соединение живет CONN_MAX_AGE секунд и проверяется перед
+# повторным использованием (CONN_HEALTH_CHECKS). При DB_POOL=True
+# используется встроенный пул Django (нужен psycopg[pool]): у каждого
+# воркера gunicorn свой пул, поэтому лимит DB_MAX_CONNECTIONS делится на
+# WEB_CONCURRENCY (число воркеров, которое gunicorn читает из окружения).
+DB_POOL = os.getenv('DB_POOL', 'True') == 'True'
+DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', '20'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+
 if os.getenv('DATABASE_URL'):
     DATABASES = {
-        'default': dj_database_url.parse(os.getenv('DATABASE_URL'),
-                                         conn_max_age=600),
+        'default': configure_pool(
+            dj_database_url.parse(os.getenv('DATABASE_URL'),
+                                  conn_max_age=600,
+                                  conn_health_checks=True),
+            get_pool_options(WEB_CONCURRENCY, DB_MAX_CONNECTIONS,
+                             DB_POOL_TIMEOUT) if DB_POOL else None,
+        ),
+    }
+
+# Кэш
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# По умолчанию используется кэш в памяти процесса. Для нескольких воркеров
+# gunicorn задайте CACHE_LOCATION - каталог файлового кэша, общий для всех
+# процессов.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+if os.getenv('CACHE_LOCATION'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION'),
+        },
     }
 
+# Время жизни закэшированных таблиц списков, в секундах
+LIST_CACHE_TIMEOUT = int(os.getenv('LIST_CACHE_TIMEOUT', '300'))
+
+# Если вариантов выбора больше, в <select> выводятся только выбранные, а
+# остальные подгружаются страницами из /api/choices/<name>/
+CHOICES_INLINE_LIMIT = int(os.getenv('CHOICES_INLINE_LIMIT', '500'))
+
 # Валидация паролей
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -167,6 +216,18 @@ if not DEBUG:
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+LOG_LEVEL = 'DEBUG' if DEBUG else 'INFO'
+# Файл общий для всех воркеров gunicorn и ротируется внешним logrotate:
+# каждый процесс сам переоткрывает файл после ротации (WatchedFileHandler)
+LOG_FILE = os.getenv('LOG_FILE', 'debug.log')
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+# Доля записей шумных логгеров, которая попадает в лог
+LOG_SAMPLE_RATES = {
+    'django.db.backends': float(os.getenv('LOG_DB_SAMPLE_RATE', '0.01')),
+}
+
+# Логгеры пишут в очередь, а в консоль и в файл (JSON)
+# записи выводит фоновый поток task_manager.logs.QueueListenerHandler
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -174,8 +235,14 @@ LOGGING = {
         'console': {
             'format': '%(name)-12s %(levelname)-8s %(message)s'
         },
-        'file': {
-            'format': '%(asctime)s %(name)-12s %(levelname)-8s %(message)s'
+        'json': {
+            '()': 'task_manager.logs.JsonFormatter',
+        }
+    },
+    'filters': {
+        'sampling': {
+            '()': 'task_manager.logs.SamplingFilter',
+            'rates': LOG_SAMPLE_RATES,
         }
     },
     'handlers': {
@@ -185,15 +252,24 @@ LOGGING = {
         },
         'file': {
             'level': 'DEBUG',
-            'class': 'logging.FileHandler',
-            'formatter': 'file',
-            'filename': 'debug.log'
+            'class': 'logging.handlers.WatchedFileHandler',
+            'formatter': 'json',
+            'filename': LOG_FILE,
+            'encoding': 'utf-8',
+        },
+        # Имя больше 'console' и 'file': dictConfig создает обработчики
+        # по алфавиту, и к этому моменту целевые уже созданы
+        'queue': {
+            '()': 'task_manager.logs.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.file'],
+            'queue_size': LOG_QUEUE_SIZE,
+            'filters': ['sampling'],
         }
     },
     'loggers': {
         '': {
-            'level': 'DEBUG' if DEBUG else 'INFO',
-            'handlers': ['console', 'file']
+            'level': LOG_LEVEL,
+            'handlers': ['queue']
         }
     }
 }
@@ -204,3 +280,22 @@ ROLLBAR = {
     'code_version': '1.0',
     'root': BASE_DIR,
 }
+
+# Замеры времени запросов (task_manager.performance)
+PERF_SAMPLE_RATE = float(os.getenv('PERF_SAMPLE_RATE', '0.1'))
+PERF_SLOW_REQUEST_MS = float(os.getenv('PERF_SLOW_REQUEST_MS', '500'))
+# Заголовок раскрывает имена представлений и число SQL-запросов, поэтому
+# по умолчанию включен только в режиме DEBUG
+PERF_TIMING_HEADER = os.getenv('PERF_TIMING_HEADER', str(DEBUG)) == 'True'
+
+# Эндпоинт /metrics (task_manager.metrics). Метрики воркеров gunicorn
+# суммируются через файлы в каталоге PROMETHEUS_MULTIPROC_DIR. Без токена
+# эндпоинт доступен только в режиме DEBUG, иначе отвечает 404
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# Фоновая очередь отчетов Rollbar (task_manager.rollbar_middleware)
+ROLLBAR_QUEUE_SIZE = int(os.getenv('ROLLBAR_QUEUE_SIZE', '1000'))
+ROLLBAR_BATCH_SIZE = int(os.getenv('ROLLBAR_BATCH_SIZE', '50'))
+ROLLBAR_QUEUE_TIMEOUT = float(os.getenv('ROLLBAR_QUEUE_TIMEOUT', '0'))
+ROLLBAR_DROP_POLICY = os.getenv('ROLLBAR_DROP_POLICY', 'newest')
+ROLLBAR_FLUSH_TIMEOUT = float(os.getenv('ROLLBAR_FLUSH_TIMEOUT', '5'))
@@ -0,0 +1,79 @@
+// Большие списки выбора не выводятся на странице целиком.
+// data-choices-url: варианты подгружаются страницами из /api/choices/<name>/
+// при первом фокусе на поле.
+// data-autocomplete-url: перед полем выводится строка поиска, найденные
+// /api/autocomplete/<name>/ варианты заменяют невыбранные.
+(function () {
+  function loadChoices(select, url) {
+    fetch(url, {credentials: 'same-origin'})
+      .then(function (response) { return response.json(); })
+      .then(function (data) {
+        const present = new Set(Array.from(select.options, function (option) {
+          return option.value;
+        }));
+        data.results.forEach(function (choice) {
+          if (!present.has(String(choice.id))) {
+            select.add(new Option(choice.text, choice.id));
+          }
+        });
+        if (data.next) {
+          loadChoices(select, data.next);
+        }
+      });
+  }
+
+  function showMatches(select, results) {
+    Array.from(select.options).forEach(function (option) {
+      if (option.value && !option.selected) {
+        option.remove();
+      }
+    });
+    const present = new Set(Array.from(select.options, function (option) {
+      return option.value;
+    }));
+    results.forEach(function (choice) {
+      if (!present.has(String(choice.id))) {
+        select.add(new Option(choice.text, choice.id));
+      }
+    });
+  }
+
+  function setUpAutocomplete(select) {
+    const url = select.dataset.autocompleteUrl;
+    const input = document.createElement('input');
+    input.type = 'search';
+    input.className = 'form-control mb-1';
+    input.placeholder = select.dataset.autocompletePlaceholder || '';
+    select.before(input);
+    let timer = null;
+    input.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        const query = input.value.trim();
+        if (!query) {
+          showMatches(select, []);
+          return;
+        }
+        fetch(url + '?q=' + encodeURIComponent(query),
+              {credentials: 'same-origin'})
+          .then(function (response) { return response.json(); })
+          .then(function (data) { showMatches(select, data.results); });
+      }, 200);
+    });
+  }
+
+  document.addEventListener('focusin', function (event) {
+    const select = event.target;
+    if (!(select instanceof HTMLSelectElement) || !select.dataset.choicesUrl) {
+      return;
+    }
+    const url = select.dataset.choicesUrl;
+    delete select.dataset.choicesUrl;
+    loadChoices(select, url + '?limit=1000');
+  });
+
+  document.addEventListener('DOMContentLoaded', function () {
+    document.querySelectorAll('select[data-autocomplete-url]')
+      .forEach(setUpAutocomplete);
+  });
+})();
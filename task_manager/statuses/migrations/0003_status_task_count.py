@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:36
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_tasks(apps, schema_editor):
+    counts = (apps.get_model('tasks', 'Task').objects.order_by()
+              .filter(status=OuterRef('pk'))
+              .values('status').annotate(count=Count('pk'))
+              .values('count'))
+    apps.get_model('statuses', 'Status').objects.update(
+        task_count=Coalesce(Subquery(counts), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_search'),
+        ('statuses', '0002_status_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='status',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Tasks'),
+        ),
+        migrations.RunPython(count_tasks, migrations.RunPython.noop),
+    ]
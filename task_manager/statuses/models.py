@@ -9,6 +9,12 @@ class Status(models.Model):
         max_length=50, verbose_name=_('Name'), unique=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Число задач со статусом, обновляется сигналами задач
+    # (см. tasks.counters)
+    task_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_('Tasks')
+    )
 
     def __str__(self) -> str:
         """
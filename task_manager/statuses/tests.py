@@ -1,9 +1,12 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
 
 User = get_user_model()
 
@@ -167,3 +170,39 @@ class StatusesDeleteViewTest(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse('statuses_index'))
         self.assertEqual(Status.objects.count(), 0)
+
+
+class StatusesDeleteQueryCountTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.status = Status.objects.create(name='Test status')
+        self.url = reverse('statuses_delete', kwargs={'pk': self.status.pk})
+
+    def capture(self, method, url):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url)
+        return response, [query['sql'] for query in context]
+
+    def count_selects(self, queries, table):
+        return sum(
+            1 for sql in queries
+            if sql.startswith('SELECT') and f'FROM "{table}"' in sql
+        )
+
+    def test_get_loads_status_once(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_in_use_is_rejected_by_single_query(self):
+        Task.objects.create(name='Task', description='', status=self.status,
+                            author=self.user)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
+        self.assertRedirects(response, reverse('statuses_index'))
+        self.assertTrue(Status.objects.filter(pk=self.status.pk).exists())
+
+    def test_post_loads_status_once(self):
+        response, queries = self.capture('post', self.url)
+        self.assertRedirects(response, reverse('statuses_index'))
+        self.assertEqual(self.count_selects(queries, 'statuses_status'), 1)
@@ -3,7 +3,7 @@ from django.urls import path
 from task_manager.statuses import views
 
 urlpatterns = [
-    path('', views.StatusListView.as_view(), name='statuses_index'),
+    path('', views.AsyncStatusListView.as_view(), name='statuses_index'),
     path('create/', views.StatusCreateView.as_view(), name='statuses_create'),
     path(
         '<int:pk>/update/',
@@ -1,20 +1,34 @@
+from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
-from task_manager.base_views import (BaseListView,
+from task_manager.base_views import (AsyncListMixin,
+                                     BaseListView,
                                      BaseCreateView,
                                      BaseUpdateView,
                                      BaseDeleteView)
+from task_manager.mixins import ListFragmentCacheMixin
 from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
 
+User = get_user_model()
 
-class StatusListView(BaseListView):
+
+class StatusListView(ListFragmentCacheMixin, BaseListView):
     """Представление для отображения списка статусов."""
 
     template_name = 'statuses/list.html'
+    fragment_template_name = 'statuses/table.html'
     model = Status
     context_object_name = 'statuses'
+    # Пользователь входит в страницу через приветствие в навигации
+    conditional_models = (Status, User)
+
+
+class AsyncStatusListView(AsyncListMixin, StatusListView):
+    """Список статусов, загружаемый асинхронным ORM."""
+
+    pass
 
 
 class StatusCreateView(BaseCreateView):
@@ -48,4 +62,5 @@ class StatusDeleteView(BaseDeleteView):
     success_url = reverse_lazy('statuses_index')
     success_message = _('Status successfully deleted')
     protected_error_message = _('Cannot delete status because it is in use')
+    protected_relations = ('task',)
     delete_title = _('Deleting a status')
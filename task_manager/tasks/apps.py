@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save, pre_save
 
 
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self) -> None:
+        """
+        Подключает синхронизацию полнотекстового индекса задач и счетчиков
+        задач статусов и исполнителей.
+        """
+        from task_manager.tasks import counters, search
+        task = self.get_model('Task')
+        post_save.connect(search.update_search_index, sender=task,
+                          dispatch_uid='task-search-save')
+        post_delete.connect(search.remove_from_search_index, sender=task,
+                            dispatch_uid='task-search-delete')
+        pre_save.connect(counters.remember_counted_state, sender=task,
+                         dispatch_uid='task-counters-pre-save')
+        post_save.connect(counters.count_saved_task, sender=task,
+                          dispatch_uid='task-counters-save')
+        post_delete.connect(counters.count_deleted_task, sender=task,
+                            dispatch_uid='task-counters-delete')
@@ -0,0 +1,140 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence
+
+from django.db.models import Count, F, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from task_manager.pagination import CursorPage, CursorPaginator
+from task_manager.statuses.models import Status
+
+BOARD_PAGE_SIZE = 20
+# Аннотация с номером задачи внутри колонки
+COLUMN_POSITION = 'board_position'
+# Аннотация с числом отфильтрованных задач колонки
+COLUMN_COUNT = 'board_count'
+
+
+@dataclass
+class BoardColumn:
+    """Колонка доски: статус, первая страница и число его задач."""
+
+    status: Status
+    page: CursorPage
+    # Число задач колонки с учетом фильтров доски
+    count: int
+
+
+class TaskBoard:
+    """
+    Доска задач, сгруппированных по статусам.
+
+    Первые страницы всех колонок загружаются одним запросом: задачи
+    нумеруются оконной функцией ROW_NUMBER() OVER (PARTITION BY
+    status_id ORDER BY <ordering>), и отбираются строки с номером не
+    больше per_column + 1 (лишняя строка показывает, есть ли следующая
+    страница). Тот же запрос считает COUNT(*) OVER (PARTITION BY
+    status_id) - число отфильтрованных задач колонки. Следующие
+    страницы колонки загружаются курсорной пагинацией по тому же ключу
+    сортировки.
+    """
+
+    def __init__(self, queryset: QuerySet, per_column: int,
+                 ordering: Sequence[str]) -> None:
+        """
+        Args:
+            queryset: Отфильтрованные задачи.
+            per_column: Число задач на странице колонки.
+            ordering: Ключ сортировки задач в колонке, последнее поле
+                уникально.
+        """
+        self.queryset = queryset
+        self.per_column = per_column
+        self.ordering = tuple(ordering)
+
+    def get_paginator(self, status_id: int) -> CursorPaginator:
+        """
+        Возвращает пагинатор задач одной колонки.
+
+        Args:
+            status_id: Идентификатор статуса колонки.
+
+        Returns:
+            CursorPaginator: Пагинатор задач со статусом.
+        """
+        return CursorPaginator(self.queryset.filter(status_id=status_id),
+                               self.per_column, self.ordering)
+
+    def get_first_pages_queryset(self) -> QuerySet:
+        """
+        Возвращает запрос первых страниц всех колонок.
+
+        Returns:
+            QuerySet: Задачи, пронумерованные внутри статуса, с числом
+                задач статуса.
+        """
+        position = Window(
+            RowNumber(),
+            partition_by=[F('status_id')],
+            order_by=[F(name).asc() for name in self.ordering],
+        )
+        # Условие по номеру строки Django применяет во внешнем запросе,
+        # поэтому окно считает все отфильтрованные задачи статуса
+        count = Window(Count('pk'), partition_by=[F('status_id')])
+        return (self.queryset
+                .annotate(**{COLUMN_POSITION: position, COLUMN_COUNT: count})
+                .filter(**{f'{COLUMN_POSITION}__lte': self.per_column + 1})
+                .order_by('status_id', *self.ordering))
+
+    def build(self, statuses: Iterable[Status],
+              tasks: Iterable[Any]) -> List[BoardColumn]:
+        """
+        Раскладывает задачи первых страниц по колонкам.
+
+        Args:
+            statuses: Статусы в порядке колонок.
+            tasks: Результат get_first_pages_queryset().
+
+        Returns:
+            List[BoardColumn]: Колонки доски, в том числе пустые.
+        """
+        rows: Dict[int, List[Any]] = defaultdict(list)
+        for task in tasks:
+            rows[task.status_id].append(task)
+        return [
+            BoardColumn(
+                status,
+                self.get_paginator(status.pk).first_page(rows[status.pk]),
+                getattr(rows[status.pk][0], COLUMN_COUNT)
+                if rows[status.pk] else 0,
+            )
+            for status in statuses
+        ]
+
+    def load(self, statuses: QuerySet) -> List[BoardColumn]:
+        """
+        Загружает колонки доски двумя запросами.
+
+        Args:
+            statuses: Статусы в порядке колонок.
+
+        Returns:
+            List[BoardColumn]: Колонки доски.
+        """
+        return self.build(list(statuses),
+                          list(self.get_first_pages_queryset()))
+
+    async def aload(self, statuses: QuerySet) -> List[BoardColumn]:
+        """
+        Асинхронный вариант load().
+
+        Args:
+            statuses: Статусы в порядке колонок.
+
+        Returns:
+            List[BoardColumn]: Колонки доски.
+        """
+        status_list = [status async for status in statuses]
+        tasks = [task async for task
+                 in self.get_first_pages_queryset().aiterator()]
+        return self.build(status_list, tasks)
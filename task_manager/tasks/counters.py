@@ -0,0 +1,207 @@
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from task_manager.cache import invalidate_model
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+
+User = get_user_model()
+
+COUNTER_BATCH_SIZE = 500
+# Счетчики: модель, поле счетчика и поле задачи, по которому считаются
+COUNTERS = (
+    (Status, 'task_count', 'status'),
+    (User, 'assigned_task_count', 'executor'),
+)
+COUNTED_FIELDS = frozenset({'status', 'status_id', 'executor', 'executor_id'})
+
+# Статус и исполнитель задачи, учтенные в счетчиках
+CountedState = Tuple[int, Optional[int]]
+
+
+class CounterChanges:
+    """
+    Накапливает изменения счетчиков задач по статусам и исполнителям.
+
+    Изменения применяются одним UPDATE ... SET <счетчик> = <счетчик> + N
+    на каждое значение N, поэтому массовые операции обходятся несколькими
+    запросами. Вместе со счетчиком обновляется updated_at строки, чтобы
+    ETag страниц со счетчиками изменился.
+    """
+
+    def __init__(self) -> None:
+        self.deltas: Dict[str, Counter] = {
+            field: Counter() for _model, field, _task_field in COUNTERS
+        }
+
+    def move(self, previous: Optional[CountedState],
+             current: Optional[CountedState]) -> None:
+        """
+        Учитывает переход задачи из одного состояния в другое.
+
+        Args:
+            previous: Прежние статус и исполнитель или None для новой
+                задачи.
+            current: Новые статус и исполнитель или None для удаленной
+                задачи.
+        """
+        for state, delta in ((previous, -1), (current, 1)):
+            if state is None:
+                continue
+            for (_model, field, _task_field), pk in zip(COUNTERS, state):
+                if pk is not None:
+                    self.deltas[field][pk] += delta
+
+    def apply(self, using: str = DEFAULT_DB_ALIAS) -> None:
+        """
+        Записывает накопленные изменения в базу данных.
+
+        Args:
+            using: Алиас базы данных.
+        """
+        now = timezone.now()
+        for model, field, _task_field in COUNTERS:
+            groups = self.group_by_delta(self.deltas[field])
+            for delta, ids in groups.items():
+                self.update(model, field, delta, ids, now, using)
+            if groups:
+                # UPDATE не отправляет сигналы, сбрасывающие кэш списков
+                invalidate_model(model._meta.label, choices=False)
+        for deltas in self.deltas.values():
+            deltas.clear()
+
+    @staticmethod
+    def group_by_delta(deltas: Counter) -> Dict[int, List[int]]:
+        """Группирует идентификаторы строк по ненулевому изменению."""
+        groups = defaultdict(list)
+        for pk, delta in deltas.items():
+            if delta:
+                groups[delta].append(pk)
+        return groups
+
+    @staticmethod
+    def update(model: type, field: str, delta: int, ids: List[int],
+               now: Any, using: str) -> None:
+        """Прибавляет delta к счетчику строк ids пакетами."""
+        for start in range(0, len(ids), COUNTER_BATCH_SIZE):
+            model._default_manager.using(using).filter(
+                pk__in=ids[start:start + COUNTER_BATCH_SIZE]
+            ).update(**{field: F(field) + delta, 'updated_at': now})
+
+
+def get_state(task: Task) -> CountedState:
+    """Возвращает статус и исполнителя задачи."""
+    return task.status_id, task.executor_id
+
+
+def remember_counted_state(
+    sender: type, instance: Task, raw: bool = False,
+    using: str = DEFAULT_DB_ALIAS,
+    update_fields: Optional[Iterable[str]] = None, **kwargs: Any
+) -> None:
+    """
+    Обработчик pre_save: запоминает учтенные статус и исполнителя.
+
+    Строка задачи блокируется до конца транзакции Task.save(), чтобы
+    параллельное изменение не учло тот же переход дважды.
+    """
+    instance._counted_state = None
+    instance._counters_skipped = bool(
+        raw or (update_fields is not None
+                and not COUNTED_FIELDS & set(update_fields))
+    )
+    if instance._counters_skipped or instance._state.adding:
+        return
+    instance._counted_state = (
+        sender._default_manager.using(using).select_for_update()
+        .filter(pk=instance.pk).values_list('status_id', 'executor_id')
+        .first()
+    )
+
+
+def count_saved_task(sender: type, instance: Task,
+                     using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """Обработчик post_save: переносит задачу между счетчиками."""
+    if getattr(instance, '_counters_skipped', False):
+        return
+    changes = CounterChanges()
+    changes.move(getattr(instance, '_counted_state', None),
+                 get_state(instance))
+    changes.apply(using)
+
+
+def count_deleted_task(sender: type, instance: Task,
+                       using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """Обработчик post_delete: уменьшает счетчики удаленной задачи."""
+    changes = CounterChanges()
+    changes.move(get_state(instance), None)
+    changes.apply(using)
+
+
+def get_actual_count(task_field: str) -> Coalesce:
+    """
+    Возвращает подзапрос с числом задач строки модели счетчика.
+
+    Args:
+        task_field: Поле задачи, ссылающееся на модель.
+
+    Returns:
+        Coalesce: Число задач или 0.
+    """
+    counts = (Task.objects.order_by()
+              .filter(**{task_field: OuterRef('pk')})
+              .values(task_field).annotate(count=Count('pk'))
+              .values('count'))
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def find_counter_mismatches(
+    using: str = DEFAULT_DB_ALIAS
+) -> List[Tuple[str, int, int, int]]:
+    """
+    Сравнивает счетчики с числом задач, посчитанным GROUP BY.
+
+    Args:
+        using: Алиас базы данных.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: Метка модели, идентификатор
+            строки, значение счетчика и действительное число задач.
+    """
+    mismatches = []
+    for model, field, task_field in COUNTERS:
+        rows = (model._default_manager.using(using)
+                .annotate(actual=get_actual_count(task_field))
+                .exclude(**{field: F('actual')})
+                .values_list('pk', field, 'actual'))
+        mismatches.extend((model._meta.label, *row) for row in rows)
+    return mismatches
+
+
+def rebuild_counters(using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Пересчитывает все счетчики в одной транзакции.
+
+    Args:
+        using: Алиас базы данных.
+
+    Returns:
+        int: Число исправленных строк.
+    """
+    fixed = 0
+    with transaction.atomic(using=using):
+        for model, field, task_field in COUNTERS:
+            actual = get_actual_count(task_field)
+            fixed += (model._default_manager.using(using)
+                      .annotate(actual=actual)
+                      .exclude(**{field: F('actual')})
+                      .update(**{field: actual,
+                                 'updated_at': timezone.now()}))
+            invalidate_model(model._meta.label, choices=False)
+    return fixed
@@ -0,0 +1,151 @@
+import csv
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+
+from task_manager.tasks.models import Task
+
+EXPORT_CHUNK_SIZE = 2000
+# Число строк файла, которые асинхронный поток читает за один переход в
+# поток базы данных
+ASYNC_EXPORT_BATCH_SIZE = 500
+
+EXPORT_FIELDS = (
+    'id',
+    'name',
+    'description',
+    'status',
+    'author',
+    'executor',
+    'labels',
+    'created_at',
+)
+
+
+class Echo:
+    """Псевдобуфер для csv.writer, возвращающий записанную строку."""
+
+    def write(self, value: str) -> str:
+        """
+        Возвращает строку вместо записи в буфер.
+
+        Args:
+            value: Строка, сформированная csv.writer.
+
+        Returns:
+            str: Та же строка.
+        """
+        return value
+
+
+def get_export_queryset(queryset: QuerySet) -> QuerySet:
+    """
+    Готовит QuerySet задач к потоковой выгрузке.
+
+    Автор и исполнитель выгружаются по username, как их ищет импорт
+    (task_manager.tasks.importer), поэтому из строк пользователей
+    выбирается только этот столбец.
+
+    Args:
+        queryset: Отфильтрованные задачи.
+
+    Returns:
+        QuerySet: Задачи со связями, метками и стабильным порядком.
+    """
+    task_fields = [field.name for field in Task._meta.concrete_fields]
+    return (queryset.select_related('status', 'author', 'executor')
+            .only(*task_fields, 'author__username', 'executor__username')
+            .prefetch_related('labels')
+            .order_by('created_at', 'id'))
+
+
+def iter_task_rows(queryset: QuerySet) -> Iterator[Dict[str, Any]]:
+    """
+    Перебирает задачи порциями через серверный курсор.
+
+    Метки подгружаются одним запросом на порцию, поэтому расход памяти
+    не зависит от количества выгружаемых задач.
+
+    Args:
+        queryset: Задачи для выгрузки.
+
+    Yields:
+        Dict[str, Any]: Данные задачи с именами связанных объектов и
+            username автора и исполнителя.
+    """
+    tasks: Iterable[Task] = get_export_queryset(queryset).iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+    for task in tasks:
+        yield {
+            'id': task.pk,
+            'name': task.name,
+            'description': task.description,
+            'status': task.status.name,
+            'author': task.author.username,
+            'executor': task.executor.username if task.executor else '',
+            'labels': [label.name for label in task.labels.all()],
+            'created_at': task.created_at.isoformat(),
+        }
+
+
+def stream_csv(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Формирует CSV построчно.
+
+    Args:
+        rows: Данные задач.
+
+    Yields:
+        str: Строка CSV, начиная с заголовка.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        row['labels'] = ';'.join(row['labels'])
+        yield writer.writerow([row[name] for name in EXPORT_FIELDS])
+
+
+def stream_jsonl(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Формирует JSON Lines: по одному объекту задачи на строку.
+
+    Args:
+        rows: Данные задач.
+
+    Yields:
+        str: Строка JSON с переводом строки.
+    """
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+async def aiter_stream(stream: Iterator[str]) -> AsyncIterator[str]:
+    """
+    Отдает строки синхронного потока выгрузки асинхронному ответу.
+
+    Для синхронного содержимого ASGI-обработчик Django сначала собирает
+    весь ответ в список. Здесь строки читаются порциями по
+    ASYNC_EXPORT_BATCH_SIZE через sync_to_async, поэтому выгрузка
+    остается потоковой и под ASGI.
+
+    Args:
+        stream: Строки файла выгрузки (stream_csv, stream_jsonl).
+
+    Yields:
+        str: Порция строк файла.
+    """
+    def read_batch() -> List[str]:
+        return list(islice(stream, ASYNC_EXPORT_BATCH_SIZE))
+
+    while batch := await sync_to_async(read_batch)():
+        yield ''.join(batch)
+
+
+EXPORT_FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'jsonl': (stream_jsonl, 'application/jsonl; charset=utf-8'),
+}
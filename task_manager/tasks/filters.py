@@ -1,21 +1,94 @@
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import django_filters
 from django import forms
 from django.db import models
+from django.db.models import Count, Exists, OuterRef
 from django.http import HttpRequest
+from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.autocomplete import (AutocompleteSelect,
+                                       AutocompleteSelectMultiple)
+from task_manager.choices import (CachedModelChoiceFilter,
+                                  CachedModelMultipleChoiceFilter)
 from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import search_tasks
+
+User = get_user_model()
+
+LABELS_MATCH_ANY = 'any'
+LABELS_MATCH_ALL = 'all'
+
+
+def filter_by_labels(
+    queryset: models.QuerySet, label_ids: Iterable[int], match: str
+) -> models.QuerySet:
+    """
+    Отбирает задачи с любой или со всеми из заданных меток.
+
+    Оба варианта выполняются одним подзапросом к промежуточной таблице
+    без соединений с ней во внешнем запросе, поэтому задачи не
+    дублируются, а стоимость не растет с числом меток так, как у цепочки
+    filter(labels=...).
+
+    Args:
+        queryset: Исходный QuerySet задач.
+        label_ids: Идентификаторы меток.
+        match: LABELS_MATCH_ANY или LABELS_MATCH_ALL.
+
+    Returns:
+        models.QuerySet: Отфильтрованный QuerySet задач.
+    """
+    label_ids = set(label_ids)
+    links = Task.labels.through.objects.filter(label_id__in=label_ids)
+    if match == LABELS_MATCH_ALL:
+        # GROUP BY task_id HAVING COUNT(label_id) = <число меток>
+        matching = (links.values('task_id')
+                    .annotate(matched=Count('label_id'))
+                    .filter(matched=len(label_ids))
+                    .values('task_id'))
+        return queryset.filter(pk__in=matching)
+    return queryset.filter(Exists(links.filter(task_id=OuterRef('pk'))))
 
 
 class TaskFilterForm(django_filters.FilterSet):
-    """Фильтр для задач."""
+    """
+    Фильтр для задач.
+
+    Варианты статусов, исполнителей и меток читаются из кэша
+    (task_manager.choices), поэтому вывод формы не обращается к базе.
+    """
 
-    labels = django_filters.ModelChoiceFilter(
-        label=_('Label'),
-        queryset=Label.objects.all()
+    status = CachedModelChoiceFilter(
+        label=_('Status'),
+        queryset=Status.objects.all()
+    )
+    executor = CachedModelChoiceFilter(
+        label=_('Executor'),
+        queryset=User.objects.all(),
+        widget=AutocompleteSelect
+    )
+    search = django_filters.CharFilter(
+        label=_('Search'),
+        method='filter_by_search'
+    )
+    labels = CachedModelMultipleChoiceFilter(
+        label=_('Labels'),
+        queryset=Label.objects.all(),
+        widget=AutocompleteSelectMultiple,
+        method='filter_by_labels'
+    )
+    labels_match = django_filters.ChoiceFilter(
+        label=_('Labels match'),
+        choices=(
+            (LABELS_MATCH_ANY, _('Any of the labels')),
+            (LABELS_MATCH_ALL, _('All of the labels')),
+        ),
+        empty_label=None,
+        method='filter_by_labels_match'
     )
     self_tasks = django_filters.BooleanFilter(
         label=_('Only your tasks'),
@@ -30,6 +103,9 @@ class TaskFilterForm(django_filters.FilterSet):
         """
         Инициализирует фильтр с передачей request.
 
+        Присоединяет к исходному QuerySet статус, автора и исполнителя,
+        чтобы результат фильтрации отображался без дополнительных запросов.
+
         Args:
             *args: Дополнительные позиционные аргументы.
             request: HTTP запрос для доступа к текущему пользователю.
@@ -37,6 +113,92 @@ class TaskFilterForm(django_filters.FilterSet):
         """
         super().__init__(*args, **kwargs)
         self.request = request
+        self.queryset = self.queryset.with_related()
+
+    @property
+    def strict_qs(self) -> models.QuerySet:
+        """
+        Возвращает отфильтрованные задачи так же, как их отбирает FilterView.
+
+        При неверных параметрах фильтра возвращается пустой QuerySet, а не
+        все задачи, поэтому свойство безопасно для выгрузки и массовых
+        операций.
+
+        Returns:
+            models.QuerySet: Отфильтрованный QuerySet задач.
+        """
+        if self.is_bound and not self.is_valid():
+            return self.queryset.none()
+        return self.qs
+
+    def filter_by_search(
+        self, queryset: models.QuerySet, name: str, value: str
+    ) -> models.QuerySet:
+        """
+        Отбирает задачи по полнотекстовому индексу названия и описания.
+
+        Результаты упорядочиваются по релевантности представлением
+        (см. tasks.search.SEARCH_ORDER).
+
+        Args:
+            queryset: Исходный QuerySet задач.
+            name: Имя поля фильтра.
+            value: Строка поиска.
+
+        Returns:
+            models.QuerySet: Найденные задачи.
+        """
+        return search_tasks(queryset, value)
+
+    def get_labels_match(self) -> str:
+        """
+        Возвращает выбранный режим фильтра по меткам.
+
+        Returns:
+            str: LABELS_MATCH_ANY или LABELS_MATCH_ALL.
+        """
+        cleaned_data = getattr(self.form, 'cleaned_data', None)
+        if cleaned_data is None:
+            # Фильтр применен без валидации формы (explain_task_filters)
+            cleaned_data = self.data
+        if cleaned_data.get('labels_match') == LABELS_MATCH_ALL:
+            return LABELS_MATCH_ALL
+        return LABELS_MATCH_ANY
+
+    def filter_by_labels(
+        self, queryset: models.QuerySet, name: str, value: Iterable[Any]
+    ) -> models.QuerySet:
+        """
+        Фильтрует задачи по меткам в выбранном режиме (любая или все).
+
+        Args:
+            queryset: Исходный QuerySet задач.
+            name: Имя поля фильтра.
+            value: Выбранные метки или их идентификаторы.
+
+        Returns:
+            models.QuerySet: Отфильтрованный QuerySet задач.
+        """
+        if not value:
+            return queryset
+        label_ids = [getattr(label, 'pk', label) for label in value]
+        return filter_by_labels(queryset, label_ids, self.get_labels_match())
+
+    def filter_by_labels_match(
+        self, queryset: models.QuerySet, name: str, value: str
+    ) -> models.QuerySet:
+        """
+        Режим применяется фильтром labels, сам по себе QuerySet не меняет.
+
+        Args:
+            queryset: Исходный QuerySet задач.
+            name: Имя поля фильтра.
+            value: Выбранный режим.
+
+        Returns:
+            models.QuerySet: Исходный QuerySet задач.
+        """
+        return queryset
 
     def filter_by_self_tasks(
         self, queryset: models.QuerySet, name: str, value: bool
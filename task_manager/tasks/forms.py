@@ -1,13 +1,42 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
 from django import forms
 from django.contrib.auth import get_user_model
+from django.db import DatabaseError, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
+from task_manager.autocomplete import (AutocompleteSelect,
+                                       AutocompleteSelectMultiple)
+from task_manager.cache import invalidate_model
+from task_manager.choices import (CachedModelChoiceField,
+                                  CachedModelMultipleChoiceField)
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import CounterChanges, get_state
+from task_manager.tasks.importer import (ImportFormatError,
+                                         check_encoding,
+                                         detect_format)
 from task_manager.tasks.models import Task
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = 500
+
 
 class TaskForm(forms.ModelForm):
-    """Форма для создания и обновления задачи."""
+    """
+    Форма для создания и обновления задачи.
+
+    Варианты статуса, исполнителя и меток читаются из кэша
+    (task_manager.choices), большие списки исполнителей и меток
+    заменяются поиском (task_manager.autocomplete).
+    """
 
     class Meta:
         """Метаданные формы."""
@@ -20,3 +49,334 @@ class TaskForm(forms.ModelForm):
             'executor',
             'labels',
         )
+        field_classes = {
+            'status': CachedModelChoiceField,
+            'executor': CachedModelChoiceField,
+            'labels': CachedModelMultipleChoiceField,
+        }
+        widgets = {
+            'executor': AutocompleteSelect,
+            'labels': AutocompleteSelectMultiple,
+        }
+
+
+def chunks(items: List[int], size: int = BULK_BATCH_SIZE) -> Iterator[List[int]]:
+    """
+    Разбивает список на части для запросов с ограниченным числом параметров.
+
+    Args:
+        items: Исходный список.
+        size: Размер части.
+
+    Yields:
+        List[int]: Очередная часть списка.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+@dataclass
+class BulkActionResult:
+    """Результат массовой операции над задачами."""
+
+    updated: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+
+
+class TaskBulkActionForm(forms.Form):
+    """Форма массовой операции над выбранными или отфильтрованными задачами."""
+
+    SET_STATUS = 'set_status'
+    SET_EXECUTOR = 'set_executor'
+    ADD_LABELS = 'add_labels'
+    REMOVE_LABELS = 'remove_labels'
+
+    action = forms.ChoiceField(
+        label=_('Action'),
+        choices=(
+            (SET_STATUS, _('Change status')),
+            (SET_EXECUTOR, _('Change executor')),
+            (ADD_LABELS, _('Add labels')),
+            (REMOVE_LABELS, _('Remove labels')),
+        )
+    )
+    tasks = forms.Field(
+        widget=forms.MultipleHiddenInput,
+        required=False
+    )
+    apply_to_filtered = forms.BooleanField(
+        label=_('Apply to all filtered tasks'),
+        required=False
+    )
+    status = CachedModelChoiceField(
+        label=_('Status'),
+        queryset=Status.objects.all(),
+        required=False
+    )
+    executor = CachedModelChoiceField(
+        label=_('Executor'),
+        queryset=User.objects.all(),
+        widget=AutocompleteSelect,
+        required=False
+    )
+    labels = CachedModelMultipleChoiceField(
+        label=_('Labels'),
+        queryset=Label.objects.all(),
+        widget=AutocompleteSelectMultiple,
+        required=False
+    )
+
+    def clean_tasks(self) -> List[int]:
+        """
+        Преобразует переданные идентификаторы задач в числа.
+
+        Returns:
+            List[int]: Идентификаторы задач без повторов.
+
+        Raises:
+            forms.ValidationError: Если идентификатор не является числом.
+        """
+        try:
+            return list(dict.fromkeys(
+                int(value) for value in self.cleaned_data['tasks'] or []
+            ))
+        except (TypeError, ValueError):
+            raise forms.ValidationError(_('Invalid task identifier'))
+
+    def clean(self) -> Dict[str, Any]:
+        """
+        Проверяет, что для выбранного действия заданы нужные значения.
+
+        Returns:
+            Dict[str, Any]: Очищенные данные формы.
+        """
+        cleaned_data = super().clean()
+        action = cleaned_data.get('action')
+        if (not cleaned_data.get('tasks')
+                and not cleaned_data.get('apply_to_filtered')):
+            self.add_error(None, _(
+                'Select tasks or apply the action to all filtered tasks'
+            ))
+        if action == self.SET_STATUS and not cleaned_data.get('status'):
+            self.add_error('status', _('This field is required.'))
+        if (action in (self.ADD_LABELS, self.REMOVE_LABELS)
+                and not cleaned_data.get('labels')):
+            self.add_error('labels', _('This field is required.'))
+        return cleaned_data
+
+    def apply(self, queryset: Optional[QuerySet] = None) -> BulkActionResult:
+        """
+        Применяет действие к задачам частями по BULK_BATCH_SIZE.
+
+        Каждая часть блокируется и обрабатывается в своей транзакции,
+        поэтому применение ко всем отфильтрованным задачам не загружает и
+        не блокирует их все сразу. Если часть не удалось сохранить, ее
+        изменения откатываются, задачи попадают в result.failed, а
+        обработка продолжается со следующей части. Статус и исполнитель
+        обновляются через bulk_update, метки - пакетной вставкой и
+        удалением строк промежуточной таблицы.
+
+        Args:
+            queryset: Отфильтрованные задачи, если выбрано применение ко
+                всем отфильтрованным задачам. Иначе используются
+                идентификаторы из поля tasks.
+
+        Returns:
+            BulkActionResult: Обновленные задачи и причины отказа по
+                идентификаторам, которые не удалось обработать.
+        """
+        result = BulkActionResult()
+        handler = getattr(self, f'apply_{self.cleaned_data["action"]}')
+        try:
+            for task_ids in self.iter_task_ids(queryset, result):
+                try:
+                    tasks = self.apply_chunk(handler, task_ids, result)
+                except DatabaseError:
+                    logger.exception('Bulk action %s failed for %d tasks',
+                                     self.cleaned_data['action'],
+                                     len(task_ids))
+                    for pk in task_ids:
+                        result.failed.setdefault(
+                            pk, str(_('Changes were not saved'))
+                        )
+                    continue
+                result.updated.extend(task.pk for task in tasks)
+        finally:
+            # Массовые операции не отправляют сигналы моделей
+            invalidate_model(Task._meta.label)
+        return result
+
+    @staticmethod
+    @transaction.atomic
+    def apply_chunk(handler: Callable[[List[Task]], None],
+                    task_ids: List[int],
+                    result: BulkActionResult) -> List[Task]:
+        """
+        Блокирует и обрабатывает одну часть задач в транзакции.
+
+        Args:
+            handler: Обработчик действия.
+            task_ids: Идентификаторы задач части.
+            result: Результат операции, в него записываются
+                ненайденные задачи.
+
+        Returns:
+            List[Task]: Обработанные задачи.
+        """
+        tasks = list(Task.objects.filter(pk__in=task_ids)
+                     .select_for_update().order_by('pk'))
+        found = {task.pk for task in tasks}
+        for pk in task_ids:
+            if pk not in found:
+                result.failed[pk] = str(_('Task not found'))
+        handler(tasks)
+        return tasks
+
+    def iter_task_ids(self, queryset: Optional[QuerySet],
+                      result: BulkActionResult) -> Iterator[List[int]]:
+        """
+        Возвращает идентификаторы обрабатываемых задач частями.
+
+        Для отфильтрованных задач части читаются по возрастанию pk с
+        условием pk > последнего прочитанного, поэтому задачи, которые
+        действие выводит из фильтра, не сдвигают следующие части.
+        Отмеченные задачи вне фильтра попадают в result.failed.
+
+        Args:
+            queryset: Отфильтрованные задачи или None.
+            result: Результат операции.
+
+        Yields:
+            List[int]: Очередная часть идентификаторов.
+        """
+        ids = self.cleaned_data['tasks']
+        if queryset is None:
+            yield from chunks(ids)
+            return
+        for task_ids in chunks(ids):
+            self.report_outside_filter(queryset, task_ids, result)
+        pks = queryset.order_by('pk').values_list('pk', flat=True)
+        task_ids = list(pks[:BULK_BATCH_SIZE])
+        while task_ids:
+            yield task_ids
+            task_ids = list(pks.filter(pk__gt=task_ids[-1])[:BULK_BATCH_SIZE])
+
+    @staticmethod
+    def report_outside_filter(queryset: QuerySet, task_ids: List[int],
+                              result: BulkActionResult) -> None:
+        """
+        Записывает причины отказа для отмеченных задач вне фильтра.
+
+        Args:
+            queryset: Отфильтрованные задачи.
+            task_ids: Отмеченные идентификаторы.
+            result: Результат операции.
+        """
+        filtered = set(queryset.filter(pk__in=task_ids)
+                       .values_list('pk', flat=True))
+        outside = [pk for pk in task_ids if pk not in filtered]
+        existing = set(Task.objects.filter(pk__in=outside)
+                       .values_list('pk', flat=True))
+        for pk in outside:
+            result.failed[pk] = str(_('Not in the filtered tasks')
+                                    if pk in existing
+                                    else _('Task not found'))
+
+    @staticmethod
+    def touch(tasks: List[Task]) -> None:
+        """
+        Обновляет updated_at задач.
+
+        Операции с промежуточной таблицей не меняют строки задач, а по
+        updated_at проверяется актуальность страниц.
+
+        Args:
+            tasks: Измененные задачи.
+        """
+        now = timezone.now()
+        for task_ids in chunks([task.pk for task in tasks]):
+            Task.objects.filter(pk__in=task_ids).update(updated_at=now)
+
+    def apply_set_status(self, tasks: List[Task]) -> None:
+        """Устанавливает статус задачам."""
+        now = timezone.now()
+        changes = CounterChanges()
+        for task in tasks:
+            previous = get_state(task)
+            task.status = self.cleaned_data['status']
+            task.updated_at = now
+            changes.move(previous, get_state(task))
+        # bulk_update не заполняет поля auto_now и не отправляет сигналы,
+        # которые обновляют счетчики задач
+        Task.objects.bulk_update(tasks, ['status', 'updated_at'],
+                                 batch_size=BULK_BATCH_SIZE)
+        changes.apply()
+
+    def apply_set_executor(self, tasks: List[Task]) -> None:
+        """Назначает исполнителя задачам (пустое значение снимает его)."""
+        now = timezone.now()
+        changes = CounterChanges()
+        for task in tasks:
+            previous = get_state(task)
+            task.executor = self.cleaned_data['executor']
+            task.updated_at = now
+            changes.move(previous, get_state(task))
+        Task.objects.bulk_update(tasks, ['executor', 'updated_at'],
+                                 batch_size=BULK_BATCH_SIZE)
+        changes.apply()
+
+    def apply_add_labels(self, tasks: List[Task]) -> None:
+        """
+        Добавляет метки задачам.
+
+        Уже существующие связи, в том числе вставленные параллельным
+        запросом, пропускаются самой базой данных (ignore_conflicts).
+        """
+        through = Task.labels.through
+        label_ids = [label.pk for label in self.cleaned_data['labels']]
+        for task_ids in chunks([task.pk for task in tasks]):
+            through.objects.bulk_create(
+                [through(task_id=task_id, label_id=label_id)
+                 for task_id in task_ids
+                 for label_id in label_ids],
+                batch_size=BULK_BATCH_SIZE,
+                ignore_conflicts=True
+            )
+        self.touch(tasks)
+
+    def apply_remove_labels(self, tasks: List[Task]) -> None:
+        """Удаляет метки у задач."""
+        for task_ids in chunks([task.pk for task in tasks]):
+            Task.labels.through.objects.filter(
+                task_id__in=task_ids,
+                label__in=self.cleaned_data['labels']
+            ).delete()
+        self.touch(tasks)
+
+
+class TaskImportForm(forms.Form):
+    """Форма загрузки файла для импорта задач."""
+
+    file = forms.FileField(
+        label=_('File'),
+        help_text=_('CSV or JSON Lines file in the task export format')
+    )
+
+    def clean_file(self) -> Any:
+        """
+        Проверяет, что формат и кодировка файла поддерживаются.
+
+        Returns:
+            Any: Загруженный файл.
+
+        Raises:
+            forms.ValidationError: Если расширение файла не поддерживается
+                или файл не в кодировке UTF-8.
+        """
+        uploaded = self.cleaned_data['file']
+        try:
+            self.import_format = detect_format(uploaded.name)
+            check_encoding(uploaded)
+        except ImportFormatError as error:
+            raise forms.ValidationError(str(error))
+        return uploaded
@@ -0,0 +1,492 @@
+import codecs
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (Any, BinaryIO, Dict, Iterable, Iterator, List, Optional,
+                    Set, TextIO, Tuple)
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Model
+from django.utils.translation import gettext as _
+
+from task_manager.cache import invalidate_model
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import CounterChanges, get_state
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import index_tasks
+
+User = get_user_model()
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_FORMATS = ('csv', 'jsonl')
+IMPORT_ENCODING = 'utf-8'
+# Размер части файла при проверке кодировки
+ENCODING_CHUNK_SIZE = 64 * 1024
+NAME_MAX_LENGTH = 50
+
+
+class ImportFormatError(ValueError):
+    """Файл импорта не удалось разобрать."""
+
+
+@dataclass
+class ImportRow:
+    """Строка файла импорта после первичной проверки."""
+
+    line: int
+    name: str
+    description: str
+    status: str
+    author: str
+    executor: str
+    labels: List[str]
+
+
+@dataclass
+class ImportResult:
+    """Итог импорта задач."""
+
+    tasks: int = 0
+    statuses: int = 0
+    labels: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Скорость импорта в обработанных строках в секунду."""
+        rows = self.tasks + len(self.rejected)
+        return rows / self.elapsed if self.elapsed else float(rows)
+
+
+def detect_format(filename: str) -> str:
+    """
+    Определяет формат файла импорта по расширению.
+
+    Args:
+        filename: Имя файла.
+
+    Returns:
+        str: 'csv' или 'jsonl'.
+
+    Raises:
+        ImportFormatError: Если расширение не поддерживается.
+    """
+    extension = filename.rsplit('.', 1)[-1].lower()
+    if extension not in IMPORT_FORMATS:
+        raise ImportFormatError(
+            _('Unsupported file format: %(extension)s')
+            % {'extension': extension}
+        )
+    return extension
+
+
+def check_encoding(stream: BinaryIO) -> None:
+    """
+    Проверяет, что файл импорта - текст в кодировке IMPORT_ENCODING.
+
+    Файл читается частями до начала импорта, поэтому ошибка кодировки
+    в конце файла не оставляет импортированной его первую часть.
+    После проверки поток возвращается в начало.
+
+    Args:
+        stream: Двоичный поток с данными.
+
+    Raises:
+        ImportFormatError: Если данные не декодируются.
+    """
+    decoder = codecs.getincrementaldecoder(IMPORT_ENCODING)()
+    try:
+        while chunk := stream.read(ENCODING_CHUNK_SIZE):
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        raise ImportFormatError(
+            _('File must be %(encoding)s encoded text')
+            % {'encoding': IMPORT_ENCODING.upper()}
+        )
+    finally:
+        stream.seek(0)
+
+
+def read_rows(stream: TextIO, import_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Читает строки файла импорта в виде словарей.
+
+    Формат совпадает с выгрузкой задач: метки в CSV разделены ';',
+    в JSON Lines передаются списком или строкой с тем же разделителем.
+
+    Args:
+        stream: Текстовый поток с данными.
+        import_format: Формат данных ('csv' или 'jsonl').
+
+    Yields:
+        Dict[str, Any]: Данные строки с ключом '_line' (номер строки файла,
+            для многострочной записи CSV - последней ее строки).
+    """
+    if import_format == 'csv':
+        reader = csv.DictReader(stream)
+        # Значение в кавычках может занимать несколько строк файла,
+        # поэтому номер берется из счетчика строк читателя
+        rows = ((reader.line_num, row) for row in reader)
+    else:
+        rows = (
+            (line, parse_json_line(text))
+            for line, text in enumerate(stream, start=1)
+            if text.strip()
+        )
+    for line, row in rows:
+        row['_line'] = line
+        yield row
+
+
+def parse_json_line(text: str) -> Dict[str, Any]:
+    """
+    Разбирает строку JSON Lines.
+
+    Args:
+        text: Строка файла.
+
+    Returns:
+        Dict[str, Any]: Объект строки или пустой словарь, если строка не
+            является JSON-объектом (такая строка будет отклонена).
+    """
+    try:
+        row = json.loads(text)
+    except ValueError:
+        return {}
+    return row if isinstance(row, dict) else {}
+
+
+def split_labels(value: Any) -> List[str]:
+    """
+    Приводит значение поля меток к списку имен.
+
+    Args:
+        value: Список имен или строка с именами через ';'.
+
+    Returns:
+        List[str]: Имена меток без повторов и пустых значений.
+    """
+    if isinstance(value, str):
+        value = value.split(';')
+    names = (str(name).strip() for name in value or [])
+    return list(dict.fromkeys(name for name in names if name))
+
+
+class TaskImporter:
+    """
+    Пакетный импорт задач вместе с недостающими статусами и метками.
+
+    Строки обрабатываются пакетами по batch_size. Для каждого пакета
+    имена статусов, меток и пользователей разрешаются одним запросом на
+    модель, задачи и связи с метками вставляются через bulk_create в одной
+    транзакции. Строки с ошибками отклоняются с указанием причины и не
+    мешают импорту остальных строк.
+    """
+
+    def __init__(
+        self,
+        default_author: Optional[Model] = None,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> None:
+        """
+        Args:
+            default_author: Автор задач, для которых автор не указан.
+            batch_size: Количество строк в пакете.
+        """
+        self.default_author = default_author
+        self.batch_size = batch_size
+
+    def import_rows(self, rows: Iterable[Dict[str, Any]]) -> ImportResult:
+        """
+        Импортирует задачи из строк.
+
+        Args:
+            rows: Строки файла импорта (см. read_rows).
+
+        Returns:
+            ImportResult: Количество созданных объектов, отклоненные строки
+                и время импорта.
+        """
+        result = ImportResult()
+        started = time.perf_counter()
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            self.import_batch(batch, result)
+        result.elapsed = time.perf_counter() - started
+        result.rejected.sort()
+        # bulk_create не отправляет сигналы моделей
+        for model in (Task, Status, Label):
+            invalidate_model(model._meta.label)
+        return result
+
+    def import_batch(
+        self, batch: List[Dict[str, Any]], result: ImportResult
+    ) -> None:
+        """
+        Проверяет и сохраняет один пакет строк.
+
+        Если параллельная запись создала задачу, статус или метку с тем же
+        именем после проверки, транзакция пакета откатывается и все его
+        строки отклоняются: их можно импортировать повторно.
+
+        Args:
+            batch: Строки пакета.
+            result: Итог импорта, дополняемый результатами пакета.
+        """
+        rows = self.parse_rows(batch, result)
+        rows = self.reject_existing_names(rows, result)
+        users = self.resolve_users(rows)
+        rows = self.reject_unknown_users(rows, users, result)
+        if not rows:
+            return
+        saved = ImportResult()
+        try:
+            with transaction.atomic():
+                self.save_batch(rows, users, saved)
+        except IntegrityError:
+            result.rejected.extend(
+                (row.line, _('Conflicts with data saved at the same time'))
+                for row in rows
+            )
+            return
+        result.tasks += saved.tasks
+        result.statuses += saved.statuses
+        result.labels += saved.labels
+
+    def save_batch(self, rows: List[ImportRow], users: Dict[str, Model],
+                   saved: ImportResult) -> None:
+        """
+        Создает задачи пакета с недостающими статусами и метками.
+
+        Args:
+            rows: Проверенные строки пакета.
+            users: Пользователи пакета по username.
+            saved: Счетчики объектов, созданных пакетом.
+
+        Raises:
+            IntegrityError: Если имя уже занято параллельной записью.
+        """
+        statuses = self.resolve_names(
+            Status, {row.status for row in rows}, saved, 'statuses'
+        )
+        labels = self.resolve_names(
+            Label, {name for row in rows for name in row.labels},
+            saved, 'labels'
+        )
+        tasks = Task.objects.bulk_create([
+            Task(
+                name=row.name,
+                description=row.description,
+                status_id=statuses[row.status],
+                author=users.get(row.author, self.default_author),
+                executor=users.get(row.executor),
+            )
+            for row in rows
+        ], batch_size=self.batch_size)
+        self.create_task_labels(rows, tasks, labels)
+        # bulk_create не отправляет post_save
+        index_tasks(tasks)
+        changes = CounterChanges()
+        for task in tasks:
+            changes.move(None, get_state(task))
+        changes.apply()
+        saved.tasks += len(tasks)
+
+    def parse_rows(
+        self, batch: List[Dict[str, Any]], result: ImportResult
+    ) -> List[ImportRow]:
+        """
+        Проверяет обязательные поля и длину имен без обращения к БД.
+
+        Args:
+            batch: Строки пакета.
+            result: Итог импорта для отклоненных строк.
+
+        Returns:
+            List[ImportRow]: Корректные строки.
+        """
+        rows = []
+        seen: Set[str] = set()
+        for raw in batch:
+            row = ImportRow(
+                line=raw['_line'],
+                name=str(raw.get('name') or '').strip(),
+                description=str(raw.get('description') or ''),
+                status=str(raw.get('status') or '').strip(),
+                author=str(raw.get('author') or '').strip(),
+                executor=str(raw.get('executor') or '').strip(),
+                labels=split_labels(raw.get('labels')),
+            )
+            error = self.validate_row(row, seen)
+            if error:
+                result.rejected.append((row.line, error))
+                continue
+            seen.add(row.name)
+            rows.append(row)
+        return rows
+
+    def validate_row(self, row: ImportRow, seen: Set[str]) -> Optional[str]:
+        """
+        Возвращает причину отклонения строки или None.
+
+        Args:
+            row: Проверяемая строка.
+            seen: Имена задач, уже встреченные в пакете.
+
+        Returns:
+            Optional[str]: Текст ошибки.
+        """
+        names = [row.name, row.status, *row.labels]
+        if not row.name:
+            return _('Name is required')
+        if not row.status:
+            return _('Status is required')
+        if not row.author and self.default_author is None:
+            return _('Author is required')
+        if any(len(name) > NAME_MAX_LENGTH for name in names):
+            return _('Name is too long')
+        if row.name in seen:
+            return _('Duplicate task name')
+        return None
+
+    def reject_existing_names(
+        self, rows: List[ImportRow], result: ImportResult
+    ) -> List[ImportRow]:
+        """
+        Отклоняет строки с именами уже существующих задач.
+
+        Args:
+            rows: Строки пакета.
+            result: Итог импорта для отклоненных строк.
+
+        Returns:
+            List[ImportRow]: Строки с новыми именами.
+        """
+        existing = set(Task.objects.filter(
+            name__in=[row.name for row in rows]
+        ).values_list('name', flat=True))
+        accepted = []
+        for row in rows:
+            if row.name in existing:
+                result.rejected.append(
+                    (row.line, _('Task with this name already exists'))
+                )
+            else:
+                accepted.append(row)
+        return accepted
+
+    def resolve_users(self, rows: List[ImportRow]) -> Dict[str, Model]:
+        """
+        Загружает пользователей пакета одним запросом.
+
+        Args:
+            rows: Строки пакета.
+
+        Returns:
+            Dict[str, Model]: Пользователи по username.
+        """
+        usernames = {row.author for row in rows} | {row.executor for row in rows}
+        usernames.discard('')
+        return {
+            user.username: user
+            for user in User.objects.filter(username__in=usernames)
+        }
+
+    def reject_unknown_users(
+        self,
+        rows: List[ImportRow],
+        users: Dict[str, Model],
+        result: ImportResult,
+    ) -> List[ImportRow]:
+        """
+        Отклоняет строки с неизвестными автором или исполнителем.
+
+        Args:
+            rows: Строки пакета.
+            users: Найденные пользователи по username.
+            result: Итог импорта для отклоненных строк.
+
+        Returns:
+            List[ImportRow]: Строки с известными пользователями.
+        """
+        accepted = []
+        for row in rows:
+            unknown = [name for name in (row.author, row.executor)
+                       if name and name not in users]
+            if unknown:
+                result.rejected.append((row.line, _(
+                    'Unknown user: %(username)s'
+                ) % {'username': unknown[0]}))
+            else:
+                accepted.append(row)
+        return accepted
+
+    @staticmethod
+    def resolve_names(
+        model: type, names: Set[str], result: ImportResult, counter: str
+    ) -> Dict[str, int]:
+        """
+        Находит объекты по имени и создает недостающие.
+
+        Недостающие объекты вставляются без ignore_conflicts, поэтому
+        в счетчик попадают только действительно созданные строки.
+
+        Args:
+            model: Модель со столбцом name (Status или Label).
+            names: Имена объектов.
+            result: Итог пакета для подсчета созданных объектов.
+            counter: Имя счетчика в ImportResult.
+
+        Returns:
+            Dict[str, int]: Идентификаторы объектов по имени.
+
+        Raises:
+            IntegrityError: Если недостающее имя создано параллельно.
+        """
+        if not names:
+            return {}
+        ids = dict(model.objects.filter(name__in=names)
+                   .values_list('name', 'pk'))
+        missing = names - ids.keys()
+        if missing:
+            model.objects.bulk_create([model(name=name) for name in missing])
+            ids = dict(model.objects.filter(name__in=names)
+                       .values_list('name', 'pk'))
+            setattr(result, counter, getattr(result, counter) + len(missing))
+        return ids
+
+    def create_task_labels(
+        self,
+        rows: List[ImportRow],
+        tasks: List[Task],
+        labels: Dict[str, int],
+    ) -> None:
+        """
+        Вставляет связи задач с метками пакетом.
+
+        Args:
+            rows: Строки пакета в порядке создания задач.
+            tasks: Созданные задачи.
+            labels: Идентификаторы меток по имени.
+        """
+        if not labels:
+            return
+        if any(task.pk is None for task in tasks):
+            # База данных не вернула идентификаторы из bulk_create
+            task_ids = dict(Task.objects.filter(
+                name__in=[task.name for task in tasks]
+            ).values_list('name', 'pk'))
+        else:
+            task_ids = {task.name: task.pk for task in tasks}
+        through = Task.labels.through
+        through.objects.bulk_create([
+            through(task_id=task_ids[row.name], label_id=labels[name])
+            for row in rows
+            for name in row.labels
+        ], batch_size=self.batch_size)
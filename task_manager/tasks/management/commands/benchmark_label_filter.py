@@ -0,0 +1,110 @@
+import time
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import QuerySet
+
+from task_manager.labels.models import Label
+from task_manager.tasks.filters import (LABELS_MATCH_ALL,
+                                        LABELS_MATCH_ANY,
+                                        filter_by_labels)
+from task_manager.tasks.models import Task
+
+
+def chained_joins(queryset: QuerySet, label_ids: List[int]) -> QuerySet:
+    """
+    Фильтр "все метки" цепочкой соединений, для сравнения.
+
+    Args:
+        queryset: Исходный QuerySet задач.
+        label_ids: Идентификаторы меток.
+
+    Returns:
+        QuerySet: QuerySet с соединением на каждую метку.
+    """
+    for label_id in label_ids:
+        queryset = queryset.filter(labels=label_id)
+    return queryset
+
+
+class Command(BaseCommand):
+    """Сравнивает время фильтра по меткам в зависимости от их числа."""
+
+    help = (
+        'Times the task labels filter (any, all and chained joins) '
+        'for 1..N labels on the current database'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--max-labels', type=int, default=5,
+            help='Largest number of labels to filter by',
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Runs per measurement, the best one is reported',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Печатает таблицу времени выполнения фильтров.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+
+        Raises:
+            CommandError: Если в базе нет меток.
+        """
+        label_ids = list(Label.objects.order_by('pk')
+                         .values_list('pk', flat=True)[:options['max_labels']])
+        if not label_ids:
+            raise CommandError('No labels in the database')
+        variants = (
+            ('any', lambda qs, ids: filter_by_labels(
+                qs, ids, LABELS_MATCH_ANY)),
+            ('all', lambda qs, ids: filter_by_labels(
+                qs, ids, LABELS_MATCH_ALL)),
+            ('joins', chained_joins),
+        )
+        self.stdout.write(f'Tasks: {Task.objects.count()}')
+        self.stdout.write(
+            'labels ' + ' '.join(f'{name:>16}' for name, _ in variants)
+        )
+        for count in range(1, len(label_ids) + 1):
+            cells = [
+                self.measure(apply, label_ids[:count], options['repeat'])
+                for _name, apply in variants
+            ]
+            self.stdout.write(f'{count:>6} ' + ' '.join(cells))
+
+    @staticmethod
+    def measure(
+        apply: Callable[[QuerySet, List[int]], QuerySet],
+        label_ids: List[int],
+        repeat: int,
+    ) -> str:
+        """
+        Замеряет лучшее время отбора задач фильтром.
+
+        Args:
+            apply: Функция, применяющая фильтр к QuerySet.
+            label_ids: Идентификаторы меток.
+            repeat: Число запусков.
+
+        Returns:
+            str: Время в миллисекундах и число найденных задач.
+        """
+        best = float('inf')
+        found = 0
+        for _run in range(max(repeat, 1)):
+            started = time.perf_counter()
+            found = apply(Task.objects.all(), label_ids).count()
+            best = min(best, time.perf_counter() - started)
+        return f'{best * 1000:>8.2f}ms/{found:<5}'
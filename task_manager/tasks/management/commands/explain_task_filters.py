@@ -0,0 +1,113 @@
+from itertools import combinations
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+from task_manager.labels.models import Label
+from task_manager.pagination import CursorPaginator
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import (LABELS_MATCH_ALL,
+                                        LABELS_MATCH_ANY,
+                                        TaskFilterForm)
+from task_manager.tasks.search import get_search_ordering
+from task_manager.tasks.views import TaskListView
+from task_manager.users.models import User
+
+FILTER_NAMES = ('search', 'status', 'executor', 'labels', 'self_tasks')
+
+
+class Command(BaseCommand):
+    """Печатает планы выполнения запросов списка задач для всех фильтров."""
+
+    help = (
+        'Prints EXPLAIN plans of the task list query for every combination '
+        'of TaskFilterForm filters'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--analyze', action='store_true',
+            help='Run EXPLAIN ANALYZE (PostgreSQL only)',
+        )
+        parser.add_argument(
+            '--page-size', type=int, default=50,
+            help='Page size used by the task list',
+        )
+        parser.add_argument(
+            '--labels', type=int, default=1,
+            help='Number of labels passed to the labels filter',
+        )
+        parser.add_argument(
+            '--labels-match', choices=(LABELS_MATCH_ANY, LABELS_MATCH_ALL),
+            default=LABELS_MATCH_ANY,
+            help='Labels filter mode',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Выводит план запроса первой страницы списка для каждой комбинации.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        explain_options = {'analyze': True} if options['analyze'] else {}
+        user = User.objects.order_by('pk').first() or User(pk=1)
+        request = SimpleNamespace(user=user)
+        self.stdout.write(f'Database vendor: {connection.vendor}')
+        filterset = TaskFilterForm(
+            {'labels_match': options['labels_match']}, request=request
+        )
+        for names, data in self.filter_combinations(user, options['labels']):
+            # Фильтры применяются напрямую, без валидации формы, чтобы план
+            # можно было получить и на пустой базе данных.
+            queryset = filterset.queryset
+            for name, value in data.items():
+                queryset = filterset.filters[name].filter(queryset, value)
+            # Сортировка списка задач: при поиске - по релевантности
+            paginator = CursorPaginator(
+                queryset, options['page_size'],
+                get_search_ordering(queryset, TaskListView.cursor_ordering),
+            )
+            queryset = queryset.order_by(*paginator.ordering)
+            queryset = queryset[:paginator.per_page + 1]
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                'Filters: ' + (', '.join(names) or 'none')
+            ))
+            self.stdout.write(queryset.explain(**explain_options))
+
+    def filter_combinations(
+        self, user: User, label_count: int = 1
+    ) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        """
+        Перебирает все комбинации фильтров с образцами значений.
+
+        Args:
+            user: Пользователь, используемый как исполнитель и автор.
+            label_count: Количество меток в значении фильтра labels.
+
+        Yields:
+            Tuple[Tuple[str, ...], Dict[str, Any]]: Имена фильтров и их
+                значения.
+        """
+        status = Status.objects.order_by('pk').first()
+        label_ids = list(Label.objects.order_by('pk')
+                         .values_list('pk', flat=True)[:label_count])
+        values = {
+            'status': status.pk if status else 1,
+            'executor': user.pk,
+            'labels': label_ids or list(range(1, label_count + 1)),
+            'self_tasks': True,
+            'search': 'task',
+        }
+        for size in range(len(FILTER_NAMES) + 1):
+            for names in combinations(FILTER_NAMES, size):
+                yield names, {name: values[name] for name in names}
@@ -0,0 +1,107 @@
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from task_manager.tasks.importer import (IMPORT_BATCH_SIZE,
+                                         IMPORT_ENCODING,
+                                         IMPORT_FORMATS,
+                                         ImportFormatError,
+                                         ImportResult,
+                                         TaskImporter,
+                                         check_encoding,
+                                         detect_format,
+                                         read_rows)
+from task_manager.users.models import User
+
+
+class Command(BaseCommand):
+    """Импортирует задачи, статусы и метки из файла CSV или JSON Lines."""
+
+    help = 'Imports tasks with their statuses and labels from CSV or JSON lines'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument('path', help='Path to the file to import')
+        parser.add_argument(
+            '--format', choices=IMPORT_FORMATS, dest='import_format',
+            help='File format (detected from the extension by default)',
+        )
+        parser.add_argument(
+            '--author',
+            help='Username used as the author of rows without one',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+            help='Number of rows validated and inserted at once',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Импортирует файл и печатает итог с отклоненными строками.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+
+        Raises:
+            CommandError: Если формат, кодировка или автор по умолчанию
+                неверны.
+        """
+        author = self.get_author(options['author'])
+        try:
+            import_format = (options['import_format']
+                             or detect_format(options['path']))
+            with open(options['path'], 'rb') as stream:
+                check_encoding(stream)
+        except ImportFormatError as error:
+            raise CommandError(str(error))
+
+        importer = TaskImporter(author, batch_size=options['batch_size'])
+        with open(options['path'], encoding=IMPORT_ENCODING,
+                  newline='') as stream:
+            result = importer.import_rows(read_rows(stream, import_format))
+        self.write_report(result)
+
+    def get_author(self, username: Optional[str]) -> Optional[User]:
+        """
+        Находит автора по умолчанию.
+
+        Args:
+            username: Имя пользователя из опции --author.
+
+        Returns:
+            Optional[User]: Пользователь или None, если опция не задана.
+
+        Raises:
+            CommandError: Если пользователь не найден.
+        """
+        if not username:
+            return None
+        author = User.objects.filter(username=username).first()
+        if author is None:
+            raise CommandError(f'Unknown user: {username}')
+        return author
+
+    def write_report(self, result: ImportResult) -> None:
+        """
+        Печатает итог импорта и отклоненные строки.
+
+        Args:
+            result: Итог импорта.
+        """
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {result.tasks} tasks, created {result.statuses} '
+            f'statuses and {result.labels} labels in {result.elapsed:.2f}s '
+            f'({result.rows_per_second:.0f} rows/s)'
+        ))
+        if result.rejected:
+            self.stdout.write(self.style.WARNING(
+                f'Rejected {len(result.rejected)} rows:'
+            ))
+            for line, reason in result.rejected:
+                self.stdout.write(f'  line {line}: {reason}')
@@ -0,0 +1,39 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from task_manager.tasks.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """Перестраивает полнотекстовый индекс задач."""
+
+    help = (
+        'Rebuilds the SQLite FTS5 task search table from the tasks table. '
+        'PostgreSQL indexes an expression and needs no rebuild'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='Database alias',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Перестраивает индекс в одной транзакции.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+        """
+        with transaction.atomic(using=options['database']):
+            count = rebuild_search_index(options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed tasks: {count}'))
@@ -0,0 +1,55 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from task_manager.tasks.counters import (find_counter_mismatches,
+                                         rebuild_counters)
+
+
+class Command(BaseCommand):
+    """Проверяет и пересчитывает счетчики задач статусов и исполнителей."""
+
+    help = (
+        'Compares Status.task_count and User.assigned_task_count with '
+        'COUNT ... GROUP BY over tasks and rewrites the wrong ones'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        Args:
+            parser: Парсер аргументов командной строки.
+        """
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only report mismatches and fail if there are any',
+        )
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='Database alias',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Печатает расхождения и исправляет их.
+
+        Args:
+            *args: Дополнительные позиционные аргументы.
+            **options: Опции команды.
+
+        Raises:
+            CommandError: Если с --check найдены расхождения.
+        """
+        mismatches = find_counter_mismatches(options['database'])
+        for label, pk, stored, actual in mismatches:
+            self.stdout.write(f'{label} {pk}: stored {stored}, '
+                              f'actual {actual}')
+        if options['check']:
+            if mismatches:
+                raise CommandError(f'Wrong counters: {len(mismatches)}')
+            self.stdout.write(self.style.SUCCESS('Counters are correct'))
+            return
+        fixed = rebuild_counters(options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Fixed counters: {fixed}'))
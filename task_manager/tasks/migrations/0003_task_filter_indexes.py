@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-18 19:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0001_initial'),
+        ('statuses', '0001_initial'),
+        ('tasks', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'executor'], name='task_status_executor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at'], name='task_author_created_idx'),
+        ),
+        # Обратный индекс промежуточной таблицы меток: фильтр по метке
+        # сразу получает task_id без обращения к строкам таблицы.
+        migrations.RunSQL(
+            sql='CREATE INDEX task_labels_label_task_idx '
+                'ON tasks_task_labels (label_id, task_id)',
+            reverse_sql='DROP INDEX task_labels_label_task_idx',
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.1.15 on 2026-10-18 19:58
+
+import django.db.models.deletion
+import task_manager.tasks.models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+SEARCH_INDEX_NAME = 'task_search_idx'
+SEARCH_TABLE = 'tasks_task_fts'
+
+
+def search_index():
+    # Выражение tsvector на момент миграции
+    vector = SearchVector('name', 'description', config='simple')
+    return GinIndex(vector, name=SEARCH_INDEX_NAME)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('tasks', 'Task'),
+                                search_index())
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5('
+            "name, description, tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, name, description) '
+            'SELECT id, name, description FROM tasks_task'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('tasks', 'Task'),
+                                   search_index())
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSearchIndex',
+            fields=[
+                ('task', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='tasks.task')),
+                ('name', models.TextField()),
+                ('description', models.TextField()),
+                ('document', task_manager.tasks.models.SearchDocumentField(db_column='tasks_task_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'tasks_task_fts',
+                'managed': False,
+            },
+        ),
+        # PostgreSQL: GIN-индекс по выражению tsvector, SQLite: таблица FTS5
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
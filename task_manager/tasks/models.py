@@ -1,7 +1,29 @@
-from django.db import models
+from typing import Any, List, Tuple
+
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 
+class TaskQuerySet(models.QuerySet):
+    """QuerySet задач с готовыми выборками для представлений."""
+
+    def with_related(self) -> 'TaskQuerySet':
+        """
+        Подгружает статус, автора и исполнителя одним запросом.
+
+        Используется списком задач и фильтром, чтобы шаблон не делал
+        отдельных запросов для каждой строки. Из строк автора и
+        исполнителя выбирается только отображаемое имя full_name.
+
+        Returns:
+            TaskQuerySet: QuerySet с присоединенными связанными объектами.
+        """
+        task_fields = [field.name for field in self.model._meta.concrete_fields]
+        return self.select_related('status', 'author', 'executor').only(
+            *task_fields, 'author__full_name', 'executor__full_name'
+        )
+
+
 class Task(models.Model):
     """Модель задачи."""
 
@@ -10,6 +32,8 @@ class Task(models.Model):
     )
     description = models.TextField(verbose_name=_('Description'))
     created_at = models.DateTimeField(auto_now_add=True)
+    # Индекс нужен для дешевого Max(updated_at) в валидаторе списка задач
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     status = models.ForeignKey(
         'statuses.Status',
         on_delete=models.PROTECT,
@@ -35,6 +59,41 @@ class Task(models.Model):
         blank=True
     )
 
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        """Метаданные модели."""
+
+        indexes = [
+            # Сортировка и курсорная пагинация списка задач
+            models.Index(
+                fields=['created_at', 'id'], name='task_created_id_idx'
+            ),
+            # Фильтр по статусу и исполнителю
+            models.Index(
+                fields=['status', 'executor'], name='task_status_executor_idx'
+            ),
+            # Фильтр "только свои задачи" с сортировкой по дате
+            models.Index(
+                fields=['author', 'created_at'], name='task_author_created_idx'
+            ),
+        ]
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Сохраняет задачу в транзакции.
+
+        Обработчики pre_save и post_save обновляют счетчики задач статусов
+        и исполнителей (см. tasks.counters) в той же транзакции, что и
+        строку задачи.
+
+        Args:
+            *args: Позиционные аргументы Model.save().
+            **kwargs: Именованные аргументы Model.save().
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """
         Возвращает строковое представление задачи.
@@ -43,3 +102,54 @@ class Task(models.Model):
             str: Название задачи.
         """
         return self.name
+
+
+class SearchDocumentField(models.TextField):
+    """
+    Скрытый столбец FTS5-таблицы, одноименный самой таблице.
+
+    Условие MATCH по этому столбцу ищет сразу по всем столбцам таблицы.
+    """
+
+
+@SearchDocumentField.register_lookup
+class FullTextMatch(models.Lookup):
+    """Поиск по полнотекстовому индексу SQLite: document__match=<запрос>."""
+
+    lookup_name = 'match'
+
+    def as_sql(self, compiler: Any, connection: Any) -> Tuple[str, List[Any]]:
+        """Строит условие "<таблица>.<таблица> MATCH %s"."""
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+class TaskSearchIndex(models.Model):
+    """
+    Строка полнотекстового индекса задач в SQLite.
+
+    Таблица tasks_task_fts - виртуальная таблица FTS5, создается миграцией
+    только на SQLite и синхронизируется сигналами (см. tasks.search).
+    rowid строки совпадает с идентификатором задачи, а скрытый столбец
+    rank содержит оценку bm25 (меньше - релевантнее).
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        related_name='search_index'
+    )
+    name = models.TextField()
+    description = models.TextField()
+    document = SearchDocumentField(db_column='tasks_task_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        """Метаданные модели."""
+
+        managed = False
+        db_table = 'tasks_task_fts'
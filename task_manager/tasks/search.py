@@ -0,0 +1,209 @@
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+from django.contrib.postgres.search import (SearchQuery,
+                                            SearchRank,
+                                            SearchVector)
+from django.db import connections
+from django.db.models import F, FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+
+from task_manager.tasks.models import Task
+
+# Конфигурация без стемминга: задачи пишутся и на русском, и на английском
+SEARCH_CONFIG = 'simple'
+SEARCH_INDEX_NAME = 'task_search_idx'
+SEARCH_TABLE = 'tasks_task_fts'
+# Аннотация с ключом сортировки результатов: меньше - релевантнее
+SEARCH_ORDER = 'search_order'
+SEARCHABLE_FIELDS = frozenset({'name', 'description'})
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def get_search_tokens(text: str) -> List[str]:
+    """
+    Выделяет из строки поиска слова.
+
+    Операторы языков запросов FTS5 и tsquery отбрасываются, поэтому
+    пользовательский ввод не может сломать запрос.
+
+    Args:
+        text: Строка поиска.
+
+    Returns:
+        List[str]: Слова в нижнем регистре.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+def get_search_vector() -> SearchVector:
+    """
+    Возвращает выражение tsvector задачи.
+
+    Это же выражение проиндексировано GIN-индексом SEARCH_INDEX_NAME,
+    поэтому запрос должен строиться только через эту функцию.
+
+    Returns:
+        SearchVector: Вектор по названию и описанию задачи.
+    """
+    return SearchVector('name', 'description', config=SEARCH_CONFIG)
+
+
+def search_tasks(queryset: QuerySet, text: str) -> QuerySet:
+    """
+    Отбирает задачи, содержащие все слова строки поиска (по префиксу).
+
+    Задачи аннотируются ключом релевантности SEARCH_ORDER. В PostgreSQL
+    используется GIN-индекс по tsvector, в SQLite - таблица FTS5. Для
+    остальных СУБД индекса нет, и поиск идет по названию и описанию
+    через LIKE.
+
+    Args:
+        queryset: Исходный QuerySet задач.
+        text: Строка поиска.
+
+    Returns:
+        QuerySet: Найденные задачи с аннотацией SEARCH_ORDER.
+    """
+    tokens = get_search_tokens(text)
+    if not tokens:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        query = SearchQuery(
+            ' & '.join(f'{token}:*' for token in tokens),
+            config=SEARCH_CONFIG, search_type='raw',
+        )
+        vector = get_search_vector()
+        # ts_rank возвращает real: приведение к double precision делает
+        # значение точным ключом курсорной пагинации
+        return queryset.alias(search_vector=vector).filter(
+            search_vector=query
+        ).annotate(
+            **{SEARCH_ORDER: Cast(-SearchRank(vector, query), FloatField())}
+        )
+    if vendor == 'sqlite':
+        query = ' '.join(f'"{token}"*' for token in tokens)
+        return queryset.filter(search_index__document__match=query).annotate(
+            **{SEARCH_ORDER: F('search_index__rank')}
+        )
+    condition = Q()
+    for token in tokens:
+        condition &= Q(name__icontains=token) | Q(description__icontains=token)
+    return queryset.filter(condition).annotate(
+        **{SEARCH_ORDER: Cast('id', FloatField())}
+    )
+
+
+def get_search_ordering(
+    queryset: QuerySet, default: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Возвращает ключ сортировки: по релевантности, если был поиск.
+
+    Args:
+        queryset: Отфильтрованный QuerySet задач.
+        default: Сортировка без поиска.
+
+    Returns:
+        Tuple[str, ...]: Поля ключа курсорной пагинации.
+    """
+    if SEARCH_ORDER in queryset.query.annotations:
+        return SEARCH_ORDER, 'id'
+    return default
+
+
+def is_sqlite(using: str) -> bool:
+    """
+    Проверяет, нужна ли синхронизация таблицы FTS5 для базы данных.
+
+    Args:
+        using: Алиас базы данных.
+
+    Returns:
+        bool: True для SQLite.
+    """
+    return connections[using].vendor == 'sqlite'
+
+
+def index_tasks(tasks: Iterable[Task], using: str = 'default') -> None:
+    """
+    Добавляет или обновляет задачи в таблице FTS5.
+
+    Args:
+        tasks: Сохраненные задачи.
+        using: Алиас базы данных.
+    """
+    if not is_sqlite(using):
+        return
+    rows = [(task.pk, task.name, task.description)
+            for task in tasks if task.pk is not None]
+    if rows:
+        with connections[using].cursor() as cursor:
+            cursor.executemany(
+                f'INSERT OR REPLACE INTO {SEARCH_TABLE} '
+                '(rowid, name, description) VALUES (%s, %s, %s)',
+                rows,
+            )
+
+
+def rebuild_search_index(using: str = 'default') -> int:
+    """
+    Заполняет таблицу FTS5 заново по всем задачам.
+
+    Args:
+        using: Алиас базы данных.
+
+    Returns:
+        int: Количество проиндексированных задач (0, если база данных
+            использует индекс по выражению и перестройка не нужна).
+    """
+    if not is_sqlite(using):
+        return 0
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, name, description) '
+            'SELECT id, name, description FROM tasks_task'
+        )
+        return cursor.rowcount
+
+
+def update_search_index(
+    sender: type, instance: Task, using: str,
+    update_fields: Optional[Iterable[str]] = None, **kwargs: Any
+) -> None:
+    """
+    Обработчик post_save: обновляет задачу в таблице FTS5.
+
+    Args:
+        sender: Класс модели.
+        instance: Сохраненная задача.
+        using: Алиас базы данных.
+        update_fields: Поля, переданные в save(update_fields=...).
+        **kwargs: Остальные аргументы сигнала.
+    """
+    if update_fields and not SEARCHABLE_FIELDS & set(update_fields):
+        return
+    index_tasks([instance], using)
+
+
+def remove_from_search_index(
+    sender: type, instance: Task, using: str, **kwargs: Any
+) -> None:
+    """
+    Обработчик post_delete: удаляет задачу из таблицы FTS5.
+
+    Args:
+        sender: Класс модели.
+        instance: Удаленная задача.
+        using: Алиас базы данных.
+        **kwargs: Остальные аргументы сигнала.
+    """
+    if not is_sqlite(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [instance.pk]
+        )
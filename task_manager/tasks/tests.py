@@ -1,10 +1,34 @@
-from django.test import TestCase, Client
+import base64
+import csv
+import json
+import os
+import unittest
+from io import StringIO
+from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, IntegrityError, connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import translation
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
-from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.counters import find_counter_mismatches
+from task_manager.tasks.filters import (LABELS_MATCH_ALL,
+                                        TaskFilterForm,
+                                        filter_by_labels)
+from task_manager.tasks.forms import TaskBulkActionForm, TaskForm
+from task_manager.tasks.importer import TaskImporter, read_rows
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import get_search_ordering
+from task_manager.tasks.views import (TaskBoardColumnView,
+                                      TaskBoardView,
+                                      TaskListView)
 from task_manager.users.models import User
 
 
@@ -74,6 +98,121 @@ class TasksIndexViewTest(BaseTestCase):
         self.assertTemplateUsed(response, 'tasks/list.html')
 
 
+class TasksIndexQueryCountTest(BaseTestCase):
+    def create_tasks(self, count):
+        start = Task.objects.count()
+        for number in range(start, start + count):
+            Task.objects.create(
+                name=f'Task {number}',
+                description='Test description',
+                status=self.status,
+                author=self.author,
+                executor=self.executor
+            )
+
+    def count_index_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('tasks_index'))
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def test_query_count_does_not_depend_on_tasks_count(self):
+        self.create_tasks(1)
+        queries_for_one = self.count_index_queries()
+        self.create_tasks(10)
+        self.assertEqual(self.count_index_queries(), queries_for_one)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+})
+@patch.object(TaskListView, 'paginate_by', 2)
+class TasksIndexPaginationTest(TasksIndexQueryCountTest):
+    def setUp(self):
+        super().setUp()
+        self.create_tasks(5)
+
+    def collect_pages(self, params=None):
+        pages = []
+        params = dict(params or {})
+        while True:
+            response = self.client.get(reverse('tasks_index'), params)
+            page = response.context['page_obj']
+            pages.append([task.name for task in page])
+            if not page.has_next:
+                return pages
+            params['cursor'] = page.next_cursor
+
+    def test_pages_cover_all_tasks_in_order(self):
+        pages = self.collect_pages()
+        self.assertEqual(pages, [
+            ['Task 0', 'Task 1'], ['Task 2', 'Task 3'], ['Task 4'],
+        ])
+
+    def test_previous_cursor_returns_previous_page(self):
+        first = self.client.get(reverse('tasks_index')).context['page_obj']
+        self.assertFalse(first.has_previous)
+        second = self.client.get(
+            reverse('tasks_index'), {'cursor': first.next_cursor}
+        ).context['page_obj']
+        back = self.client.get(
+            reverse('tasks_index'), {'cursor': second.previous_cursor}
+        ).context['page_obj']
+        self.assertEqual(list(back), list(first))
+        self.assertFalse(back.has_previous)
+        self.assertTrue(back.has_next)
+
+    def test_filter_params_kept_across_pages(self):
+        other_status = Status.objects.create(name='Other status')
+        Task.objects.filter(name__in=['Task 1', 'Task 3']).update(
+            status=other_status
+        )
+        params = {'status': self.status.pk}
+        response = self.client.get(reverse('tasks_index'), params)
+        self.assertContains(response, f'status={self.status.pk}')
+        self.assertEqual(
+            self.collect_pages(params),
+            [['Task 0', 'Task 2'], ['Task 4']]
+        )
+
+    def test_invalid_cursor_shows_first_page(self):
+        response = self.client.get(reverse('tasks_index'), {'cursor': '!!'})
+        self.assertEqual(
+            [task.name for task in response.context['page_obj']],
+            ['Task 0', 'Task 1']
+        )
+
+    def test_tampered_cursor_shows_first_page(self):
+        for raw in (['next', ['x', 'abc']], [[1], [2]],
+                    ['next', [[1], [2]]], ['previous', [None, 1]],
+                    ['next', {'dt': 1}], ['next', [{'dt': 'x'}, 1]]):
+            cursor = base64.urlsafe_b64encode(json.dumps(raw).encode())
+            response = self.client.get(reverse('tasks_index'),
+                                       {'cursor': cursor.decode()})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [task.name for task in response.context['page_obj']],
+                ['Task 0', 'Task 1']
+            )
+
+    def test_pages_do_not_use_offset_or_count(self):
+        first = self.client.get(reverse('tasks_index')).context['page_obj']
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(
+                reverse('tasks_index'), {'cursor': first.next_cursor}
+            )
+        # Число строк таблиц считает только валидатор условного GET
+        page_queries = [
+            query['sql'].upper() for query in context
+            if 'FROM "tasks_task" INNER JOIN' in query['sql']
+        ]
+        self.assertEqual(len(page_queries), 1)
+        self.assertNotIn('OFFSET', page_queries[0])
+        self.assertNotIn('COUNT(', page_queries[0])
+        self.assertEqual(len(context), self.count_index_queries())
+
+
 class TasksCreateViewTest(BaseTestCase):
     def test_tasks_create_view_get(self):
         response = self.client.get(reverse('tasks_create'))
@@ -273,3 +412,855 @@ class TaskDetailViewTest(BaseTestCase):
             reverse('tasks_detail', kwargs={'pk': self.task.pk}))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'tasks/detail.html')
+
+
+class ExplainTaskFiltersCommandTest(BaseTestCase):
+    def test_prints_plan_for_every_filter_combination(self):
+        out = StringIO()
+        call_command('explain_task_filters', stdout=out)
+        output = out.getvalue()
+        self.assertEqual(output.count('Filters: '), 32)
+        self.assertIn('Filters: none', output)
+        self.assertIn(
+            'Filters: search, status, executor, labels, self_tasks', output
+        )
+
+    @unittest.skipUnless(connection.vendor == 'sqlite',
+                         'MATCH is the SQLite full-text search operator')
+    def test_search_plans_use_list_ordering(self):
+        with CaptureQueriesContext(connection) as context:
+            call_command('explain_task_filters', stdout=StringIO())
+        plans = [query['sql'] for query in context
+                 if query['sql'].startswith('EXPLAIN')]
+        self.assertEqual(len(plans), 32)
+        search_plans = [sql for sql in plans if 'MATCH' in sql]
+        self.assertEqual(len(search_plans), 16)
+        for sql in plans:
+            order_by = sql.rsplit('ORDER BY', 1)[1]
+            # При поиске задачи сортируются по релевантности, как в списке
+            self.assertEqual('created_at' in order_by,
+                             sql not in search_plans)
+
+    def test_all_labels_mode(self):
+        out = StringIO()
+        call_command('explain_task_filters', '--labels', '3',
+                     '--labels-match', 'all', stdout=out)
+        self.assertIn('Filters: labels', out.getvalue())
+
+
+class TaskLabelsFilterTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.labels = [Label.objects.create(name=f'Label {index}')
+                       for index in range(3)]
+        assignments = {
+            'Both': self.labels[:2],
+            'First': self.labels[:1],
+            'All': self.labels,
+            'None': [],
+        }
+        for name, labels in assignments.items():
+            task = Task.objects.create(name=name, description='',
+                                       status=self.status, author=self.user)
+            task.labels.set(labels)
+
+    def filter_names(self, labels, match=None):
+        params = {'labels': [label.pk for label in labels]}
+        if match:
+            params['labels_match'] = match
+        filterset = TaskFilterForm(params, queryset=Task.objects.all())
+        return sorted(filterset.qs.values_list('name', flat=True))
+
+    def test_any_returns_each_task_once(self):
+        self.assertEqual(self.filter_names(self.labels[:2]),
+                         ['All', 'Both', 'First'])
+
+    def test_all_requires_every_label(self):
+        self.assertEqual(self.filter_names(self.labels[:2], 'all'),
+                         ['All', 'Both'])
+        self.assertEqual(self.filter_names(self.labels, 'all'), ['All'])
+
+    def test_single_label_query_param_still_works(self):
+        response = self.client.get(reverse('tasks_index'),
+                                   {'labels': self.labels[2].pk})
+        self.assertEqual([task.name for task in response.context['tasks']],
+                         ['All'])
+
+    def test_all_does_not_join_per_label(self):
+        queries = [
+            str(filter_by_labels(Task.objects.all(),
+                                 [label.pk for label in self.labels[:count]],
+                                 LABELS_MATCH_ALL).query)
+            for count in (1, 3)
+        ]
+        self.assertEqual(queries[0].count('JOIN'), queries[1].count('JOIN'))
+        self.assertIn('HAVING', queries[1])
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('benchmark_label_filter', '--max-labels', '3',
+                     '--repeat', '1', stdout=out)
+        rows = out.getvalue().splitlines()[2:]
+        self.assertEqual([row.split()[0] for row in rows], ['1', '2', '3'])
+        self.assertRegex(rows[2], r'(\d+\.\d+ms/\d+ +){3}')
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+})
+class TaskSearchTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        tasks = {
+            'Fix server': 'Server crashes on server restart',
+            'Update docs': 'Mention the server settings',
+            'Починить форму': 'Ошибка при ВХОДЕ',
+            'Unrelated': 'Nothing here',
+        }
+        for name, description in tasks.items():
+            Task.objects.create(name=name, description=description,
+                                status=self.status, author=self.author)
+
+    def search(self, text):
+        filterset = TaskFilterForm({'search': text},
+                                   queryset=Task.objects.all())
+        queryset = filterset.qs
+        return list(queryset.order_by(
+            *get_search_ordering(queryset, ('created_at', 'id'))
+        ).values_list('name', flat=True))
+
+    def test_finds_words_in_name_and_description_by_relevance(self):
+        self.assertEqual(self.search('server'), ['Fix server', 'Update docs'])
+
+    def test_matches_prefixes_of_all_words_case_insensitively(self):
+        self.assertEqual(self.search('serv sett'), ['Update docs'])
+        self.assertEqual(self.search('вход'), ['Починить форму'])
+
+    def test_query_syntax_in_input_is_ignored(self):
+        self.assertEqual(self.search('"server" OR NOT*'), [])
+        self.assertEqual(len(self.search('!!!')), 4)
+
+    def test_does_not_scan_description_with_like(self):
+        with CaptureQueriesContext(connection) as context:
+            self.search('server')
+        self.assertNotIn('LIKE', context.captured_queries[-1]['sql'])
+
+    def test_index_follows_save_and_delete(self):
+        task = Task.objects.get(name='Unrelated')
+        task.description = 'Server is down'
+        task.save()
+        self.assertIn('Unrelated', self.search('server'))
+        task.delete()
+        self.assertNotIn('Unrelated', self.search('server'))
+
+    def test_imported_tasks_are_indexed(self):
+        TaskImporter(default_author=self.user).import_rows([
+            {'_line': 2, 'name': 'Imported', 'description': 'server',
+             'status': 'Test status'},
+        ])
+        self.assertIn('Imported', self.search('server'))
+
+    def test_list_and_api_order_by_relevance(self):
+        response = self.client.get(reverse('tasks_index'),
+                                   {'search': 'server'})
+        self.assertEqual([task.name for task in response.context['tasks']],
+                         ['Fix server', 'Update docs'])
+        response = self.client.get(reverse('api_tasks'),
+                                   {'search': 'server', 'fields': 'name',
+                                    'limit': 1})
+        data = response.json()
+        self.assertEqual(data['results'], [{'name': 'Fix server'}])
+        data = self.client.get(data['next']).json()
+        self.assertEqual(data['results'], [{'name': 'Update docs'}])
+
+    def test_rebuild_command(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM tasks_task_fts')
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertIn('Indexed tasks: 4', out.getvalue())
+        self.assertEqual(self.search('server'), ['Fix server', 'Update docs'])
+
+
+class TaskDeleteQueryCountTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.task = Task.objects.create(
+            name='Test task',
+            description='Test description',
+            status=self.status,
+            author=self.author
+        )
+        self.url = reverse('tasks_delete', kwargs={'pk': self.task.pk})
+
+    def test_get_loads_task_once(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_by_other_user_loads_task_once(self):
+        self.client.force_login(self.executor)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
+        self.assertRedirects(response, reverse('tasks_index'),
+                             fetch_redirect_response=False)
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+
+    def test_post_loads_task_once(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url)
+        self.assertRedirects(response, reverse('tasks_index'),
+                             fetch_redirect_response=False)
+        selects = [
+            query['sql'] for query in context
+            if query['sql'].startswith('SELECT')
+            and 'FROM "tasks_task"' in query['sql']
+        ]
+        self.assertEqual(len(selects), 1)
+
+
+class TaskBulkActionViewTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.done = Status.objects.create(name='Done')
+        self.tasks = [
+            Task.objects.create(
+                name=f'Task {number}',
+                description='Test description',
+                status=self.status,
+                author=self.author
+            )
+            for number in range(3)
+        ]
+        self.url = reverse('tasks_bulk')
+
+    def test_unauthorized(self):
+        self.client.logout()
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith('/login/'))
+
+    def test_get_not_allowed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+    def test_set_status_for_selected_tasks(self):
+        response = self.client.post(self.url, {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'tasks': [self.tasks[0].pk, self.tasks[2].pk],
+        })
+        self.assertRedirects(response, reverse('tasks_index'))
+        statuses = dict(Task.objects.values_list('name', 'status'))
+        self.assertEqual(statuses, {
+            'Task 0': self.done.pk,
+            'Task 1': self.status.pk,
+            'Task 2': self.done.pk,
+        })
+
+    def test_set_executor_for_filtered_tasks(self):
+        self.tasks[1].status = self.done
+        self.tasks[1].save()
+        response = self.client.post(
+            f"{self.url}?status={self.status.pk}",
+            {
+                'action': 'set_executor',
+                'executor': self.executor.pk,
+                'apply_to_filtered': 'on',
+            }
+        )
+        self.assertRedirects(
+            response, f"{reverse('tasks_index')}?status={self.status.pk}",
+            fetch_redirect_response=False
+        )
+        self.assertEqual(
+            set(Task.objects.filter(executor=self.executor)
+                .values_list('name', flat=True)),
+            {'Task 0', 'Task 2'}
+        )
+
+    def test_add_and_remove_labels(self):
+        other_label = Label.objects.create(name='Other label')
+        self.tasks[0].labels.add(self.label)
+        ids = [task.pk for task in self.tasks]
+        self.client.post(self.url, {
+            'action': 'add_labels',
+            'labels': [self.label.pk, other_label.pk],
+            'tasks': ids,
+        })
+        for task in self.tasks:
+            self.assertEqual(task.labels.count(), 2)
+        self.client.post(self.url, {
+            'action': 'remove_labels',
+            'labels': [self.label.pk],
+            'tasks': ids[:2],
+        })
+        self.assertEqual(
+            [task.labels.count() for task in self.tasks], [1, 1, 2]
+        )
+
+    def test_label_actions_update_tasks_stamp(self):
+        before = Task.objects.get(pk=self.tasks[0].pk).updated_at
+        self.client.post(self.url, {
+            'action': 'add_labels',
+            'labels': [self.label.pk],
+            'tasks': [self.tasks[0].pk],
+        })
+        self.assertGreater(
+            Task.objects.get(pk=self.tasks[0].pk).updated_at, before
+        )
+
+    def test_set_status_uses_constant_number_of_queries(self):
+        data = {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'tasks': [task.pk for task in self.tasks],
+        }
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.url, data)
+        updates = [query for query in context
+                   if query['sql'].startswith('UPDATE "tasks_task"')]
+        self.assertEqual(len(updates), 1)
+
+    def test_reports_missing_tasks(self):
+        response = self.client.post(self.url, {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'tasks': [self.tasks[0].pk, 9999],
+        }, follow=True)
+        self.assertContains(response, '9999')
+        self.tasks[0].refresh_from_db()
+        self.assertEqual(self.tasks[0].status, self.done)
+
+    def test_reports_selected_tasks_outside_filter(self):
+        self.tasks[1].status = self.done
+        self.tasks[1].save()
+        response = self.client.post(
+            f"{self.url}?status={self.status.pk}",
+            {
+                'action': 'set_executor',
+                'executor': self.executor.pk,
+                'apply_to_filtered': 'on',
+                'tasks': [self.tasks[0].pk, self.tasks[1].pk, 9999],
+            },
+            follow=True
+        )
+        self.assertContains(
+            response, f'{self.tasks[1].pk} (Не входит в отфильтрованные задачи)'
+        )
+        self.assertContains(response, '9999 (Задача не найдена)')
+        self.tasks[1].refresh_from_db()
+        self.assertIsNone(self.tasks[1].executor)
+
+    def test_filtered_tasks_are_processed_in_chunks(self):
+        data = {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'apply_to_filtered': 'on',
+        }
+        with patch('task_manager.tasks.forms.BULK_BATCH_SIZE', 2), \
+                CaptureQueriesContext(connection) as context:
+            self.client.post(f"{self.url}?status={self.status.pk}", data)
+        # Задачи уходят из фильтра по статусу, но части не пропускаются
+        self.assertFalse(Task.objects.filter(status=self.status).exists())
+        locks = [query for query in context
+                 if query['sql'].startswith('SELECT')
+                 and 'FROM "tasks_task" WHERE "tasks_task"."id" IN'
+                 in query['sql']]
+        self.assertEqual(len(locks), 2)
+
+    def test_failed_chunk_is_rolled_back_and_reported(self):
+        original = TaskBulkActionForm.apply_set_status
+        calls = []
+
+        def apply_set_status(form, tasks):
+            calls.append(tasks)
+            original(form, tasks)
+            if len(calls) == 2:
+                raise DatabaseError('deadlock detected')
+
+        data = {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'apply_to_filtered': 'on',
+        }
+        with patch('task_manager.tasks.forms.BULK_BATCH_SIZE', 2), \
+                patch.object(TaskBulkActionForm, 'apply_set_status',
+                             apply_set_status), \
+                self.assertLogs('task_manager.tasks.forms', 'ERROR'):
+            response = self.client.post(
+                f"{self.url}?status={self.status.pk}", data, follow=True
+            )
+        self.assertContains(
+            response, f'{self.tasks[2].pk} (Изменения не сохранены)'
+        )
+        statuses = dict(Task.objects.values_list('name', 'status'))
+        self.assertEqual(statuses, {
+            'Task 0': self.done.pk,
+            'Task 1': self.done.pk,
+            'Task 2': self.status.pk,
+        })
+
+    def test_add_labels_skips_existing_links_without_reading_them(self):
+        self.tasks[0].labels.add(self.label)
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.url, {
+                'action': 'add_labels',
+                'labels': [self.label.pk],
+                'tasks': [task.pk for task in self.tasks],
+            })
+        self.assertFalse([
+            query for query in context
+            if query['sql'].startswith('SELECT')
+            and 'FROM "tasks_task_labels"' in query['sql']
+        ])
+        for task in self.tasks:
+            self.assertEqual(list(task.labels.all()), [self.label])
+
+    def test_requires_tasks_and_action_values(self):
+        response = self.client.post(self.url, {'action': 'set_status'})
+        self.assertRedirects(response, reverse('tasks_index'),
+                             fetch_redirect_response=False)
+        self.assertFalse(Task.objects.filter(status=self.done).exists())
+
+    def test_bulk_update_invalidates_list_cache(self):
+        self.client.get(reverse('tasks_index'))
+        self.client.post(self.url, {
+            'action': 'set_status',
+            'status': self.done.pk,
+            'tasks': [self.tasks[0].pk],
+        })
+        response = self.client.get(reverse('tasks_index'))
+        self.assertIn('Done', response.context['list_fragment'])
+
+
+class TaskExportViewTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.task = Task.objects.create(
+            name='Test task',
+            description='Test description',
+            status=self.status,
+            author=self.author,
+            executor=self.executor
+        )
+        self.task.labels.add(self.label)
+        Task.objects.create(
+            name='Other task',
+            description='Other description',
+            status=Status.objects.create(name='Other status'),
+            author=self.author
+        )
+
+    def get_content(self, export_format, params=None):
+        response = self.client.get(
+            reverse('tasks_export', args=[export_format]), params
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_unauthorized(self):
+        self.client.logout()
+        response = self.client.get(reverse('tasks_export', args=['csv']))
+        self.assertEqual(response.status_code, 302)
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse('tasks_export', args=['xml']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_csv_export(self):
+        rows = list(csv.reader(StringIO(self.get_content('csv'))))
+        self.assertEqual(rows[0][:3], ['id', 'name', 'description'])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][1:7], [
+            'Test task', 'Test description', 'Test status',
+            'testuser', 'executor', 'Test label',
+        ])
+
+    def test_jsonl_export_uses_filters(self):
+        lines = self.get_content(
+            'jsonl', {'status': self.status.pk}
+        ).splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row['name'], 'Test task')
+        self.assertEqual(row['labels'], ['Test label'])
+
+    def test_export_can_be_imported(self):
+        self.task.description = 'First line\nSecond line'
+        self.task.save()
+        for export_format in ('csv', 'jsonl'):
+            content = self.get_content(export_format)
+            expected = list(Task.objects.order_by('name').values_list(
+                'name', 'description', 'status', 'author', 'executor'
+            ))
+            Task.objects.all().delete()
+            result = TaskImporter().import_rows(
+                read_rows(StringIO(content), export_format)
+            )
+            self.assertEqual(result.rejected, [])
+            self.assertEqual(list(
+                Task.objects.order_by('name').values_list(
+                    'name', 'description', 'status', 'author', 'executor'
+                )
+            ), expected)
+            self.assertEqual(
+                list(Task.objects.get(name='Test task')
+                     .labels.values_list('name', flat=True)),
+                ['Test label']
+            )
+
+    @patch('task_manager.tasks.export.ASYNC_EXPORT_BATCH_SIZE', 1)
+    async def test_asgi_export_streams_asynchronously(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse('tasks_export', args=['jsonl'])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        # По одной задаче за переход в поток базы данных
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual({json.loads(chunk)['name'] for chunk in chunks},
+                         {'Test task', 'Other task'})
+
+    def test_invalid_filter_exports_nothing(self):
+        self.assertEqual(self.get_content('jsonl', {'status': 'x'}), '')
+
+    def test_query_count_does_not_depend_on_tasks_count(self):
+        with CaptureQueriesContext(connection) as context:
+            self.get_content('jsonl')
+        queries = len(context)
+        for number in range(5):
+            task = Task.objects.create(
+                name=f'Task {number}', description='', status=self.status,
+                author=self.author
+            )
+            task.labels.add(self.label)
+        with CaptureQueriesContext(connection) as context:
+            self.get_content('jsonl')
+        self.assertEqual(len(context), queries)
+
+
+class ImportTasksTest(BaseTestCase):
+    csv_content = (
+        'name,description,status,author,executor,labels\n'
+        'First,First description,Test status,testuser,executor,Test label\n'
+        'Second,,New status,testuser,,New label;Test label\n'
+        ',No name,Test status,testuser,,\n'
+        'Third,,Test status,nobody,,\n'
+        'First,Duplicate,Test status,testuser,,\n'
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(translation.override('en'))
+
+    def write_file(self, content, suffix):
+        with NamedTemporaryFile('w', suffix=suffix, delete=False,
+                                encoding='utf-8') as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_command_imports_csv(self):
+        out = StringIO()
+        path = self.write_file(self.csv_content, '.csv')
+        call_command('import_tasks', path, stdout=out)
+        self.assertEqual(
+            set(Task.objects.values_list('name', flat=True)),
+            {'First', 'Second'}
+        )
+        second = Task.objects.get(name='Second')
+        self.assertEqual(second.status.name, 'New status')
+        self.assertEqual(
+            set(second.labels.values_list('name', flat=True)),
+            {'New label', 'Test label'}
+        )
+        self.assertEqual(Task.objects.get(name='First').executor,
+                         self.executor)
+        output = out.getvalue()
+        self.assertIn('Imported 2 tasks', output)
+        self.assertIn('Rejected 3 rows', output)
+        self.assertIn('line 5: Unknown user: nobody', output)
+
+    def test_command_imports_jsonl_in_batches(self):
+        lines = [
+            json.dumps({'name': f'Task {number}', 'status': 'Test status',
+                        'labels': ['Test label']})
+            for number in range(5)
+        ]
+        path = self.write_file('\n'.join(lines + ['not json']), '.jsonl')
+        out = StringIO()
+        with CaptureQueriesContext(connection) as context:
+            call_command('import_tasks', path, author='testuser',
+                         batch_size=2, stdout=out)
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertEqual(self.label.task_set.count(), 5)
+        self.assertIn('line 6: Name is required', out.getvalue())
+        inserts = [query for query in context
+                   if query['sql'].startswith('INSERT INTO "tasks_task"')]
+        self.assertEqual(len(inserts), 3)
+
+    def test_command_rejects_unknown_format(self):
+        path = self.write_file('', '.xml')
+        with self.assertRaises(CommandError):
+            call_command('import_tasks', path)
+
+    def test_existing_task_names_are_rejected(self):
+        Task.objects.create(name='First', description='', status=self.status,
+                            author=self.author)
+        path = self.write_file(self.csv_content, '.csv')
+        out = StringIO()
+        call_command('import_tasks', path, stdout=out)
+        self.assertIn('line 2: Task with this name already exists',
+                      out.getvalue())
+
+    def test_upload_view(self):
+        response = self.client.get(reverse('tasks_import'))
+        self.assertEqual(response.status_code, 200)
+        upload = SimpleUploadedFile(
+            'tasks.csv',
+            'name,description,status,labels\nUploaded,,Test status,\n'.encode()
+        )
+        response = self.client.post(reverse('tasks_import'), {'file': upload})
+        self.assertRedirects(response, reverse('tasks_index'))
+        self.assertEqual(Task.objects.get(name='Uploaded').author, self.user)
+
+    def test_upload_view_rejects_unknown_format(self):
+        upload = SimpleUploadedFile('tasks.txt', b'')
+        response = self.client.post(reverse('tasks_import'), {'file': upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_upload_view_rejects_non_utf8_file(self):
+        upload = SimpleUploadedFile(
+            'tasks.csv',
+            'name,description,status\nCafé,,Test status\n'.encode('latin-1')
+        )
+        response = self.client.post(reverse('tasks_import'), {'file': upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response.context['form'], 'file',
+                             'Файл должен быть текстом в кодировке UTF-8')
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_command_rejects_non_utf8_file(self):
+        path = self.write_file('', '.csv')
+        with open(path, 'wb') as file:
+            file.write('name,status\nFirst,Test status\nCafé,Test status\n'
+                       .encode('latin-1'))
+        with self.assertRaisesMessage(CommandError, 'UTF-8'):
+            call_command('import_tasks', path, author='testuser')
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_csv_line_numbers_count_multiline_values(self):
+        content = (
+            'name,description,status,author\n'
+            'First,"Line one\nLine two\nLine three",Test status,testuser\n'
+            'Second,,Test status,nobody\n'
+        )
+        result = TaskImporter().import_rows(read_rows(StringIO(content), 'csv'))
+        self.assertEqual(result.rejected, [(5, 'Unknown user: nobody')])
+
+    def test_conflicting_batch_is_rejected(self):
+        importer = TaskImporter(default_author=self.user)
+        rows = read_rows(StringIO(self.csv_content), 'csv')
+        with patch.object(Task.objects, 'bulk_create',
+                          side_effect=IntegrityError):
+            result = importer.import_rows(rows)
+        self.assertEqual((result.tasks, result.statuses, result.labels),
+                         (0, 0, 0))
+        self.assertEqual(
+            [line for line, reason in result.rejected
+             if reason == 'Conflicts with data saved at the same time'],
+            [2, 3]
+        )
+        self.assertFalse(Status.objects.filter(name='New status').exists())
+
+    def test_created_statuses_and_labels_are_counted(self):
+        importer = TaskImporter(default_author=self.user)
+        result = importer.import_rows(
+            read_rows(StringIO(self.csv_content), 'csv')
+        )
+        self.assertEqual((result.tasks, result.statuses, result.labels),
+                         (2, 1, 1))
+
+
+class TaskCountersTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.done = Status.objects.create(name='Done')
+
+    def create_task(self, name, **kwargs):
+        kwargs.setdefault('status', self.status)
+        return Task.objects.create(name=name, description='',
+                                   author=self.author, **kwargs)
+
+    def assertCounts(self, statuses, executors):
+        self.assertEqual(
+            dict(Status.objects.values_list('name', 'task_count')), statuses
+        )
+        self.assertEqual(
+            dict(User.objects.values_list('username', 'assigned_task_count')),
+            executors
+        )
+        self.assertEqual(find_counter_mismatches(), [])
+
+    def test_create_update_and_delete(self):
+        task = self.create_task('First', executor=self.executor)
+        self.create_task('Second')
+        self.assertCounts({'Test status': 2, 'Done': 0},
+                          {'testuser': 0, 'executor': 1})
+        task.status = self.done
+        task.executor = self.user
+        task.save()
+        self.assertCounts({'Test status': 1, 'Done': 1},
+                          {'testuser': 1, 'executor': 0})
+        task.name = 'Renamed'
+        with CaptureQueriesContext(connection) as context:
+            task.save(update_fields=['name'])
+        self.assertFalse(any('task_count' in query['sql']
+                             for query in context.captured_queries))
+        task.delete()
+        self.assertCounts({'Test status': 1, 'Done': 0},
+                          {'testuser': 0, 'executor': 0})
+
+    def test_views_and_bulk_actions(self):
+        self.client.post(reverse('tasks_create'), {
+            'name': 'Task', 'description': 'Description',
+            'status': self.status.pk, 'executor': self.executor.pk,
+        })
+        tasks = [self.create_task(f'Task {number}') for number in range(2)]
+        self.client.post(reverse('tasks_bulk'), {
+            'action': 'set_status', 'status': self.done.pk,
+            'tasks': [task.pk for task in tasks],
+        })
+        self.client.post(reverse('tasks_bulk'), {
+            'action': 'set_executor', 'executor': self.executor.pk,
+            'tasks': [tasks[0].pk],
+        })
+        self.assertCounts({'Test status': 1, 'Done': 2},
+                          {'testuser': 0, 'executor': 2})
+        response = self.client.get(reverse('statuses_index'))
+        self.assertContains(response, '<td>2</td>', html=True)
+
+    def test_import(self):
+        importer = TaskImporter(self.user)
+        importer.import_rows([
+            {'_line': 1, 'name': 'Imported', 'status': 'Done',
+             'executor': 'executor'},
+            {'_line': 2, 'name': 'New status', 'status': 'Brand new'},
+        ])
+        self.assertCounts({'Test status': 0, 'Done': 1, 'Brand new': 1},
+                          {'testuser': 0, 'executor': 1})
+
+    def test_list_pages_show_fresh_counters(self):
+        url = reverse('users_index')
+        self.client.get(url)
+        self.create_task('Task', executor=self.executor)
+        self.assertContains(self.client.get(url), '<td>1</td>', html=True)
+        url = reverse('statuses_index')
+        etag = self.client.get(url)['ETag']
+        self.create_task('Another')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_rebuild_command(self):
+        self.create_task('Task', executor=self.executor)
+        Status.objects.update(task_count=5)
+        with self.assertRaises(CommandError):
+            call_command('rebuild_task_counters', check=True,
+                         stdout=StringIO())
+        out = StringIO()
+        call_command('rebuild_task_counters', stdout=out)
+        self.assertIn('Fixed counters: 2', out.getvalue())
+        call_command('rebuild_task_counters', check=True, stdout=StringIO())
+        self.assertCounts({'Test status': 1, 'Done': 0},
+                          {'testuser': 0, 'executor': 1})
+
+
+@patch.object(TaskBoardView, 'board_page_size', 2)
+@patch.object(TaskBoardColumnView, 'paginate_by', 2)
+class TaskBoardTest(TasksIndexQueryCountTest):
+    def setUp(self):
+        super().setUp()
+        self.done = Status.objects.create(name='Done')
+        self.create_tasks(5)
+        Task.objects.filter(name__in=['Task 1', 'Task 3']).update(
+            status=self.done
+        )
+
+    def get_columns(self, params=None):
+        response = self.client.get(reverse('tasks_board'), params or {})
+        self.assertEqual(response.status_code, 200)
+        return {
+            column.status.name: [task.name for task in column.page]
+            for column in response.context['columns']
+        }
+
+    def test_columns_hold_first_pages(self):
+        self.assertEqual(self.get_columns(), {
+            'Test status': ['Task 0', 'Task 2'],
+            'Done': ['Task 1', 'Task 3'],
+        })
+
+    def test_columns_are_filtered(self):
+        Task.objects.filter(name='Task 0').update(executor=self.user)
+        self.assertEqual(self.get_columns({'executor': self.executor.pk}), {
+            'Test status': ['Task 2', 'Task 4'],
+            'Done': ['Task 1', 'Task 3'],
+        })
+
+    def test_column_counts_follow_filters(self):
+        Task.objects.filter(name='Task 0').update(executor=self.user)
+        for params, expected in (({}, {'Test status': 3, 'Done': 2}),
+                                 ({'executor': self.executor.pk},
+                                  {'Test status': 2, 'Done': 2})):
+            response = self.client.get(reverse('tasks_board'), params)
+            self.assertEqual({column.status.name: column.count
+                              for column in response.context['columns']},
+                             expected)
+        self.assertContains(
+            response, '<span class="badge bg-secondary">2</span>', count=2
+        )
+
+    def test_query_count_does_not_depend_on_statuses_count(self):
+        # Первый запрос загружает варианты фильтров в кэш
+        self.get_columns()
+        with CaptureQueriesContext(connection) as context:
+            self.get_columns()
+        Status.objects.create(name='Empty')
+        self.get_columns()
+        with CaptureQueriesContext(connection) as more_statuses:
+            columns = self.get_columns()
+        self.assertEqual(columns['Empty'], [])
+        self.assertEqual(len(more_statuses), len(context))
+        window_queries = [query['sql'] for query in context
+                          if 'ROW_NUMBER()' in query['sql']]
+        self.assertEqual(len(window_queries), 1)
+
+    def test_column_loads_next_pages_with_filters(self):
+        response = self.client.get(reverse('tasks_board'))
+        column = response.context['columns'][0]
+        self.assertContains(response, 'board-more')
+        url = reverse('tasks_board_column', args=[self.status.pk])
+        response = self.client.get(url, {'cursor': column.page.next_cursor,
+                                         'fragment': 1})
+        self.assertTemplateUsed(response, 'tasks/board_cards.html')
+        self.assertTemplateNotUsed(response, 'base.html')
+        self.assertEqual([task.name for task in response.context['tasks']],
+                         ['Task 4'])
+        self.assertNotContains(response, 'board-more')
+        cursor = base64.urlsafe_b64encode(b'["next",["x","abc"]]').decode()
+        response = self.client.get(url, {'cursor': cursor, 'fragment': 1})
+        self.assertEqual([task.name for task in response.context['tasks']],
+                         ['Task 0', 'Task 2'])
+        Task.objects.filter(name='Task 2').update(executor=self.user)
+        response = self.client.get(url, {'executor': self.executor.pk})
+        self.assertTemplateUsed(response, 'tasks/board_column.html')
+        self.assertEqual([task.name for task in response.context['tasks']],
+                         ['Task 0', 'Task 4'])
+
+    def test_unknown_column_returns_404(self):
+        response = self.client.get(reverse('tasks_board_column', args=[0]))
+        self.assertEqual(response.status_code, 404)
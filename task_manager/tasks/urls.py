@@ -3,8 +3,21 @@ from django.urls import path
 from task_manager.tasks import views
 
 urlpatterns = [
-    path('', views.TaskListView.as_view(), name='tasks_index'),
+    path('', views.AsyncTaskListView.as_view(), name='tasks_index'),
+    path('board/', views.AsyncTaskBoardView.as_view(), name='tasks_board'),
+    path(
+        'board/<int:status_id>/',
+        views.AsyncTaskBoardColumnView.as_view(),
+        name='tasks_board_column'
+    ),
     path('create/', views.TaskCreateView.as_view(), name='tasks_create'),
+    path('bulk/', views.TaskBulkActionView.as_view(), name='tasks_bulk'),
+    path('import/', views.TaskImportView.as_view(), name='tasks_import'),
+    path(
+        'export/<str:export_format>/',
+        views.TaskExportView.as_view(),
+        name='tasks_export'
+    ),
     path(
         '<int:pk>/update/',
         views.TaskUpdateView.as_view(),
@@ -15,5 +28,5 @@ urlpatterns = [
         views.TaskDeleteView.as_view(),
         name='tasks_delete'
     ),
-    path('<int:pk>/', views.TaskDetailView.as_view(), name='tasks_detail'),
+    path('<int:pk>/', views.AsyncTaskDetailView.as_view(), name='tasks_detail'),
 ]
@@ -1,29 +1,76 @@
-from typing import Any, Dict, Type
+import io
+from typing import Any, Dict, List, Optional, Tuple, Type
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect
-from django.urls import reverse_lazy
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import QuerySet
+from django.http import (Http404,
+                         HttpRequest,
+                         HttpResponse,
+                         StreamingHttpResponse)
+from django.shortcuts import (aget_object_or_404,
+                              get_object_or_404,
+                              redirect)
+from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
+from django.views.generic import FormView, View
 from django_filters.views import FilterView
 
-from task_manager.base_views import (BaseListView,
+from task_manager.base_views import (AsyncDetailMixin,
+                                     AsyncListMixin,
+                                     AsyncUserMixin,
+                                     BaseListView,
                                      BaseCreateView,
                                      BaseUpdateView,
                                      BaseDetailView,
                                      BaseDeleteView)
+from task_manager.labels.models import Label
+from task_manager.mixins import (CursorPaginationMixin,
+                                 ListFragmentCacheMixin)
+from task_manager.statuses.models import Status
+from task_manager.tasks.board import BOARD_PAGE_SIZE, BoardColumn, TaskBoard
+from task_manager.tasks.export import (EXPORT_FORMATS,
+                                       aiter_stream,
+                                       iter_task_rows)
 from task_manager.tasks.filters import TaskFilterForm
-from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.forms import (TaskBulkActionForm,
+                                      TaskForm,
+                                      TaskImportForm)
+from task_manager.tasks.importer import (IMPORT_ENCODING,
+                                         TaskImporter,
+                                         read_rows)
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import get_search_ordering
 
+User = get_user_model()
 
-class TaskListView(FilterView, BaseListView):
-    """Представление для отображения списка задач с фильтрацией."""
 
-    template_name = 'tasks/list.html'
+class TaskFilterMixin:
+    """
+    Отбор задач формой TaskFilterForm для списка и доски задач.
+
+    Задачи загружаются вместе со статусом, автором и исполнителем и
+    сортируются по дате создания, а при поиске - по релевантности.
+    """
+
     model = Task
     filterset_class = TaskFilterForm
-    context_object_name = 'tasks'
+    # В задачах выводятся статусы и имена пользователей, а фильтры зависят
+    # от меток и текущего пользователя (self_tasks)
+    conditional_models = (Task, Status, User, Label)
+    cursor_ordering: Tuple[str, ...] = ('created_at', 'id')
+
+    def get_queryset(self) -> QuerySet[Task]:
+        """
+        Возвращает задачи вместе со статусом, автором и исполнителем.
+
+        Returns:
+            QuerySet[Task]: QuerySet задач с присоединенными связями.
+        """
+        return Task.objects.with_related()
 
     def get_filterset_kwargs(
         self, filterset_class: Type[TaskFilterForm]
@@ -41,6 +88,408 @@ class TaskListView(FilterView, BaseListView):
         kwargs['request'] = self.request
         return kwargs
 
+    def get_cursor_ordering(self, queryset: QuerySet) -> Tuple[str, ...]:
+        """
+        Сортирует результаты поиска по релевантности, остальные - по дате.
+
+        Args:
+            queryset: Отфильтрованный QuerySet задач.
+
+        Returns:
+            Tuple[str, ...]: Поля ключа сортировки.
+        """
+        return get_search_ordering(queryset, self.cursor_ordering)
+
+
+class AsyncTaskFilterMixin(AsyncUserMixin):
+    """
+    Проверка фильтров задач в асинхронных представлениях.
+
+    Проверка формы загружает выбранные статусы, пользователей и метки,
+    поэтому выполняется в потоке. Фильтр self_tasks использует
+    пользователя, загруженного AsyncUserMixin.
+    """
+
+    async def afilter_tasks(self) -> None:
+        """Задает self.filterset и self.object_list так же, как FilterView.get."""
+        self.filterset = self.get_filterset(self.get_filterset_class())
+        if self.filterset.is_bound:
+            await sync_to_async(self.filterset.is_valid)()
+        # Форма уже проверена, повторный is_valid() не обращается к базе
+        if (not self.filterset.is_bound or self.filterset.is_valid()
+                or not self.get_strict()):
+            self.object_list = self.filterset.qs
+        else:
+            self.object_list = self.filterset.queryset.none()
+
+
+class TaskListView(TaskFilterMixin,
+                   ListFragmentCacheMixin,
+                   CursorPaginationMixin,
+                   FilterView,
+                   BaseListView):
+    """Представление для отображения списка задач с фильтрацией."""
+
+    template_name = 'tasks/list.html'
+    fragment_template_name = 'tasks/table.html'
+    cache_dependencies = (
+        'tasks.Task', 'statuses.Status', 'users.User', 'labels.Label'
+    )
+    cache_per_user = True
+    context_object_name = 'tasks'
+    paginate_by = 50
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Добавляет форму массовых операций над задачами.
+
+        Args:
+            **kwargs: Дополнительные аргументы контекста.
+
+        Returns:
+            Dict[str, Any]: Словарь контекста с данными для шаблона.
+        """
+        context = super().get_context_data(**kwargs)
+        context['bulk_form'] = TaskBulkActionForm()
+        return context
+
+
+class AsyncTaskListView(AsyncTaskFilterMixin, AsyncListMixin, TaskListView):
+    """
+    Список задач для ASGI.
+
+    Проверка фильтров выполняется в потоке, страница задач загружается
+    асинхронным ORM.
+    """
+
+    async def get(self, request: HttpRequest, *args: Any,
+                  **kwargs: Any) -> HttpResponse:
+        """
+        Применяет фильтры и возвращает страницу списка задач.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Страница списка задач.
+        """
+        await self.afilter_tasks()
+        if self.get_cached_fragment() is None:
+            await self.apaginate_queryset(
+                self.object_list, self.get_paginate_by(self.object_list)
+            )
+        context = self.get_context_data(filter=self.filterset,
+                                        object_list=self.object_list)
+        return self.render_to_response(context)
+
+
+class TaskBoardView(TaskFilterMixin, FilterView, BaseListView):
+    """
+    Доска задач с колонками по статусам.
+
+    Первые страницы всех колонок загружаются одним запросом с оконной
+    функцией (см. TaskBoard), следующие - по запросу из колонки
+    (TaskBoardColumnView). Фильтры TaskFilterForm действуют на все
+    колонки.
+    """
+
+    template_name = 'tasks/board.html'
+    board_page_size = BOARD_PAGE_SIZE
+    # Колонки, заранее загруженные асинхронным представлением
+    columns: Optional[List[BoardColumn]] = None
+
+    def get_board(self) -> TaskBoard:
+        """
+        Создает доску по отфильтрованным задачам.
+
+        Returns:
+            TaskBoard: Доска с ключом сортировки списка задач.
+        """
+        return TaskBoard(self.object_list, self.board_page_size,
+                         self.get_cursor_ordering(self.object_list))
+
+    @staticmethod
+    def get_statuses() -> QuerySet[Status]:
+        """Статусы в порядке колонок."""
+        return Status.objects.order_by('pk')
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Добавляет колонки доски 'columns'.
+
+        Args:
+            **kwargs: Дополнительные аргументы контекста.
+
+        Returns:
+            Dict[str, Any]: Словарь контекста с данными для шаблона.
+        """
+        if self.columns is None:
+            self.columns = self.get_board().load(self.get_statuses())
+        context = super().get_context_data(**kwargs)
+        context['columns'] = self.columns
+        return context
+
+
+class AsyncTaskBoardView(AsyncTaskFilterMixin, TaskBoardView):
+    """Доска задач, загружаемая асинхронным ORM."""
+
+    async def get(self, request: HttpRequest, *args: Any,
+                  **kwargs: Any) -> HttpResponse:
+        """
+        Применяет фильтры и возвращает доску.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Страница доски.
+        """
+        await self.afilter_tasks()
+        self.columns = await self.get_board().aload(self.get_statuses())
+        context = self.get_context_data(filter=self.filterset,
+                                        object_list=self.object_list)
+        return self.render_to_response(context)
+
+
+class TaskBoardColumnView(TaskFilterMixin,
+                          CursorPaginationMixin,
+                          FilterView,
+                          BaseListView):
+    """
+    Следующая страница задач колонки доски.
+
+    С параметром fragment возвращает только карточки и ссылку на
+    следующую страницу: скрипт доски вставляет их в колонку. Без него
+    колонка открывается отдельной страницей.
+    """
+
+    template_name = 'tasks/board_column.html'
+    fragment_template_name = 'tasks/board_cards.html'
+    context_object_name = 'tasks'
+    paginate_by = BOARD_PAGE_SIZE
+    # Статус, заранее загруженный асинхронным представлением
+    status: Optional[Status] = None
+
+    def get_queryset(self) -> QuerySet[Task]:
+        """
+        Возвращает задачи статуса колонки.
+
+        Returns:
+            QuerySet[Task]: QuerySet задач со статусом из URL.
+        """
+        return super().get_queryset().filter(
+            status_id=self.kwargs['status_id']
+        )
+
+    def get_template_names(self) -> List[str]:
+        """
+        Выбирает шаблон страницы или фрагмента.
+
+        Returns:
+            List[str]: Имя шаблона.
+        """
+        if 'fragment' in self.request.GET:
+            return [self.fragment_template_name]
+        return [self.template_name]
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Добавляет статус колонки.
+
+        Args:
+            **kwargs: Дополнительные аргументы контекста.
+
+        Returns:
+            Dict[str, Any]: Словарь контекста с данными для шаблона.
+
+        Raises:
+            Http404: Если статус не найден.
+        """
+        if self.status is None:
+            self.status = get_object_or_404(Status,
+                                            pk=self.kwargs['status_id'])
+        context = super().get_context_data(**kwargs)
+        context['status'] = self.status
+        return context
+
+
+class AsyncTaskBoardColumnView(AsyncTaskFilterMixin, TaskBoardColumnView):
+    """Страница колонки доски, загружаемая асинхронным ORM."""
+
+    async def get(self, request: HttpRequest, *args: Any,
+                  **kwargs: Any) -> HttpResponse:
+        """
+        Возвращает страницу задач колонки.
+
+        Args:
+            request: HTTP запрос.
+            *args: Позиционные аргументы URL.
+            **kwargs: Именованные аргументы URL.
+
+        Returns:
+            HttpResponse: Карточки колонки.
+
+        Raises:
+            Http404: Если статус не найден.
+        """
+        self.status = await aget_object_or_404(Status,
+                                               pk=kwargs['status_id'])
+        await self.afilter_tasks()
+        await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        context = self.get_context_data(filter=self.filterset,
+                                        object_list=self.object_list)
+        return self.render_to_response(context)
+
+
+class TaskBulkActionView(LoginRequiredMixin, FormView):
+    """
+    Представление для массовых операций над задачами.
+
+    Принимает идентификаторы задач или применяет действие ко всем задачам,
+    отобранным TaskFilterForm по параметрам строки запроса.
+    """
+
+    form_class = TaskBulkActionForm
+    http_method_names = ['post']
+
+    def get_success_url(self) -> str:
+        """
+        Возвращает адрес списка задач с текущими параметрами фильтра.
+
+        Returns:
+            str: URL списка задач.
+        """
+        query = self.request.GET.urlencode()
+        url = reverse('tasks_index')
+        return f'{url}?{query}' if query else url
+
+    def form_valid(self, form: TaskBulkActionForm) -> HttpResponse:
+        """
+        Применяет действие и сообщает о результате.
+
+        Args:
+            form: Валидная форма массовой операции.
+
+        Returns:
+            HttpResponse: Редирект на список задач.
+        """
+        queryset = None
+        if form.cleaned_data['apply_to_filtered']:
+            queryset = TaskFilterForm(self.request.GET,
+                                      request=self.request).strict_qs
+        result = form.apply(queryset)
+        messages.success(self.request, _(
+            'Tasks updated: %(count)d'
+        ) % {'count': len(result.updated)})
+        if result.failed:
+            messages.error(self.request, _(
+                'Tasks not processed: %(ids)s'
+            ) % {'ids': ', '.join(
+                f'{pk} ({reason})' for pk, reason in result.failed.items()
+            )})
+        return redirect(self.get_success_url())
+
+    def form_invalid(self, form: TaskBulkActionForm) -> HttpResponse:
+        """
+        Показывает ошибки формы и возвращает на список задач.
+
+        Args:
+            form: Невалидная форма массовой операции.
+
+        Returns:
+            HttpResponse: Редирект на список задач.
+        """
+        for errors in form.errors.values():
+            for error in errors:
+                messages.error(self.request, error)
+        return redirect(self.get_success_url())
+
+
+class TaskExportView(LoginRequiredMixin, View):
+    """
+    Представление для потоковой выгрузки отфильтрованных задач.
+
+    Поддерживает форматы из EXPORT_FORMATS (CSV и JSON Lines). Фильтры
+    передаются теми же GET-параметрами, что и в списке задач. Под ASGI
+    ответ получает асинхронный поток (aiter_stream).
+    """
+
+    def get(
+        self, request: HttpRequest, export_format: str
+    ) -> StreamingHttpResponse:
+        """
+        Отдает задачи в выбранном формате, не загружая их в память целиком.
+
+        Args:
+            request: HTTP запрос от клиента.
+            export_format: Формат выгрузки ('csv' или 'jsonl').
+
+        Returns:
+            StreamingHttpResponse: Потоковый ответ с файлом выгрузки.
+
+        Raises:
+            Http404: Если формат не поддерживается.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        stream, content_type = EXPORT_FORMATS[export_format]
+        queryset = TaskFilterForm(request.GET, request=request).strict_qs
+        content = stream(iter_task_rows(queryset))
+        if isinstance(request, ASGIRequest):
+            # Иначе ASGI-обработчик соберет всю выгрузку в памяти
+            content = aiter_stream(content)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+
+class TaskImportView(LoginRequiredMixin, FormView):
+    """Представление для импорта задач из загруженного файла."""
+
+    template_name = 'tasks/import.html'
+    form_class = TaskImportForm
+    success_url = reverse_lazy('tasks_index')
+    # Количество отклоненных строк, показываемых в сообщении
+    rejected_preview = 20
+
+    def form_valid(self, form: TaskImportForm) -> HttpResponse:
+        """
+        Импортирует задачи; автором строк без автора становится пользователь.
+
+        Args:
+            form: Валидная форма с загруженным файлом.
+
+        Returns:
+            HttpResponse: Редирект на список задач.
+        """
+        stream = io.TextIOWrapper(form.cleaned_data['file'].file,
+                                  encoding=IMPORT_ENCODING,
+                                  newline='')
+        importer = TaskImporter(default_author=self.request.user)
+        result = importer.import_rows(read_rows(stream, form.import_format))
+        messages.success(self.request, _(
+            'Tasks imported: %(count)d (%(speed)d rows/s)'
+        ) % {'count': result.tasks, 'speed': result.rows_per_second})
+        if result.rejected:
+            messages.error(self.request, _(
+                'Rows rejected: %(count)d. %(rows)s'
+            ) % {
+                'count': len(result.rejected),
+                'rows': '; '.join(
+                    f'{line}: {reason}'
+                    for line, reason in result.rejected[:self.rejected_preview]
+                ),
+            })
+        return super().form_valid(form)
+
 
 class TaskCreateView(BaseCreateView):
     """Представление для создания новой задачи."""
@@ -78,6 +527,22 @@ class TaskDetailView(BaseDetailView):
     pk_url_kwarg = 'pk'
     context_object_name = 'task'
     form_class = TaskForm
+    conditional_models = (Task, Status, User, Label)
+
+    def get_queryset(self) -> QuerySet[Task]:
+        """
+        Возвращает задачи со связями и метками для детальной страницы.
+
+        Returns:
+            QuerySet[Task]: QuerySet задач с присоединенными связями.
+        """
+        return Task.objects.with_related().prefetch_related('labels')
+
+
+class AsyncTaskDetailView(AsyncDetailMixin, TaskDetailView):
+    """Детальная страница задачи, загружаемой асинхронным ORM."""
+
+    pass
 
 
 class TaskUpdateView(BaseUpdateView):
@@ -118,7 +583,7 @@ class TaskDeleteView(BaseDeleteView):
                 или результат родительского метода.
         """
         task = self.get_object()
-        if task.author != request.user:
+        if task.author_id != request.user.pk:
             messages.error(request, _('Only the author can delete the task'))
             return redirect(self.success_url)
         return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,62 @@
+import unittest
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.autocomplete import (AUTOCOMPLETE_SOURCES,
+                                       AutocompleteSource,
+                                       get_prefix_index_name,
+                                       search_prefix)
+from task_manager.tasks.forms import TaskForm
+from task_manager.users.models import User
+
+
+class AutocompleteTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='password123'
+        )
+
+    @unittest.skipUnless(connection.vendor == 'sqlite',
+                         'EXPLAIN QUERY PLAN is SQLite syntax')
+    def test_prefix_queries_read_indexes_in_order(self):
+        for source in AUTOCOMPLETE_SOURCES.values():
+            table = source.model._meta.db_table
+            for field in source.fields:
+                with CaptureQueriesContext(connection) as context:
+                    search_prefix(
+                        AutocompleteSource(source.model_label, (field,)), 'a'
+                    )
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'EXPLAIN QUERY PLAN {context[0]["sql"]}'
+                    )
+                    plan = ' '.join(row[-1] for row in cursor.fetchall())
+                self.assertIn(get_prefix_index_name(table, field), plan)
+                self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_prefix_indexes_exist_after_migrating(self):
+        for source in AUTOCOMPLETE_SOURCES.values():
+            table = source.model._meta.db_table
+            with connection.cursor() as cursor:
+                indexes = connection.introspection.get_constraints(cursor,
+                                                                   table)
+            declared = {index.name for index in source.model._meta.indexes}
+            for field in source.fields:
+                self.assertIn(get_prefix_index_name(table, field), indexes)
+                self.assertIn(get_prefix_index_name(table, field), declared)
+
+    @override_settings(CHOICES_INLINE_LIMIT=1)
+    def test_large_lists_render_search_widgets(self):
+        html = str(TaskForm(initial={'executor': self.user.pk}))
+        self.assertIn(
+            'data-autocomplete-url="'
+            f'{reverse("api_autocomplete", args=["users"])}"',
+            html
+        )
+        self.assertIn('>testuser</option>', html)
+        self.assertNotIn('data-autocomplete-url="/api/autocomplete/labels/',
+                         html)
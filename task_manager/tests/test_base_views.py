@@ -0,0 +1,166 @@
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='password123'
+        )
+        self.client.force_login(self.user)
+        self.status = Status.objects.create(name='New')
+        self.task = Task.objects.create(
+            name='Task', description='', status=self.status, author=self.user
+        )
+
+    def revalidate(self, url, response, **params):
+        return self.client.get(
+            url, params, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+    def test_unchanged_list_returns_304_before_rendering(self):
+        url = reverse('statuses_index')
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+        with CaptureQueriesContext(connection) as context:
+            second = self.revalidate(url, response)
+        self.assertEqual(second.status_code, 304)
+        self.assertFalse(second.templates)
+        self.assertFalse(any(
+            query['sql'].startswith('SELECT "statuses_status"."id"')
+            for query in context
+        ))
+
+    def test_update_create_and_delete_change_etag(self):
+        url = reverse('statuses_index')
+        for change in (
+            lambda: Status.objects.filter(pk=self.status.pk).update(
+                name='Renamed', updated_at=timezone.now()
+            ),
+            lambda: Status.objects.create(name='Done'),
+            lambda: Status.objects.filter(name='Done').delete(),
+        ):
+            response = self.client.get(url)
+            change()
+            self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_related_change_invalidates_task_pages(self):
+        for url in (reverse('tasks_index'),
+                    reverse('tasks_detail', args=[self.task.pk])):
+            response = self.client.get(url)
+            self.status.name = f'Renamed {url}'
+            self.status.save()
+            self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_etag_depends_on_query_and_user(self):
+        url = reverse('tasks_index')
+        response = self.client.get(url)
+        self.assertEqual(
+            self.revalidate(url, response, self_tasks='on').status_code, 200
+        )
+        other = User.objects.create_user(username='other', password='pass')
+        response = self.client.get(url)
+        self.client.force_login(other)
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_new_csrf_token_changes_etag(self):
+        url = reverse('statuses_index')
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        # Вход заново меняет секрет CSRF, старые формы получили бы 403
+        self.client.post(reverse('logout'))
+        self.client.post(reverse('login'), {'username': 'testuser',
+                                            'password': 'password123'})
+        # Сообщения о выходе и входе отключили бы 304 сами по себе
+        self.client.get(reverse('index'))
+        second = self.revalidate(url, response)
+        self.assertEqual(second.status_code, 200)
+        self.assertContains(second, 'csrfmiddlewaretoken')
+
+    def test_missing_csrf_cookie_is_set_again(self):
+        url = reverse('statuses_index')
+        response = self.client.get(url)
+        del self.client.cookies[settings.CSRF_COOKIE_NAME]
+        second = self.revalidate(url, response)
+        self.assertEqual(second.status_code, 200)
+        self.assertIn(settings.CSRF_COOKIE_NAME, second.cookies)
+
+    def test_pending_messages_disable_304(self):
+        url = reverse('statuses_index')
+        other = User.objects.create_user(username='other', password='pass')
+        task = Task.objects.create(
+            name='Other', description='', status=self.status, author=other
+        )
+        response = self.client.get(url)
+        # Чужую задачу удалить нельзя: остается сообщение об ошибке
+        self.client.post(reverse('tasks_delete', args=[task.pk]))
+        second = self.revalidate(url, response)
+        self.assertEqual(second.status_code, 200)
+        self.assertNotIn('ETag', second)
+
+
+class AsyncReadViewsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='password123'
+        )
+        self.status = Status.objects.create(name='New')
+        self.task = Task.objects.create(
+            name='Task', description='', status=self.status, author=self.user
+        )
+
+    def test_read_pages_use_async_views(self):
+        for url in (reverse('tasks_index'),
+                    reverse('tasks_detail', args=[self.task.pk]),
+                    reverse('statuses_index'),
+                    reverse('labels_index'),
+                    reverse('users_index')):
+            view_class = resolve(url).func.view_class
+            self.assertTrue(view_class.view_is_async, url)
+
+    async def test_anonymous_user_is_redirected_to_login(self):
+        response = await self.async_client.get(reverse('tasks_index'))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith(reverse('login')))
+
+    async def test_pages_render_under_asgi(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse('tasks_index'), {'status': self.status.pk}
+        )
+        self.assertContains(response, 'Task')
+        self.assertEqual(list(response.context['tasks']), [self.task])
+        response = await self.async_client.get(
+            reverse('tasks_detail', args=[self.task.pk])
+        )
+        self.assertContains(response, 'Task')
+        response = await self.async_client.get(reverse('users_index'))
+        self.assertContains(response, 'testuser')
+
+    async def test_missing_task_returns_404(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse('tasks_detail', args=[self.task.pk + 1])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_unchanged_page_returns_304(self):
+        await self.async_client.aforce_login(self.user)
+        url = reverse('tasks_index')
+        response = await self.async_client.get(url)
+        second = await self.async_client.get(
+            url, headers={'If-None-Match': response['ETag']}
+        )
+        self.assertEqual(second.status_code, 304)
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import get_resolver, resolve
+
+from task_manager.benchmarks import compare_reports, iter_url_patterns, seed_data
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class BenchmarkDbPoolCommandTest(TransactionTestCase):
+    def test_reports_each_variant_and_restores_settings(self):
+        User.objects.create_user(username='testuser', password='pass')
+        before = dict(connection.settings_dict)
+        out = StringIO()
+        call_command('benchmark_db_pool', '--requests', '4',
+                     '--threads', '2', stdout=out)
+        output = out.getvalue()
+        self.assertRegex(output, r'new connection per request +[\d.]+ req/s')
+        self.assertRegex(output, r'persistent connections +[\d.]+ req/s')
+        self.assertIn('connection pool              skipped', output)
+        self.assertEqual(connection.settings_dict, before)
+
+
+class BenchmarkAsyncViewsCommandTest(TransactionTestCase):
+    def test_reports_sync_and_async_views(self):
+        User.objects.create_user(username='testuser', password='pass')
+        out = StringIO()
+        call_command('benchmark_async_views', '--url', '/statuses/',
+                     '--requests', '4', '--concurrency', '2', stdout=out)
+        output = out.getvalue()
+        self.assertRegex(output, r'sync views +[\d.]+ req/s p95 +[\d.]+ms')
+        self.assertRegex(output, r'async views +[\d.]+ req/s p95 +[\d.]+ms')
+        self.assertTrue(resolve('/statuses/').func.view_class.view_is_async)
+
+
+class BenchmarkEndpointsCommandTest(TransactionTestCase):
+    # Без токена /metrics вне режима DEBUG отвечает 404
+    @override_settings(METRICS_TOKEN='benchmark')
+    def test_every_url_is_measured_with_both_clients(self):
+        seed_data(30)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'result.json')
+            call_command('benchmark_endpoints', current_db=True, repeat=1,
+                         output=output, stdout=StringIO())
+            with open(output) as stream:
+                report = json.load(stream)
+        measured = {(result['client'], result['endpoint'])
+                    for result in report['results']}
+        for pattern in iter_url_patterns(get_resolver().url_patterns):
+            for client in ('wsgi', 'asgi'):
+                self.assertIn((client, pattern.name), measured)
+        for result in report['results']:
+            self.assertLess(max(result['statuses']), 400, result)
+        self.assertEqual(report['tasks'], 30)
+        # Изменяющие запросы откатываются
+        self.assertEqual(Task.objects.count(), 30)
+
+    def test_compare_reports_flags_regressions(self):
+        def report(p95, queries):
+            return {'results': [{
+                'client': 'wsgi', 'method': 'GET', 'endpoint': 'tasks_index',
+                'latency_ms': {'p95': p95}, 'queries': queries,
+            }]}
+
+        self.assertFalse(
+            compare_reports(report(10, 5), report(11, 5), 0.2)[0][-1]
+        )
+        self.assertTrue(
+            compare_reports(report(10, 5), report(13, 5), 0.2)[0][-1]
+        )
+        self.assertTrue(
+            compare_reports(report(10, 5), report(10, 6), 0.2)[0][-1]
+        )
@@ -0,0 +1,100 @@
+
+from django.db import connection
+from django.http import QueryDict
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.cache import get_versions, make_fragment_key
+from task_manager.choices import get_choices_key, load_choices
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class ListFragmentCacheTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='password123'
+        )
+        self.client.force_login(self.user)
+        self.status = Status.objects.create(name='First status')
+        # Варианты фильтров кэшируются отдельно от таблицы
+        for model in (Status, User, Label):
+            load_choices(model, get_choices_key(model))
+
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(context), response
+
+    def test_cached_list_skips_object_query(self):
+        for url in (reverse('statuses_index'), reverse('tasks_index')):
+            first, first_response = self.count_queries(url)
+            second, second_response = self.count_queries(url)
+            self.assertEqual(second, first - 1)
+            self.assertEqual(
+                second_response.context['list_fragment'],
+                first_response.context['list_fragment']
+            )
+
+    def test_save_invalidates_list(self):
+        url = reverse('statuses_index')
+        self.client.get(url)
+        self.status.name = 'Renamed status'
+        self.status.save()
+        response = self.client.get(url)
+        self.assertContains(response, 'Renamed status')
+        self.assertNotContains(response, 'First status')
+
+    def test_delete_invalidates_list(self):
+        url = reverse('statuses_index')
+        self.client.get(url)
+        self.status.delete()
+        self.assertNotContains(self.client.get(url), 'First status')
+
+    def test_related_model_change_invalidates_task_list(self):
+        Task.objects.create(
+            name='Task', description='', status=self.status, author=self.user
+        )
+        url = reverse('tasks_index')
+        self.assertContains(self.client.get(url), 'First status')
+        self.status.name = 'Renamed status'
+        self.status.save()
+        self.assertContains(self.client.get(url), 'Renamed status')
+
+    def test_m2m_change_invalidates_task_list(self):
+        task = Task.objects.create(
+            name='Task', description='', status=self.status, author=self.user
+        )
+        label = Label.objects.create(name='Label')
+        url = reverse('tasks_index')
+        params = {'labels': label.pk}
+        task_url = reverse('tasks_detail', args=[task.pk])
+        self.assertNotContains(self.client.get(url, params), task_url)
+        task.labels.add(label)
+        self.assertContains(self.client.get(url, params), task_url)
+
+    def test_login_does_not_invalidate_user_list(self):
+        versions = get_versions(['users.User'])
+        self.client.login(username='testuser', password='password123')
+        self.assertEqual(get_versions(['users.User']), versions)
+
+    def test_lists_are_cached_per_language(self):
+        url = reverse('statuses_index')
+        response_ru = self.client.get(url, HTTP_ACCEPT_LANGUAGE='ru')
+        response_en = self.client.get(url, HTTP_ACCEPT_LANGUAGE='en')
+        self.assertContains(response_ru, 'Изменить')
+        self.assertContains(response_en, 'Update')
+
+    def test_escaped_params_do_not_share_key(self):
+        keys = {
+            make_fragment_key('tasks/table.html', ['tasks.Task'],
+                              QueryDict(query), 'en')
+            for query in ('search=a%26self_tasks%3Don',
+                          'search=a&self_tasks=on')
+        }
+        self.assertEqual(len(keys), 2)
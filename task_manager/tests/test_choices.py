@@ -0,0 +1,62 @@
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.choices import get_choices_key
+from task_manager.statuses.models import Status
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class CachedChoicesTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            first_name='Test',
+            last_name='User',
+            username='testuser',
+            password='password123'
+        )
+        self.client.force_login(self.user)
+        self.status = Status.objects.create(name='New')
+
+    def render_form(self, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            html = str(TaskForm(**kwargs))
+        return html, len(context)
+
+    def test_rendering_form_reads_choices_from_cache(self):
+        html, _queries = self.render_form()
+        self.assertIn('Test User', html)
+        self.assertEqual(self.render_form(), (html, 0))
+
+    def test_saving_object_refreshes_choices(self):
+        self.render_form()
+        self.status.name = 'Renamed'
+        self.status.save()
+        html, queries = self.render_form()
+        self.assertIn('Renamed', html)
+        self.assertEqual(queries, 1)
+
+    def test_counter_updates_keep_choices(self):
+        keys = [get_choices_key(model) for model in (Status, User)]
+        Task.objects.create(name='Task', description='', status=self.status,
+                            author=self.user, executor=self.user)
+        self.assertEqual(
+            [get_choices_key(model) for model in (Status, User)], keys
+        )
+
+    @override_settings(CHOICES_INLINE_LIMIT=2)
+    def test_large_choice_lists_are_loaded_by_api(self):
+        other = Status.objects.create(name='Other')
+        html, _queries = self.render_form(initial={'status': other.pk})
+        self.assertIn(
+            f'data-choices-url="{reverse("api_choices", args=["statuses"])}"',
+            html
+        )
+        self.assertIn('>Other</option>', html)
+        self.assertNotIn('>New</option>', html)
+        # Пустой вариант и единственный пользователь выводятся целиком
+        self.assertIn('>Test User</option>', html)
@@ -0,0 +1,72 @@
+import dataclasses
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import translation
+
+from task_manager.context_processors import get_navbar_items, navbar
+from task_manager.users.models import User
+
+
+class NavbarContextProcessorTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='password123'
+        )
+        self.factory = RequestFactory()
+
+    def make_request(self, user):
+        request = self.factory.get('/')
+        request.user = user
+        return request
+
+    def test_items_are_built_once_per_language_and_auth_state(self):
+        with translation.override('en'):
+            first = navbar(self.make_request(self.user))
+            second = navbar(self.make_request(self.user))
+        self.assertIs(first['navbar_items'], second['navbar_items'])
+        self.assertIsNot(
+            first['navbar_items'], get_navbar_items('en', False)
+        )
+
+    def test_items_are_translated_for_language(self):
+        labels_en = [item.label for item in get_navbar_items('en', True)]
+        labels_ru = [item.label for item in get_navbar_items('ru', True)]
+        self.assertIn('Tasks', labels_en)
+        self.assertIn('Задачи', labels_ru)
+
+    def test_shared_items_are_immutable(self):
+        item = get_navbar_items('en', True)[0]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            item.label = 'Changed'
+
+    def test_benchmark_command_reports_both_variants(self):
+        out = StringIO()
+        call_command('benchmark_navbar', '--renders', '2', stdout=out)
+        for label in ('per request  user', 'cached       anonymous'):
+            self.assertIn(label, out.getvalue())
+
+    def test_greeting_for_authenticated_user(self):
+        with translation.override('en'):
+            context = navbar(self.make_request(self.user))
+        self.assertEqual(context['navbar_greeting'], 'Welcome, testuser')
+
+    def test_anonymous_user_has_no_greeting(self):
+        with translation.override('en'):
+            context = navbar(self.make_request(AnonymousUser()))
+        self.assertIsNone(context['navbar_greeting'])
+        urls = [item.url for item in context['navbar_items']]
+        self.assertIn('/login/', urls)
+
+    def test_rendered_navbar_keeps_greeting_and_logout_per_user(self):
+        other = User.objects.create_user(username='other', password='123')
+        for user in (self.user, other):
+            self.client.force_login(user)
+            response = self.client.get(reverse('index'))
+            self.assertContains(response, user.username)
+            self.assertContains(response, 'action="/logout/"')
+            self.assertContains(response, 'href="/tasks/"')
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+
+from task_manager.database import (POSTGRESQL_ENGINE,
+                                   configure_pool,
+                                   get_pool_options,
+                                   is_pool_available)
+
+
+class DatabasePoolSettingsTest(TestCase):
+    def test_pool_size_is_split_between_workers(self):
+        options = get_pool_options(workers=4, max_connections=20, timeout=5)
+        self.assertEqual(options['max_size'], 5)
+        self.assertEqual(options['min_size'], 2)
+        self.assertEqual(options['timeout'], 5)
+        self.assertEqual(get_pool_options(30, 20, 5)['max_size'], 1)
+        self.assertEqual(get_pool_options(30, 20, 5)['min_size'], 1)
+
+    @patch('task_manager.database.is_pool_available', return_value=True)
+    def test_pool_replaces_persistent_connections(self, _available):
+        database = configure_pool(
+            {'ENGINE': POSTGRESQL_ENGINE, 'CONN_MAX_AGE': 600,
+             'CONN_HEALTH_CHECKS': True},
+            {'max_size': 5},
+        )
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        self.assertEqual(database['OPTIONS']['pool'], {'max_size': 5})
+
+    @patch('task_manager.database.is_pool_available', return_value=False)
+    def test_pool_without_driver_support_is_rejected(self, _available):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'DB_POOL'):
+            configure_pool(
+                {'ENGINE': POSTGRESQL_ENGINE, 'CONN_MAX_AGE': 600}, {}
+            )
+        database = configure_pool(
+            {'ENGINE': POSTGRESQL_ENGINE, 'CONN_MAX_AGE': 600}, None
+        )
+        self.assertEqual(database['CONN_MAX_AGE'], 600)
+
+    def test_declared_driver_supports_pool(self):
+        self.assertTrue(is_pool_available())
+
+    def test_other_databases_are_not_pooled(self):
+        database = configure_pool(
+            {'ENGINE': 'django.db.backends.sqlite3', 'CONN_MAX_AGE': 600},
+            {'max_size': 5},
+        )
+        self.assertNotIn('OPTIONS', database)
@@ -0,0 +1,28 @@
+import copy
+import unittest
+
+from django.db import connection
+from django.test import TransactionTestCase
+
+from task_manager.labels.models import Label
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite',
+                     'Only SQLite recreates tables on ALTER')
+class PrefixIndexRemakeTest(TransactionTestCase):
+    def test_table_remake_keeps_prefix_indexes(self):
+        old_field = Label._meta.get_field('name')
+        new_field = copy.deepcopy(old_field)
+        new_field.max_length += 1
+        with connection.schema_editor() as editor:
+            editor.alter_field(Label, old_field, new_field)
+        try:
+            with connection.cursor() as cursor:
+                indexes = connection.introspection.get_constraints(
+                    cursor, Label._meta.db_table
+                )
+        finally:
+            with connection.schema_editor() as editor:
+                editor.alter_field(Label, new_field, old_field)
+        for index in Label._meta.indexes:
+            self.assertIn(index.name, indexes)
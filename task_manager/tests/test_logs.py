@@ -0,0 +1,109 @@
+import json
+import logging
+import sys
+import threading
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.test import TestCase
+
+from task_manager.logs import JsonFormatter, QueueListenerHandler, SamplingFilter
+
+
+class BlockingHandler(logging.Handler):
+    """Обработчик, который запоминает записи и может задержать первую."""
+
+    def __init__(self, block=False):
+        super().__init__()
+        self.records = []
+        self.started = threading.Event()
+        self.unblock = threading.Event()
+        if not block:
+            self.unblock.set()
+
+    def emit(self, record):
+        self.started.set()
+        self.unblock.wait(5)
+        self.records.append(record)
+
+
+class LoggingPipelineTest(TestCase):
+    def make_record(self, name='app', level=logging.INFO, msg='hello %s',
+                    args=('world',), **extra):
+        record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+        record.__dict__.update(extra)
+        return record
+
+    def test_json_formatter_outputs_extra_and_exception(self):
+        try:
+            raise ValueError('broken')
+        except ValueError:
+            record = self.make_record(request_id=7, user=AnonymousUser())
+            record.exc_info = sys.exc_info()
+        data = json.loads(JsonFormatter().format(record))
+        self.assertEqual(data['message'], 'hello world')
+        self.assertEqual(data['level'], 'INFO')
+        self.assertEqual(data['request_id'], 7)
+        self.assertEqual(data['user'], 'AnonymousUser')
+        self.assertIn('ValueError: broken', data['exception'])
+
+    def test_sampling_keeps_every_nth_record_of_noisy_logger(self):
+        sampling = SamplingFilter({'django.db.backends': 0.25})
+        kept = [sampling.filter(self.make_record(
+            name='django.db.backends.schema', level=logging.DEBUG
+        )) for _n in range(8)]
+        self.assertEqual(kept, [True, False, False, False] * 2)
+        warning = self.make_record(name='django.db.backends',
+                                   level=logging.WARNING)
+        self.assertTrue(sampling.filter(warning))
+        self.assertTrue(sampling.filter(self.make_record(name='django.db')))
+        record = self.make_record(name='django.db.backends')
+        SamplingFilter({'django.db.backends': 0.5}).filter(record)
+        self.assertEqual(record.sample_rate, 0.5)
+
+    def test_queue_handler_writes_in_background(self):
+        target = BlockingHandler()
+        handler = QueueListenerHandler([target])
+        logger = logging.getLogger('task_manager.tests.queue')
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        try:
+            raise ValueError('broken')
+        except ValueError:
+            logger.exception('failed %s', 'task', extra={'task_id': 3})
+        handler.close()
+        record = target.records[0]
+        self.assertEqual(record.getMessage(), 'failed task')
+        self.assertEqual(record.task_id, 3)
+        self.assertIsNone(record.exc_info)
+        self.assertIn('ValueError: broken', record.exc_text)
+
+    def test_full_queue_drops_records_without_blocking(self):
+        target = BlockingHandler(block=True)
+        handler = QueueListenerHandler([target], queue_size=1)
+        handler.handle(self.make_record(msg='first', args=()))
+        self.assertTrue(target.started.wait(5))
+        handler.handle(self.make_record(msg='second', args=()))
+        handler.handle(self.make_record(msg='third', args=()))
+        self.assertEqual(handler.dropped, 1)
+        target.unblock.set()
+        handler.close()
+        self.assertEqual([record.msg for record in target.records],
+                         ['first', 'second'])
+
+    def test_settings_route_root_logger_through_queue(self):
+        handlers = [handler for handler in logging.getLogger().handlers
+                    if isinstance(handler, QueueListenerHandler)]
+        self.assertEqual(len(handlers), 1)
+        targets = handlers[0].listener.handlers
+        self.assertIsInstance(targets[1], logging.handlers.WatchedFileHandler)
+        self.assertIsInstance(targets[1].formatter, JsonFormatter)
+
+    def test_benchmark_command_reports_both_variants(self):
+        out = StringIO()
+        call_command('benchmark_logging', '--requests', '5',
+                     '--queries', '3', stdout=out)
+        output = out.getvalue()
+        self.assertRegex(output, r'file handler +[\d.]+us/request')
+        self.assertRegex(output, r'queue \+ json \+ sampling +[\d.]+us')
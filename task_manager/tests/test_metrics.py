@@ -0,0 +1,124 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import metrics
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class MetricsTest(TestCase):
+    def setUp(self):
+        from prometheus_client import REGISTRY
+        self.registry = REGISTRY
+        self.user = User.objects.create_user(username='testuser',
+                                             password='pass')
+        self.client.force_login(self.user)
+        self.status = Status.objects.create(name='New')
+
+    def get_value(self, name, **labels):
+        return self.registry.get_sample_value(name, labels) or 0
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    def test_request_latency_and_queries_by_url_name(self):
+        before = self.get_value('http_request_duration_seconds_count',
+                                view='statuses_index', method='GET')
+        queries = self.get_value('http_request_db_queries_sum',
+                                 view='statuses_index')
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse('statuses_index'))
+        self.assertEqual(
+            self.get_value('http_request_duration_seconds_count',
+                           view='statuses_index', method='GET'),
+            before + 1
+        )
+        self.assertEqual(
+            self.get_value('http_request_db_queries_sum',
+                           view='statuses_index'),
+            queries + len(context)
+        )
+
+    def test_fragment_cache_hits_and_misses(self):
+        fragment = 'statuses/table.html'
+        hits = self.get_value('list_fragment_cache_requests_total',
+                              fragment=fragment, result='hit')
+        misses = self.get_value('list_fragment_cache_requests_total',
+                                fragment=fragment, result='miss')
+        self.client.get(reverse('statuses_index'))
+        self.client.get(reverse('statuses_index'))
+        self.assertEqual(
+            self.get_value('list_fragment_cache_requests_total',
+                           fragment=fragment, result='miss'),
+            misses + 1
+        )
+        self.assertEqual(
+            self.get_value('list_fragment_cache_requests_total',
+                           fragment=fragment, result='hit'),
+            hits + 1
+        )
+
+    def test_protected_delete_rejections(self):
+        Task.objects.create(
+            name='Task', description='', status=self.status, author=self.user
+        )
+        before = self.get_value('protected_delete_rejections_total',
+                                model='statuses.Status')
+        self.client.post(reverse('statuses_delete', args=[self.status.pk]))
+        self.assertEqual(
+            self.get_value('protected_delete_rejections_total',
+                           model='statuses.Status'),
+            before + 1
+        )
+
+    @override_settings(DEBUG=True)
+    def test_endpoint_exports_metrics(self):
+        self.client.get(reverse('statuses_index'))
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertContains(
+            response,
+            'http_request_duration_seconds_count'
+            '{method="GET",view="statuses_index"}'
+        )
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_endpoint_requires_token(self):
+        self.client.logout()
+        url = reverse('metrics')
+        self.assertEqual(self.client.get(url).status_code, 403)
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    def test_endpoint_without_token_is_hidden_outside_debug(self):
+        url = reverse('metrics')
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_workers_are_aggregated(self):
+        script = (
+            'import django; django.setup(); '
+            'from task_manager import metrics; '
+            'metrics.observe_protected_delete("labels.Label")'
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, DJANGO_SETTINGS_MODULE='task_manager.settings',
+                       SECRET_KEY='test', PROMETHEUS_MULTIPROC_DIR=directory)
+            for _worker in range(2):
+                subprocess.run([sys.executable, '-c', script], env=env,
+                               check=True)
+            with patch.dict(os.environ, PROMETHEUS_MULTIPROC_DIR=directory):
+                body, _content_type = metrics.render_metrics()
+        self.assertIn(
+            b'protected_delete_rejections_total{model="labels.Label"} 2.0',
+            body
+        )
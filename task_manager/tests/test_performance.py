@@ -0,0 +1,100 @@
+import logging
+import os
+import subprocess
+import sys
+
+from asgiref.sync import iscoroutinefunction
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.performance import PerformanceMiddleware
+from task_manager.statuses.models import Status
+from task_manager.users.models import User
+
+
+@override_settings(PERF_TIMING_HEADER=True)
+class PerformanceMiddlewareTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser',
+                                             password='pass')
+        Status.objects.create(name='New')
+
+    def get_metrics(self, response):
+        return dict(
+            metric.strip().split(';', 1) if ';' in metric else (metric, '')
+            for metric in response['Server-Timing'].split(',')
+        )
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    def test_sampled_request_reports_queries_templates_and_view(self):
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as context, \
+                self.assertLogs('task_manager.performance', 'INFO') as logs:
+            response = self.client.get(reverse('statuses_index'))
+        metrics = self.get_metrics(response)
+        self.assertEqual(set(metrics), {'total', 'db', 'tpl', 'view'})
+        self.assertIn(f'desc="{len(context)} queries"', metrics['db'])
+        self.assertGreater(float(metrics['tpl'].split('=')[1]), 0)
+        self.assertEqual(metrics['view'], 'desc="statuses_index"')
+        record = logs.records[0]
+        self.assertEqual(record.levelno, logging.INFO)
+        self.assertEqual(record.view, 'statuses_index')
+        self.assertEqual(record.queries, len(context))
+        self.assertEqual(record.status, 200)
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    async def test_async_view_queries_are_counted(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('tasks_index'))
+        metrics = self.get_metrics(response)
+        self.assertNotIn('desc="0 queries"', metrics['db'])
+        self.assertEqual(metrics['view'], 'desc="tasks_index"')
+
+    @override_settings(PERF_SAMPLE_RATE=0.0)
+    def test_unsampled_request_reports_only_total(self):
+        with self.assertNoLogs('task_manager.performance'):
+            response = self.client.get(reverse('users_index'))
+        self.assertEqual(set(self.get_metrics(response)), {'total', 'view'})
+
+    @override_settings(PERF_SAMPLE_RATE=0.0, PERF_SLOW_REQUEST_MS=0)
+    def test_slow_request_is_logged_as_warning(self):
+        with self.assertLogs('task_manager.performance', 'WARNING') as logs:
+            self.client.get(reverse('users_index'))
+        self.assertEqual(logs.records[0].view, 'users_index')
+        self.assertFalse(hasattr(logs.records[0], 'queries'))
+
+    @override_settings(PERF_TIMING_HEADER=False)
+    def test_header_can_be_disabled(self):
+        response = self.client.get(reverse('users_index'))
+        self.assertNotIn('Server-Timing', response)
+
+    def test_header_defaults_to_debug(self):
+        script = ('import django; django.setup(); '
+                  'from django.conf import settings; '
+                  'print(settings.PERF_TIMING_HEADER)')
+        env = {key: value for key, value in os.environ.items()
+               if key != 'PERF_TIMING_HEADER'}
+        env.update(DJANGO_SETTINGS_MODULE='task_manager.settings',
+                   SECRET_KEY='test')
+        for debug in ('True', 'False'):
+            output = subprocess.run(
+                [sys.executable, '-c', script], env={**env, 'DEBUG': debug},
+                check=True, capture_output=True, text=True,
+            ).stdout
+            self.assertEqual(output.strip(), debug)
+
+    async def test_async_chain_stays_async(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = PerformanceMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        request = RequestFactory().get('/')
+        response = await middleware(request)
+        self.assertIn('total;dur=', response['Server-Timing'])
+        self.assertFalse(iscoroutinefunction(
+            PerformanceMiddleware(lambda request: HttpResponse())
+        ))
@@ -0,0 +1,138 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.http import HttpResponseServerError
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from task_manager import rollbar_middleware
+from task_manager.rollbar_middleware import DROP_NEWEST, DROP_OLDEST, RollbarQueue
+from task_manager.users.models import User
+
+
+class StubRollbarHandler(BaseHTTPRequestHandler):
+    """Медленный API Rollbar: запоминает отчеты и порт клиента."""
+
+    protocol_version = 'HTTP/1.1'
+    delay = 0.5
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(self.delay)
+        self.server.received.append((self.client_address[1],
+                                     json.loads(body)))
+        answer = b'{"err": 0}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(answer)))
+        self.end_headers()
+        self.wfile.write(answer)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RollbarQueueTest(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                          StubRollbarHandler)
+        self.server.received = []
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.endpoint = f'http://127.0.0.1:{self.server.server_port}/api/1/'
+
+    @staticmethod
+    def fill(reporter, count):
+        with patch.object(RollbarQueue, 'ensure_worker'):
+            return [reporter.put({'data': {'n': n}}) for n in range(count)]
+
+    def test_drop_newest_keeps_queued_reports(self):
+        reporter = RollbarQueue(maxsize=2, drop_policy=DROP_NEWEST)
+        self.assertEqual(self.fill(reporter, 3), [True, True, False])
+        self.assertEqual(reporter.dropped, 1)
+        self.assertEqual([reporter.queue.get_nowait()['data']['n']
+                          for _n in range(2)], [0, 1])
+
+    def test_drop_oldest_keeps_latest_reports(self):
+        reporter = RollbarQueue(maxsize=2, drop_policy=DROP_OLDEST)
+        self.assertEqual(self.fill(reporter, 3), [True, True, True])
+        self.assertEqual(reporter.dropped, 1)
+        self.assertEqual([reporter.queue.get_nowait()['data']['n']
+                          for _n in range(2)], [1, 2])
+
+    def test_unknown_drop_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RollbarQueue(drop_policy='random')
+
+    def test_batch_is_sent_over_one_connection(self):
+        StubRollbarHandler.delay = 0.01
+        self.addCleanup(setattr, StubRollbarHandler, 'delay', 0.5)
+        reporter = RollbarQueue(batch_size=10)
+        with patch.dict('rollbar.SETTINGS', {'endpoint': self.endpoint,
+                                             'access_token': 'token'}):
+            for n in range(5):
+                reporter.put({'data': {'n': n}})
+            self.assertTrue(reporter.flush(5))
+        self.assertEqual(reporter.sent, 5)
+        self.assertEqual(sorted(item['data']['n']
+                                for _port, item in self.server.received),
+                         list(range(5)))
+        self.assertEqual(len({port for port, _item
+                              in self.server.received}), 1)
+
+    @override_settings(ROLLBAR={
+        'access_token': 'token',
+        'environment': 'test',
+        'patch_debugview': False,
+        'suppress_reinit_warning': True,
+    })
+    def test_slow_rollbar_does_not_delay_response(self):
+        user = User.objects.create_user(username='testuser',
+                                        first_name='Test', last_name='User',
+                                        password='pass')
+        self.client.force_login(user)
+        self.client.raise_request_exception = False
+        with patch.dict('rollbar.SETTINGS', {'endpoint': self.endpoint}), \
+                patch('task_manager.views.render', side_effect=[
+                    RuntimeError('boom'), HttpResponseServerError(),
+                ]):
+            started = time.perf_counter()
+            response = self.client.get(reverse('index'))
+            elapsed = time.perf_counter() - started
+            self.assertEqual(response.status_code, 500)
+            self.assertLess(elapsed, StubRollbarHandler.delay)
+            self.assertTrue(rollbar_middleware.reporter.flush(5))
+        self.assertEqual(len(self.server.received), 1)
+        _port, item = self.server.received[0]
+        self.assertEqual(item['data']['person']['full_name'], 'Test User')
+
+    @override_settings(ROLLBAR={
+        'access_token': 'token',
+        'environment': 'test',
+        'patch_debugview': False,
+        'suppress_reinit_warning': True,
+    })
+    @override_settings(ROLLBAR={
+        'access_token': 'token',
+        'environment': 'test',
+        'patch_debugview': False,
+        'suppress_reinit_warning': True,
+    })
+    def test_reporter_is_installed_once_per_process(self):
+        first = rollbar_middleware.install_reporter()
+        with patch('atexit.register') as register:
+            # Каждый клиент заново создает цепочку middleware
+            for _client in range(3):
+                Client().get(reverse('index'))
+            self.assertIs(rollbar_middleware.install_reporter(), first)
+        self.assertIs(rollbar_middleware.reporter, first)
+        register.assert_not_called()
+        handlers = rollbar_middleware.events._event_handlers[
+            rollbar_middleware.events.PAYLOAD
+        ]
+        self.assertEqual(handlers.count(first.handle_payload), 1)
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 19:49
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_date_joined(apps, schema_editor):
+    # Существующие записи считаются не изменявшимися после создания
+    apps.get_model('users', 'User').objects.update(updated_at=F('date_joined'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(copy_date_joined, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:36
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_tasks(apps, schema_editor):
+    counts = (apps.get_model('tasks', 'Task').objects.order_by()
+              .filter(executor=OuterRef('pk'))
+              .values('executor').annotate(count=Count('pk'))
+              .values('count'))
+    apps.get_model('users', 'User').objects.update(
+        assigned_task_count=Coalesce(Subquery(counts), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_search'),
+        ('users', '0002_user_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='assigned_task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Assigned tasks'),
+        ),
+        migrations.RunPython(count_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:12
+
+import task_manager.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_assigned_task_count'),
+    ]
+
+    operations = [
+        # Поиск по началу имени для /api/autocomplete/users/:
+        # PostgreSQL - varchar_pattern_ops, SQLite - COLLATE NOCASE
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(field='username', name='users_user_username_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(field='first_name', name='users_user_first_name_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(field='last_name', name='users_user_last_name_prefix'),
+        ),
+    ]
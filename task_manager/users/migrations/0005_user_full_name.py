@@ -0,0 +1,52 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:40
+
+import task_manager.indexes
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def build_full_name(first_name, last_name, username):
+    full_name = ' '.join(part for part in (first_name, last_name) if part)
+    return full_name.strip() or username
+
+
+def fill_full_name(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    users = User.objects.only('first_name', 'last_name', 'username')
+    batch = []
+    for user in users.iterator(chunk_size=BATCH_SIZE):
+        user.full_name = build_full_name(user.first_name, user.last_name,
+                                         user.username)
+        batch.append(user)
+        if len(batch) == BATCH_SIZE:
+            User.objects.bulk_update(batch, ['full_name'])
+            batch = []
+    User.objects.bulk_update(batch, ['full_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=301, verbose_name='Full name'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_full_name, migrations.RunPython.noop),
+        # Поиск по началу полного имени для /api/autocomplete/users/.
+        # Полное имя начинается с имени, отдельный индекс больше не нужен
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(field='full_name', name='users_user_full_name_prefix'),
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_user_first_name_prefix',
+        ),
+    ]
@@ -1,25 +1,102 @@
+from typing import Any
+
 from django.contrib.auth.models import AbstractUser
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.indexes import PrefixIndex
+
+# Поля, из которых строится full_name
+FULL_NAME_SOURCE_FIELDS = frozenset({'first_name', 'last_name', 'username'})
+
+
+def build_full_name(first_name: str, last_name: str, username: str) -> str:
+    """
+    Строит полное имя пользователя.
+
+    Объединяет имя и фамилию пользователя. Если одно из полей пустое,
+    возвращает только заполненное поле. Если оба поля пустые,
+    возвращает username.
+
+    Args:
+        first_name: Имя.
+        last_name: Фамилия.
+        username: Имя пользователя.
+
+    Returns:
+        str: Полное имя пользователя или username, если имя и фамилия
+            пустые.
+    """
+    parts = [first_name, last_name]
+    full_name = ' '.join(part for part in parts if part).strip()
+    return full_name or username
 
 
 class User(AbstractUser):
     """Модель пользователя проекта."""
 
+    updated_at = models.DateTimeField(auto_now=True)
+    # Число задач, где пользователь исполнитель, обновляется сигналами
+    # задач (см. tasks.counters)
+    assigned_task_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_('Assigned tasks')
+    )
+    # Отображаемое имя, пересчитывается в save(). Списки выбирают только
+    # этот столбец пользователя, индекс нужен для сортировки и поиска
+    full_name = models.CharField(
+        max_length=301, editable=False, db_index=True,
+        verbose_name=_('Full name')
+    )
+
+    class Meta(AbstractUser.Meta):
+        """Метаданные модели."""
+
+        indexes = [
+            # Поиск по началу имени для /api/autocomplete/users/; full_name
+            # начинается с имени, а если его нет - с фамилии
+            PrefixIndex(field='username', name='users_user_username_prefix'),
+            PrefixIndex(field='full_name', name='users_user_full_name_prefix'),
+            PrefixIndex(field='last_name', name='users_user_last_name_prefix'),
+        ]
+
     def __str__(self):
         """Возвращает строковое представление пользователя."""
         return self.get_full_name()
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Сохраняет пользователя, пересчитывая full_name.
+
+        Если save() вызван с update_fields, full_name пересчитывается и
+        сохраняется, только когда среди них есть имя, фамилия или
+        username (например, не при обновлении last_login).
+
+        Args:
+            *args: Позиционные аргументы Model.save().
+            **kwargs: Именованные аргументы Model.save().
+        """
+        update_fields = kwargs.get('update_fields')
+        if (update_fields is None
+                or FULL_NAME_SOURCE_FIELDS & set(update_fields)):
+            self.full_name = build_full_name(self.first_name, self.last_name,
+                                             self.username)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
+
     def get_full_name(self) -> str:
         """
         Возвращает полное имя пользователя.
 
-        Объединяет имя и фамилию пользователя. Если одно из полей пустое,
-        возвращает только заполненное поле. Если оба поля пустые,
-        возвращает username.
+        Читает сохраненный столбец full_name без обращения к имени и
+        фамилии, поэтому работает и для пользователей, загруженных
+        с only('full_name'). Для еще не сохраненного пользователя имя
+        строится build_full_name().
 
         Returns:
             str: Полное имя пользователя или username, если имя и фамилия
                 пустые.
         """
-        parts = [self.first_name, self.last_name]
-        full_name = ' '.join(part for part in parts if part).strip()
-        return full_name or self.username
+        return self.full_name or build_full_name(
+            self.first_name, self.last_name, self.username
+        )
@@ -2,6 +2,8 @@ from django.test import Client
 from django.test.testcases import TestCase
 from django.urls import reverse
 
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
 from task_manager.users.models import User
 
 
@@ -223,3 +225,72 @@ class UserLogoutTest(BaseTestCase):
         response = self.client.post(reverse('logout'))
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse('index'))
+
+
+class UserDeleteQueryCountTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('users_delete', kwargs={'pk': self.user.pk})
+
+    def test_get_loads_user_once(self):
+        # Сессия, текущий пользователь и удаляемый пользователь
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_in_use_is_rejected_by_single_query(self):
+        status = Status.objects.create(name='Test status')
+        Task.objects.create(name='Task', description='', status=status,
+                            author=self.user)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
+        self.assertRedirects(response, reverse('users_index'),
+                             fetch_redirect_response=False)
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_post_executor_in_use_is_rejected(self):
+        author = User.objects.create_user(username='author', password='123')
+        status = Status.objects.create(name='Test status')
+        Task.objects.create(name='Task', description='', status=status,
+                            author=author, executor=self.user)
+        self.client.post(self.url)
+        self.assertTrue(User.objects.filter(pk=self.user.pk).exists())
+
+
+class UserFullNameTest(BaseTestCase):
+    def test_full_name_is_stored_on_create(self):
+        self.assertEqual(
+            User.objects.values_list('full_name', flat=True)
+            .get(pk=self.user.pk),
+            'Test User'
+        )
+
+    def test_full_name_falls_back_to_username(self):
+        user = User.objects.create_user(username='nameless', password='123')
+        user.refresh_from_db()
+        self.assertEqual(user.full_name, 'nameless')
+
+    def test_full_name_follows_name_changes(self):
+        self.user.last_name = 'Renamed'
+        self.user.save(update_fields=['last_name'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.full_name, 'Test Renamed')
+
+    def test_unrelated_update_fields_skip_full_name(self):
+        User.objects.filter(pk=self.user.pk).update(full_name='Stale')
+        self.user.save(update_fields=['last_login'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.full_name, 'Stale')
+
+    def test_task_list_loads_only_full_name_of_users(self):
+        status = Status.objects.create(name='Test status')
+        Task.objects.create(name='Task', description='', status=status,
+                            author=self.user, executor=self.user)
+        task = Task.objects.with_related().get()
+        sql = str(Task.objects.with_related().query)
+        self.assertIn('full_name', sql)
+        self.assertNotIn('first_name', sql)
+        self.assertNotIn('password', sql)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(task.author), 'Test User')
+            self.assertEqual(str(task.executor), 'Test User')
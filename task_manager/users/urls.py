@@ -3,7 +3,7 @@ from django.urls import path
 from task_manager.users import views
 
 urlpatterns = [
-    path('', views.UserListView.as_view(), name='users_index'),
+    path('', views.AsyncUserListView.as_view(), name='users_index'),
     path('create/', views.UserCreateView.as_view(), name='users_create'),
     path(
         '<int:pk>/update/',
@@ -5,20 +5,34 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, ListView
 
-from task_manager.base_views import BaseUpdateView, BaseDeleteView
-from task_manager.mixins import AuthAndProfileOwnershipMixin
+from task_manager.base_views import (AsyncListMixin,
+                                     BaseUpdateView,
+                                     BaseDeleteView)
+from task_manager.mixins import (AuthAndProfileOwnershipMixin,
+                                 ListFragmentCacheMixin)
 from task_manager.users.forms import UserForm
 from task_manager.users.models import User
 
 
-class UserListView(ListView):
+class UserListView(ListFragmentCacheMixin, ListView):
     """Представление для отображения списка пользователей."""
 
     template_name = 'users/list.html'
+    fragment_template_name = 'users/table.html'
     model = User
+    # Только столбцы таблицы, без пароля и отдельных имени и фамилии
+    queryset = User.objects.only(
+        'username', 'full_name', 'assigned_task_count', 'date_joined'
+    )
     context_object_name = 'users'
 
 
+class AsyncUserListView(AsyncListMixin, UserListView):
+    """Список пользователей, загружаемый асинхронным ORM."""
+
+    pass
+
+
 class UserCreateView(SuccessMessageMixin, CreateView):
     """Представление для регистрации нового пользователя."""
 
@@ -64,4 +78,5 @@ class UserDeleteView(AuthAndProfileOwnershipMixin, BaseDeleteView):
     success_url = reverse_lazy('users_index')
     success_message = _('User successfully deleted')
     protected_error_message = _('Cannot delete user because it is in use')
+    protected_relations = ('author', 'executor')
     delete_title = _('Deleting a user')
@@ -1,13 +1,18 @@
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import logout
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse
+from django.http import HttpResponseForbidden
 from django.shortcuts import render, redirect
+from django.utils.crypto import constant_time_compare
 from django.utils.translation import gettext_lazy as _
 
+from task_manager import metrics
+
 if TYPE_CHECKING:
     pass
 
@@ -56,6 +61,35 @@ class LogoutUserView(LogoutView):
         return redirect('index')
 
 
+def metrics_export(request: HttpRequest) -> HttpResponse:
+    """
+    Отдает метрики приложения в текстовом формате Prometheus.
+
+    Если задан METRICS_TOKEN, запрос должен содержать заголовок
+    'Authorization: Bearer <METRICS_TOKEN>'. Без токена эндпоинт открыт
+    только в режиме DEBUG.
+
+    Args:
+        request: HTTP запрос от клиента.
+
+    Returns:
+        HttpResponse: Метрики всех воркеров или ответ 403 при неверном
+            токене.
+
+    Raises:
+        Http404: Если токен не задан вне режима DEBUG.
+    """
+    token = settings.METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        raise Http404('METRICS_TOKEN is not set')
+    if token and not constant_time_compare(
+        request.headers.get('Authorization', ''), f'Bearer {token}'
+    ):
+        return HttpResponseForbidden()
+    body, content_type = metrics.render_metrics()
+    return HttpResponse(body, content_type=content_type)
+
+
 def handler404(request: HttpRequest, exception: Exception) -> HttpResponse:
     """
     Обработчик ошибки 404 (страница не найдена).